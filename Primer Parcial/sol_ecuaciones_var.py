@@ -1,7 +1,17 @@
 import math
+import warnings
 import sympy as sp
 import numpy as np
 
+# np.exceptions existe desde NumPy 1.25
+ComplexWarning = getattr(np, "exceptions", np).ComplexWarning
+
+# Funciones que impiden usar paso complejo (no analíticas)
+FUNCIONES_NO_ANALITICAS = (
+    sp.Abs, sp.sign, sp.Piecewise, sp.Heaviside, sp.Min, sp.Max,
+    sp.floor, sp.ceiling, sp.re, sp.im, sp.conjugate, sp.arg,
+)
+
 class SolEcuaciones:
     """Clase para resolver ecuaciones de una variable"""
     
@@ -21,6 +31,8 @@ class SolEcuaciones:
         self.tolerancia = tolerancia
         self.funcion_str = ""
         self.funcion = None
+        self.funcion_np = None
+        self.complejo_seguro = False
         self.x = sp.symbols('x')
     
     def set_funcion(self, funcion_str):
@@ -31,6 +43,14 @@ class SolEcuaciones:
             self.funcion = sp.sympify(funcion_str)
         except:
             raise ValueError(f"Función inválida: {funcion_str}")
+        
+        # Versión vectorizada (acepta arreglos y complejos)
+        self.funcion_np = sp.lambdify(self.x, self.funcion, "numpy")
+        self.complejo_seguro = not self.funcion.has(
+            *FUNCIONES_NO_ANALITICAS,
+            sp.core.relational.Relational,
+            sp.logic.boolalg.BooleanFunction
+        )
     
     def evaluar(self, x):
         """Evaluar la función en un punto x"""
@@ -42,8 +62,39 @@ class SolEcuaciones:
         # Evaluar numéricamente
         return float(expr.evalf())
     
-    def derivada_numerica(self, x, h=1e-6):
-        """Calcular derivada numérica"""
+    def derivada_numerica(self, x, h=None, modo="central"):
+        """
+        Calcular derivada numérica
+        
+        Args:
+            x: punto o arreglo de puntos
+            h: paso (por defecto 1e-6 centrada, 1e-20 compleja)
+            modo: 'central' o 'compleja' (paso complejo: Im[f(x+ih)]/h).
+                  Si la función no es analítica (abs, comparaciones...)
+                  'compleja' regresa a diferencia central.
+        """
+        if self.funcion is None:
+            raise ValueError("No se ha establecido la función")
+        
+        if modo == "compleja" and self.complejo_seguro:
+            xs = np.asarray(x, dtype=float)
+            # gamma, erf... pasan por math y descartan la parte imaginaria
+            # (solo avisan con ComplexWarning): en ese caso, diferencia central
+            with warnings.catch_warnings():
+                warnings.simplefilter("error", ComplexWarning)
+                try:
+                    paso = 1e-20 if h is None else h
+                    d = np.broadcast_to(np.imag(self.funcion_np(xs + 1j * paso)) / paso, xs.shape)
+                    return float(d) if d.ndim == 0 else d
+                except (ComplexWarning, TypeError):
+                    h = None   # el paso dado era para paso complejo
+        
+        h = 1e-6 if h is None else h
+        if np.ndim(x) > 0:
+            xs = np.asarray(x, dtype=float)
+            return np.broadcast_to(
+                (self.funcion_np(xs + h) - self.funcion_np(xs - h)) / (2 * h), xs.shape
+            )
         return (self.evaluar(x + h) - self.evaluar(x - h)) / (2 * h)
     
     def biseccion(self):
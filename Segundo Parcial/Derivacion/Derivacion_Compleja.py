@@ -0,0 +1,128 @@
+"""
+Derivación por Paso Complejo (Complex-Step)
+
+f'(x) ≈ Im[f(x + i·h)] / h
+
+Para funciones analíticas no hay resta de valores cercanos (no hay
+cancelación), así que h puede ser diminuto (1e-20) y el resultado llega
+a precisión de máquina con UNA sola evaluación.
+Si la expresión no es segura en complejos (abs, comparaciones, Piecewise...)
+se usa automáticamente la diferencia centrada.
+"""
+
+import math
+import warnings
+import numpy as np
+import sympy as sp
+
+# np.exceptions existe desde NumPy 1.25
+ComplexWarning = getattr(np, "exceptions", np).ComplexWarning
+
+# Funciones que rompen la analiticidad (o no aceptan complejos)
+FUNCIONES_NO_SEGURAS = (
+    sp.Abs, sp.sign, sp.Piecewise, sp.Heaviside, sp.Min, sp.Max,
+    sp.floor, sp.ceiling, sp.re, sp.im, sp.conjugate, sp.arg,
+)
+
+H_COMPLEJO = 1e-20
+H_CENTRAL = 1e-6
+
+
+def es_seguro_complejo(expr):
+    """Indica si la expresión puede evaluarse con paso complejo."""
+    if expr.has(*FUNCIONES_NO_SEGURAS):
+        return False
+    # Comparaciones (x > 0, Eq, ...) y lógica booleana
+    if expr.has(sp.core.relational.Relational, sp.logic.boolalg.BooleanFunction):
+        return False
+    return True
+
+
+def derivada_paso_complejo(f, x, h=H_COMPLEJO):
+    """
+    f'(x) = Im[f(x + ih)] / h, vectorizada sobre arreglos de x.
+
+    Algunas funciones (gamma, erf, ...) pasan por math y descartan la parte
+    imaginaria con solo un ComplexWarning (la derivada saldría 0): en ese
+    caso, o si no aceptan complejos, se lanza ValueError.
+    """
+    x = np.asarray(x, dtype=float)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", ComplexWarning)
+        try:
+            valores = f(x + 1j * h)
+        except (ComplexWarning, TypeError) as e:
+            raise ValueError(f"La función no acepta paso complejo: {e}") from e
+    return np.broadcast_to(np.imag(valores) / h, x.shape)
+
+
+def derivada_centrada(f, x, h=H_CENTRAL):
+    """f'(x) ≈ [f(x+h) - f(x-h)] / 2h, vectorizada sobre arreglos de x."""
+    x = np.asarray(x, dtype=float)
+    return np.broadcast_to((f(x + h) - f(x - h)) / (2 * h), x.shape)
+
+
+def crear_derivador(expr, x_sym):
+    """
+    Construye la derivada numérica de una expresión SymPy.
+
+    Retorna (df, modo), donde df acepta escalares o arreglos y
+    modo es 'compleja' o 'centrada' (fallback).
+    """
+    f = sp.lambdify(x_sym, expr, "numpy")
+
+    if es_seguro_complejo(expr):
+        try:
+            derivada_paso_complejo(f, 0.5)   # prueba: ¿f conserva la parte imaginaria?
+        except ValueError:
+            return (lambda x: derivada_centrada(f, x)), "centrada"
+        return (lambda x: _paso_complejo_o_centrada(f, x)), "compleja"
+    return (lambda x: derivada_centrada(f, x)), "centrada"
+
+
+def _paso_complejo_o_centrada(f, x):
+    """Paso complejo; si falla en estos puntos, diferencia centrada."""
+    try:
+        return derivada_paso_complejo(f, x)
+    except ValueError:
+        return derivada_centrada(f, x)
+
+
+def main():
+    print("=== DERIVACIÓN POR PASO COMPLEJO ===")
+
+    f_str = input("Ingrese la función f(x) (ej: exp(x)*sin(x)): ")
+    x_sym = sp.symbols('x')
+    try:
+        expr = sp.sympify(f_str, locals={'e': sp.E})
+        df, modo = crear_derivador(expr, x_sym)
+        df_real = sp.lambdify(x_sym, sp.diff(expr, x_sym), "numpy")
+    except Exception as e:
+        print(f"Error al interpretar la función: {e}")
+        return
+
+    try:
+        puntos_str = input("Puntos a evaluar separados por coma (ej: 0, 0.5, pi): ")
+        X = np.array([float(eval(p, {"pi": math.pi, "e": math.e})) for p in puntos_str.split(",")])
+    except Exception:
+        print("Error: Los valores numéricos no son válidos.")
+        return
+
+    if modo == "centrada":
+        print("\n[AVISO] La función no es segura en complejos (abs, comparaciones, gamma...).")
+        print("        Se usa diferencia centrada como respaldo.")
+
+    D = df(X)
+    R = np.broadcast_to(df_real(X), X.shape)
+
+    col = "f'(x) " + modo
+    print("\n" + "=" * 70)
+    print(f"{'xi':<12} | {col:<22} | {'Real':<15} | {'Err Abs':<10}")
+    print("=" * 70)
+    for xi, di, ri in zip(X, D, R):
+        print(f"{xi:<12.6f} | {di:<22.15f} | {ri:<15.10f} | {abs(ri - di):<10.2e}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+Derivación Espectral
+
+- Datos periódicos, muestreo uniforme (FFT):
+    y = Σ c_k e^{i k x}  ->  y^(m) = Σ (i k)^m c_k e^{i k x}
+- Datos no periódicos en puntos de Chebyshev x_j = cos(πj/N) (DCT):
+    y = Σ a_k T_k(x); la derivada se obtiene con la recurrencia
+    b_{k-1} = b_{k+1} + 2k·a_k sobre los coeficientes.
+
+Ambos aceptan columnas en lote: y de tamaño (N,) o (N, columnas).
+Para funciones suaves el error decae exponencialmente con N, frente a
+O(h^4) de la fórmula de 5 puntos de Derivacion_h.py.
+"""
+
+import math
+import time
+import numpy as np
+import sympy as sp
+
+
+# --- 1. PERIÓDICO (FFT) ---
+def derivada_fft(y, L=2 * np.pi, orden=1):
+    """
+    Derivada de orden 'orden' de datos periódicos uniformes.
+    y: (N,) o (N, columnas), muestras en x_j = x0 + j·L/N (sin repetir el extremo).
+    """
+    y = np.asarray(y, dtype=float)
+    N = y.shape[0]
+    k = 2 * np.pi / L * np.arange(N // 2 + 1)
+
+    factor = (1j * k) ** orden
+    # El modo de Nyquist no tiene pareja: su derivada impar no es real
+    if N % 2 == 0 and orden % 2 == 1:
+        factor[-1] = 0
+
+    Y = np.fft.rfft(y, axis=0)
+    factor = factor.reshape((-1,) + (1,) * (y.ndim - 1))
+    return np.fft.irfft(factor * Y, n=N, axis=0)
+
+
+# --- 2. CHEBYSHEV (DCT-I vía FFT) ---
+def puntos_chebyshev(N, a=-1.0, b=1.0):
+    """Puntos de Chebyshev-Lobatto x_j = cos(πj/N), j = 0..N, mapeados a [a, b]."""
+    x = np.cos(np.pi * np.arange(N + 1) / N)
+    return (a + b) / 2 + (b - a) / 2 * x
+
+
+def valores_a_coeficientes(v):
+    """Valores en puntos de Chebyshev -> coeficientes a_k (por columnas)."""
+    v = np.asarray(v, dtype=float)
+    N = v.shape[0] - 1
+    extendido = np.concatenate([v, v[N - 1:0:-1]], axis=0)
+    a = np.real(np.fft.fft(extendido, axis=0))[:N + 1] / N
+    a[0] /= 2
+    a[N] /= 2
+    return a
+
+
+def coeficientes_a_valores(a):
+    """Coeficientes a_k -> valores en puntos de Chebyshev (por columnas)."""
+    a = np.array(a, dtype=float)
+    N = a.shape[0] - 1
+    a[0] *= 2
+    a[N] *= 2
+    extendido = np.concatenate([a, a[N - 1:0:-1]], axis=0)
+    return np.real(np.fft.fft(extendido, axis=0))[:N + 1] / 2
+
+
+def derivar_coeficientes(a):
+    """
+    Coeficientes de la derivada: b_{k-1} = b_{k+1} + 2k·a_k.
+
+    Desenrollando la recurrencia, b_j = Σ 2k·a_k con k > j y k - j impar,
+    es decir, sumas acumuladas (desde el final) de índices pares e impares.
+    """
+    N = a.shape[0] - 1
+    k = np.arange(N + 1).reshape((-1,) + (1,) * (a.ndim - 1))
+    c = 2 * k * a
+
+    R = np.empty_like(c)
+    R[0::2] = np.cumsum(c[0::2][::-1], axis=0)[::-1]
+    R[1::2] = np.cumsum(c[1::2][::-1], axis=0)[::-1]
+
+    b = np.zeros_like(a)
+    b[:N] = R[1:]
+    b[0] /= 2
+    return b
+
+
+def derivada_chebyshev(y, a=-1.0, b=1.0, orden=1):
+    """
+    Derivada de orden 'orden' de datos muestreados en puntos_chebyshev(N, a, b).
+    y: (N+1,) o (N+1, columnas).
+    """
+    coef = valores_a_coeficientes(y)
+    for _ in range(orden):
+        coef = derivar_coeficientes(coef)
+    return coeficientes_a_valores(coef) * (2 / (b - a)) ** orden
+
+
+# --- 3. COMPARACIÓN CON LAS FÓRMULAS DE DIFERENCIAS ---
+def estencil_5_puntos(Y, h):
+    """Fórmula de 5 puntos de Derivacion_h.py (centrada + bordes), vectorizada."""
+    Y = np.asarray(Y, dtype=float)
+    D = np.empty_like(Y)
+    D[2:-2] = (-Y[4:] + 8 * Y[3:-1] - 8 * Y[1:-3] + Y[:-4]) / (12 * h)
+    for i in (0, 1):
+        D[i] = (-25 * Y[i] + 48 * Y[i + 1] - 36 * Y[i + 2] + 16 * Y[i + 3] - 3 * Y[i + 4]) / (12 * h)
+    for i in (-1, -2):
+        D[i] = (25 * Y[i] - 48 * Y[i - 1] + 36 * Y[i - 2] - 16 * Y[i - 3] + 3 * Y[i - 4]) / (12 * h)
+    return D
+
+
+def comparar_metodos(tamanos=(16, 32, 64, 128, 256), columnas=200, repeticiones=5):
+    """Tabla de exactitud y tiempo: FFT / Chebyshev vs 5 puntos."""
+    print("\n" + "=" * 92)
+    print(" EXACTITUD (f = exp(sin(x)) periódica, g = exp(x)·sin(3x) en [-1, 1]) ")
+    print("=" * 92)
+    print(f"{'N':<6} | {'5 pts (periód.)':<16} | {'FFT':<12} | {'5 pts (Cheb.)':<16} | {'Chebyshev':<12}")
+    print("-" * 92)
+
+    f = lambda x: np.exp(np.sin(x))
+    df = lambda x: np.cos(x) * np.exp(np.sin(x))
+    g = lambda x: np.exp(x) * np.sin(3 * x)
+    dg = lambda x: np.exp(x) * (np.sin(3 * x) + 3 * np.cos(3 * x))
+
+    for N in tamanos:
+        L = 2 * np.pi
+        x = np.arange(N) * L / N
+        e_fft = np.max(np.abs(derivada_fft(f(x), L) - df(x)))
+        e_5p = np.max(np.abs(estencil_5_puntos(f(x), L / N) - df(x)))
+
+        xc = puntos_chebyshev(N)
+        e_cheb = np.max(np.abs(derivada_chebyshev(g(xc)) - dg(xc)))
+        xu = np.linspace(-1, 1, N + 1)
+        e_5u = np.max(np.abs(estencil_5_puntos(g(xu), 2 / N) - dg(xu)))
+
+        print(f"{N:<6} | {e_5p:<16.3e} | {e_fft:<12.3e} | {e_5u:<16.3e} | {e_cheb:<12.3e}")
+
+    print("\n" + "=" * 92)
+    print(f" RENDIMIENTO ({columnas} columnas en lote, mejor de {repeticiones}) ")
+    print("=" * 92)
+    print(f"{'N':<8} | {'5 pts [ms]':<12} | {'FFT [ms]':<12} | {'Chebyshev [ms]':<15} | {'muestras/s (FFT)':<18}")
+    print("-" * 92)
+
+    for N in (256, 1024, 4096):
+        L = 2 * np.pi
+        x = np.arange(N) * L / N
+        Y = f(x[:, None] + np.linspace(0, 1, columnas)[None, :])
+        Yc = g(puntos_chebyshev(N)[:, None] * np.linspace(0.5, 1, columnas)[None, :])
+
+        def mejor(fn):
+            t_min = math.inf
+            for _ in range(repeticiones):
+                t = time.perf_counter()
+                fn()
+                t_min = min(t_min, time.perf_counter() - t)
+            return t_min
+
+        t5 = mejor(lambda: estencil_5_puntos(Y, L / N))
+        tf = mejor(lambda: derivada_fft(Y, L))
+        tc = mejor(lambda: derivada_chebyshev(Yc))
+        print(f"{N:<8} | {t5 * 1e3:<12.3f} | {tf * 1e3:<12.3f} | {tc * 1e3:<15.3f} | {N * columnas / tf:<18.3e}")
+    print("=" * 92)
+
+
+def main():
+    print("=== DERIVACIÓN ESPECTRAL ===")
+    print("  [1] Periódica (FFT, muestreo uniforme)")
+    print("  [2] Chebyshev (intervalo [a, b])")
+    print("  [3] Comparar con fórmulas de 5 puntos (exactitud y tiempo)")
+    modo = input("Elige (1, 2 o 3): ")
+
+    if modo == '3':
+        comparar_metodos()
+        return
+
+    x_sym = sp.symbols('x')
+    f_str = input("Ingrese la función f(x) (ej: exp(sin(x))): ")
+    try:
+        expr = sp.sympify(f_str, locals={'e': sp.E})
+        N = int(input("Número de puntos N: "))
+        orden = int(input("Orden de la derivada: "))
+        constantes = {"pi": math.pi, "e": math.e}
+        if modo == '1':
+            a = float(eval(input("Inicio del periodo x0: "), constantes))
+            L = float(eval(input("Longitud del periodo L (ej: 2*pi): "), constantes))
+        else:
+            a = float(eval(input("Límite inferior a: "), constantes))
+            b = float(eval(input("Límite superior b: "), constantes))
+    except Exception:
+        print("Error: Datos inválidos.")
+        return
+
+    f_num = sp.lambdify(x_sym, expr, "numpy")
+    df_real = sp.lambdify(x_sym, sp.diff(expr, x_sym, orden), "numpy")
+
+    if modo == '1':
+        X = a + np.arange(N) * L / N
+        D = derivada_fft(np.broadcast_to(f_num(X), X.shape), L, orden)
+    else:
+        X = puntos_chebyshev(N, a, b)
+        D = derivada_chebyshev(np.broadcast_to(f_num(X), X.shape), a, b, orden)
+    R = np.broadcast_to(df_real(X), X.shape)
+
+    print("\n" + "=" * 70)
+    print(f"{'i':<4} | {'xi':<12} | {'Espectral':<18} | {'Real':<18} | {'Err Abs':<10}")
+    print("=" * 70)
+    for i, (xi, di, ri) in enumerate(zip(X, D, R)):
+        print(f"{i:<4} | {xi:<12.6f} | {di:<18.12f} | {ri:<18.12f} | {abs(ri - di):<10.2e}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+"""
+Gradiente, Jacobiano y Hessiano de Expresiones Multivariables
+
+Evalúa en MUCHOS puntos a la vez (arreglo de tamaño (puntos, variables))
+y regresa arreglos apilados:
+    gradiente -> (puntos, n)
+    jacobiano -> (puntos, m, n)
+    hessiano  -> (puntos, n, n)
+
+El método se elige según el tamaño de la expresión (sp.count_ops):
+- 'simbolico': derivadas de SymPy compiladas con lambdify (+ cse).
+               Ideal para expresiones pequeñas.
+- 'ad':        diferenciación automática (modo hacia adelante, números
+               duales vectorizados). No crece la expresión simbólica.
+- 'diferencias': diferencias centradas. Respaldo para expresiones enormes
+               o con funciones que el modo 'ad' no soporta.
+"""
+
+import numpy as np
+import sympy as sp
+
+UMBRAL_SIMBOLICO = 150    # operaciones
+UMBRAL_AD = 3000
+
+
+# --- 1. NÚMEROS DUALES (AD modo hacia adelante) ---
+class Dual:
+    """
+    v + ε·d con d de tamaño (n_variables, puntos):
+    una sola evaluación da el gradiente completo en todos los puntos.
+    """
+    __array_priority__ = 1000
+
+    def __init__(self, val, der):
+        self.val = val
+        self.der = der
+
+    @staticmethod
+    def _dual(o, ref):
+        if isinstance(o, Dual):
+            return o
+        return Dual(o, np.zeros_like(ref.der))
+
+    def __add__(self, o):
+        o = Dual._dual(o, self)
+        return Dual(self.val + o.val, self.der + o.der)
+
+    __radd__ = __add__
+
+    def __sub__(self, o):
+        o = Dual._dual(o, self)
+        return Dual(self.val - o.val, self.der - o.der)
+
+    def __rsub__(self, o):
+        return Dual._dual(o, self) - self
+
+    def __mul__(self, o):
+        if not isinstance(o, Dual):
+            return Dual(self.val * o, self.der * o)
+        return Dual(self.val * o.val, self.der * o.val + o.der * self.val)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, o):
+        if not isinstance(o, Dual):
+            return Dual(self.val / o, self.der / o)
+        return Dual(self.val / o.val, (self.der * o.val - o.der * self.val) / o.val ** 2)
+
+    def __rtruediv__(self, o):
+        return Dual._dual(o, self) / self
+
+    def __neg__(self):
+        return Dual(-self.val, -self.der)
+
+    def __pos__(self):
+        return self
+
+    def __pow__(self, o):
+        if isinstance(o, Dual):
+            val = self.val ** o.val
+            return Dual(val, val * (o.der * np.log(self.val) + o.val * self.der / self.val))
+        return Dual(self.val ** o, o * self.val ** (o - 1) * self.der)
+
+    def __rpow__(self, o):
+        val = o ** self.val
+        return Dual(val, val * np.log(o) * self.der)
+
+    def __abs__(self):
+        return Dual(np.abs(self.val), np.sign(self.val) * self.der)
+
+
+def _unaria(f, df):
+    """Extiende una función de NumPy a números duales (regla de la cadena)."""
+    def g(u):
+        if isinstance(u, Dual):
+            return Dual(f(u.val), df(u.val) * u.der)
+        return f(u)
+    return g
+
+
+FUNCIONES_DUAL = {
+    'sin': _unaria(np.sin, np.cos),
+    'cos': _unaria(np.cos, lambda u: -np.sin(u)),
+    'tan': _unaria(np.tan, lambda u: 1 / np.cos(u) ** 2),
+    'exp': _unaria(np.exp, np.exp),
+    'log': _unaria(np.log, lambda u: 1 / u),
+    'sqrt': _unaria(np.sqrt, lambda u: 0.5 / np.sqrt(u)),
+    'sinh': _unaria(np.sinh, np.cosh),
+    'cosh': _unaria(np.cosh, np.sinh),
+    'tanh': _unaria(np.tanh, lambda u: 1 / np.cosh(u) ** 2),
+    'asin': _unaria(np.arcsin, lambda u: 1 / np.sqrt(1 - u ** 2)),
+    'acos': _unaria(np.arccos, lambda u: -1 / np.sqrt(1 - u ** 2)),
+    'atan': _unaria(np.arctan, lambda u: 1 / (1 + u ** 2)),
+    'pi': np.pi, 'E': np.e, 'e': np.e,
+}
+
+# Clases de SymPy que el modo AD sabe derivar
+FUNCIONES_AD = {sp.sin, sp.cos, sp.tan, sp.exp, sp.log, sp.sinh, sp.cosh,
+                sp.tanh, sp.asin, sp.acos, sp.atan, sp.Abs}
+
+
+# --- 2. CLASE PRINCIPAL ---
+class DerivadorMultivariable:
+    """Derivadas de f(x1, ..., xn) (o de un sistema F) en lote."""
+
+    def __init__(self, expresiones, variables, metodo="auto"):
+        if isinstance(expresiones, (str, sp.Basic)):
+            expresiones = [expresiones]
+        if isinstance(variables, str):
+            variables = variables.replace(',', ' ').split()
+
+        # real=True: Abs se deriva como sign (sin términos re/im que lambdify no imprime)
+        self.variables = [sp.Symbol(v, real=True) if isinstance(v, str) else v for v in variables]
+        locales = {v.name: v for v in self.variables}
+        locales['e'] = sp.E
+        self.expresiones = [
+            sp.sympify(e.replace('^', '**').replace('sen', 'sin'), locals=locales) if isinstance(e, str) else e
+            for e in expresiones
+        ]
+        self.n = len(self.variables)
+        self.m = len(self.expresiones)
+
+        self.operaciones = sum(sp.count_ops(e) for e in self.expresiones)
+        self.metodo = self._elegir_metodo() if metodo == "auto" else metodo
+        if self.metodo not in ("simbolico", "ad", "diferencias"):
+            raise ValueError(f"Método desconocido: {self.metodo}")
+
+        self._f = sp.lambdify(self.variables, self.expresiones, "numpy")
+        self._cache = {}
+
+    def _elegir_metodo(self):
+        soporta_ad = all(
+            f.func in FUNCIONES_AD
+            for e in self.expresiones for f in e.atoms(sp.Function)
+        )
+        if self.operaciones <= UMBRAL_SIMBOLICO:
+            return "simbolico"
+        if self.operaciones <= UMBRAL_AD and soporta_ad:
+            return "ad"
+        return "diferencias"
+
+    # --- Utilidades ---
+    def _puntos(self, P):
+        P = np.asarray(P, dtype=float)
+        unico = P.ndim == 1
+        P = np.atleast_2d(P)
+        if P.shape[1] != self.n:
+            raise ValueError(f"Se esperaban {self.n} coordenadas por punto")
+        return P, unico
+
+    def _apilar(self, lista, k):
+        """Lista (posiblemente con escalares) -> arreglo (k, len(lista))."""
+        return np.stack([np.broadcast_to(np.asarray(v, dtype=float), (k,)) for v in lista], axis=1)
+
+    def evaluar(self, P):
+        """F en los puntos: (puntos, m)."""
+        P, unico = self._puntos(P)
+        F = self._apilar(self._f(*P.T), len(P))
+        return F[0] if unico else F
+
+    def _pasos(self, P, potencia):
+        return np.finfo(float).eps ** potencia * np.maximum(1.0, np.abs(P))
+
+    # --- Jacobiano ---
+    def _jacobiano_simbolico(self, P):
+        if 'J' not in self._cache:
+            J = [sp.diff(e, v) for e in self.expresiones for v in self.variables]
+            self._cache['J'] = sp.lambdify(self.variables, J, "numpy", cse=True)
+        k = len(P)
+        return self._apilar(self._cache['J'](*P.T), k).reshape(k, self.m, self.n)
+
+    def _jacobiano_ad(self, P):
+        k = len(P)
+        semillas = [Dual(P[:, i], np.eye(self.n)[:, i:i + 1] * np.ones(k)) for i in range(self.n)]
+        if 'ad' not in self._cache:
+            self._cache['ad'] = sp.lambdify(self.variables, self.expresiones, [FUNCIONES_DUAL])
+        J = np.empty((k, self.m, self.n))
+        for j, Fj in enumerate(self._cache['ad'](*semillas)):
+            if isinstance(Fj, Dual):
+                J[:, j, :] = np.broadcast_to(Fj.der, (self.n, k)).T
+            else:
+                J[:, j, :] = 0.0
+        return J
+
+    def _jacobiano_diferencias(self, P):
+        # Todos los puntos desplazados (±h e_i) en una sola llamada
+        k, n = P.shape
+        H = self._pasos(P, 1 / 3)
+        desplaz = np.einsum('ki,ij->ikj', H, np.eye(n))          # (n, k, n)
+        Q = np.concatenate([P + desplaz, P - desplaz]).reshape(-1, n)
+        F = self._apilar(self._f(*Q.T), len(Q)).reshape(2, n, k, self.m)
+        J = (F[0] - F[1]) / (2 * H.T[:, :, None])                # (n, k, m)
+        return J.transpose(1, 2, 0)
+
+    def jacobiano(self, P):
+        """Jacobiano de F en cada punto: (puntos, m, n)."""
+        P, unico = self._puntos(P)
+        J = getattr(self, f"_jacobiano_{self.metodo}")(P)
+        return J[0] if unico else J
+
+    def gradiente(self, P, indice=0):
+        """Gradiente de la expresión 'indice': (puntos, n)."""
+        J = self.jacobiano(P)
+        return J[..., indice, :]
+
+    # --- Hessiano ---
+    def _hessiano_simbolico(self, P, indice):
+        clave = ('H', indice)
+        if clave not in self._cache:
+            e = self.expresiones[indice]
+            pares = [(i, j) for i in range(self.n) for j in range(i, self.n)]
+            H = [sp.diff(e, self.variables[i], self.variables[j]) for i, j in pares]
+            # d/dx sign = DiracDelta: fuera del pliegue de Abs vale 0 (como en AD)
+            H = [h.replace(sp.DiracDelta, lambda *args: sp.S.Zero) for h in H]
+            self._cache[clave] = (pares, sp.lambdify(self.variables, H, "numpy", cse=True))
+        pares, fH = self._cache[clave]
+        k = len(P)
+        valores = self._apilar(fH(*P.T), k)
+        H = np.empty((k, self.n, self.n))
+        for c, (i, j) in enumerate(pares):
+            H[:, i, j] = H[:, j, i] = valores[:, c]
+        return H
+
+    def _hessiano_ad(self, P, indice):
+        # Diferencias centradas del gradiente exacto (AD)
+        k, n = P.shape
+        H = self._pasos(P, 1 / 3)
+        desplaz = np.einsum('ki,ij->ikj', H, np.eye(n))
+        Q = np.concatenate([P + desplaz, P - desplaz]).reshape(-1, n)
+        G = self._jacobiano_ad(Q)[:, indice, :].reshape(2, n, k, n)
+        D = ((G[0] - G[1]) / (2 * H.T[:, :, None])).transpose(1, 0, 2)   # (k, i, j)
+        return (D + D.transpose(0, 2, 1)) / 2
+
+    def _hessiano_diferencias(self, P, indice):
+        k, n = P.shape
+        H = self._pasos(P, 1 / 4)
+        f = lambda Q: self._apilar(self._f(*Q.T), len(Q))[:, indice]
+        f0 = f(P)
+
+        hess = np.empty((k, n, n))
+        for i in range(n):
+            ei = np.zeros(n); ei[i] = 1
+            hi = H[:, i:i + 1]
+            hess[:, i, i] = (f(P + hi * ei) - 2 * f0 + f(P - hi * ei)) / hi[:, 0] ** 2
+            for j in range(i + 1, n):
+                ej = np.zeros(n); ej[j] = 1
+                hj = H[:, j:j + 1]
+                Q = np.concatenate([P + hi * ei + hj * ej, P + hi * ei - hj * ej,
+                                    P - hi * ei + hj * ej, P - hi * ei - hj * ej])
+                fpp, fpm, fmp, fmm = f(Q).reshape(4, k)
+                hess[:, i, j] = hess[:, j, i] = (fpp - fpm - fmp + fmm) / (4 * hi[:, 0] * hj[:, 0])
+        return hess
+
+    def hessiano(self, P, indice=0):
+        """Hessiano de la expresión 'indice' en cada punto: (puntos, n, n)."""
+        P, unico = self._puntos(P)
+        H = getattr(self, f"_hessiano_{self.metodo}")(P, indice)
+        return H[0] if unico else H
+
+
+def main():
+    print("=== GRADIENTE, JACOBIANO Y HESSIANO ===")
+
+    try:
+        variables = input("Variables separadas por coma (ej: x, y): ")
+        n_ec = int(input("Número de funciones: "))
+        expresiones = [input(f"  f_{i + 1} = ") for i in range(n_ec)]
+        derivador = DerivadorMultivariable(expresiones, variables)
+        print(f"\nMétodo elegido: {derivador.metodo} ({derivador.operaciones} operaciones)")
+
+        n_pts = int(input("\nNúmero de puntos: "))
+        P = np.array([
+            [float(v) for v in input(f"  Punto {i + 1} (coordenadas separadas por coma): ").split(",")]
+            for i in range(n_pts)
+        ])
+        J = derivador.jacobiano(P)
+    except Exception as e:
+        print(f"Error: {e}")
+        return
+
+    nombres = [str(v) for v in derivador.variables]
+    for p, Jp in zip(P, J):
+        print("\n" + "=" * 60)
+        print(f" Punto ({', '.join(f'{c:.4f}' for c in p)})")
+        print("=" * 60)
+        for i, fila in enumerate(Jp):
+            print(f"  ∇f_{i + 1} = [" + ", ".join(f"{v:.8f}" for v in fila) + "]")
+
+    if derivador.m == 1:
+        H = derivador.hessiano(P)
+        for p, Hp in zip(P, H):
+            print(f"\nHessiano en ({', '.join(f'{c:.4f}' for c in p)}):")
+            print(f"  {'':>6}" + "".join(f"{v:>14}" for v in nombres))
+            for v, fila in zip(nombres, Hp):
+                print(f"  {v:>6}" + "".join(f"{h:>14.8f}" for h in fila))
+
+
+if __name__ == "__main__":
+    main()
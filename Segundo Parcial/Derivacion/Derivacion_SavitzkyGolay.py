@@ -0,0 +1,215 @@
+"""
+Derivación de Datos Tabulados con Ruido (Savitzky-Golay en streaming)
+
+Para cada punto se ajusta por mínimos cuadrados un polinomio de grado p
+sobre una ventana de w = 2m + 1 muestras y se deriva ese polinomio.
+
+- Espaciado uniforme: los coeficientes del filtro se precalculan UNA vez
+  (espaciado unitario) y sólo se escalan por 1/h^d.
+- Espaciado no uniforme: se resuelve el ajuste local de cada ventana
+  (en lote con NumPy).
+
+El archivo CSV se lee por bloques; entre bloques sólo se conservan w
+muestras, así que la memoria es constante sin importar el tamaño del archivo.
+"""
+
+import math
+import numpy as np
+import pandas as pd
+
+
+def coeficientes_savgol(ventana, grado):
+    """
+    Coeficientes del filtro para espaciado unitario.
+
+    Retorna C de tamaño (grado+1, ventana): la fila k aplicada a la ventana
+    da el coeficiente a_k del polinomio local centrado, por lo que
+    f^(d)(x_c) ≈ d! · (C[d] · y) / h^d
+    """
+    m = ventana // 2
+    t = np.arange(-m, m + 1, dtype=float)
+    V = np.vander(t, grado + 1, increasing=True)
+    return np.linalg.pinv(V)
+
+
+class DerivadorSavitzkyGolay:
+    """Suavizado y derivada local por bloques (memoria constante)."""
+
+    def __init__(self, ventana=11, grado=3, deriv=1, tol_uniforme=1e-6):
+        if ventana % 2 == 0 or ventana < 3:
+            raise ValueError("La ventana debe ser impar y >= 3")
+        if grado >= ventana:
+            raise ValueError("El grado debe ser menor que la ventana")
+        if deriv < 0 or deriv > grado:
+            raise ValueError("El orden de la derivada debe estar entre 0 y el grado")
+
+        self.ventana = ventana
+        self.grado = grado
+        self.deriv = deriv
+        self.m = ventana // 2
+        self.tol_uniforme = tol_uniforme
+
+        # Filtro precalculado (espaciado unitario)
+        self.C = coeficientes_savgol(ventana, grado)
+        self.offsets = np.arange(-self.m, self.m + 1)
+
+    # --- Núcleo: evaluar un conjunto de ventanas ---
+    def _ajuste_local(self, Xw, Yw, pos):
+        """
+        Ajuste general (no uniforme o bordes) para ventanas apiladas.
+        pos: índice dentro de la ventana donde se evalúa.
+        """
+        x_eval = Xw[np.arange(len(Xw)), pos]
+        escala = (Xw[:, -1] - Xw[:, 0]) / (self.ventana - 1)
+        T = (Xw - x_eval[:, None]) / escala[:, None]
+
+        V = T[:, :, None] ** np.arange(self.grado + 1)          # (k, w, p+1)
+        A = np.einsum('kpw,kw->kp', np.linalg.pinv(V), Yw)       # coeficientes a_k
+
+        # El polinomio se evalúa en t = 0 (punto x_eval)
+        suave = A[:, 0]
+        d = self.deriv
+        derivada = math.factorial(d) * A[:, d] / escala ** d
+        return suave, derivada
+
+    def _evaluar_centros(self, X, Y, centros):
+        """Suavizado y derivada en los índices 'centros' (ventanas simétricas)."""
+        idx = centros[:, None] + self.offsets
+        Xw, Yw = X[idx], Y[idx]
+
+        difs = np.diff(Xw, axis=1)
+        h = (Xw[:, -1] - Xw[:, 0]) / (self.ventana - 1)
+        uniforme = np.all(np.abs(difs - h[:, None]) <= self.tol_uniforme * np.abs(h[:, None]), axis=1)
+
+        suave = np.empty(len(centros))
+        derivada = np.empty(len(centros))
+
+        # Ventanas uniformes: filtro precalculado (un solo producto matriz-vector)
+        if np.any(uniforme):
+            Yu = Yw[uniforme]
+            d = self.deriv
+            suave[uniforme] = Yu @ self.C[0]
+            derivada[uniforme] = math.factorial(d) * (Yu @ self.C[d]) / h[uniforme] ** d
+
+        # Ventanas no uniformes: ajuste local
+        if not np.all(uniforme):
+            nu = ~uniforme
+            pos = np.full(np.count_nonzero(nu), self.m)
+            suave[nu], derivada[nu] = self._ajuste_local(Xw[nu], Yw[nu], pos)
+
+        return suave, derivada
+
+    def _evaluar_borde(self, X, Y, indices, inicio):
+        """Puntos de borde: ventana asimétrica [inicio, inicio + w)."""
+        k = len(indices)
+        Xw = np.broadcast_to(X[inicio:inicio + self.ventana], (k, self.ventana))
+        Yw = np.broadcast_to(Y[inicio:inicio + self.ventana], (k, self.ventana))
+        return self._ajuste_local(Xw, Yw, indices - inicio)
+
+    # --- Streaming ---
+    def procesar(self, bloques):
+        """
+        Procesa un iterable de bloques (x, y) ordenados en x.
+        Genera tuplas (x, y_suavizada, derivada) por bloque.
+        """
+        w, m = self.ventana, self.m
+        buf_x = np.empty(0)
+        buf_y = np.empty(0)
+        inicio_emitido = False
+        desde = m   # primer centro aún no emitido dentro de X
+
+        for xb, yb in bloques:
+            X = np.concatenate([buf_x, np.asarray(xb, dtype=float)])
+            Y = np.concatenate([buf_y, np.asarray(yb, dtype=float)])
+
+            if len(X) < w:
+                buf_x, buf_y = X, Y
+                continue
+
+            if np.any(np.diff(X) <= 0):
+                raise ValueError("Los datos deben estar ordenados con x estrictamente creciente")
+
+            # Primeros m puntos del archivo
+            if not inicio_emitido:
+                idx = np.arange(m)
+                s, d = self._evaluar_borde(X, Y, idx, 0)
+                yield X[idx], s, d
+                inicio_emitido = True
+
+            centros = np.arange(desde, len(X) - m)
+            s, d = self._evaluar_centros(X, Y, centros)
+            yield X[centros], s, d
+
+            # Se conservan w muestras: m + 1 ya emitidas (contexto) + m pendientes
+            buf_x, buf_y = X[-w:], Y[-w:]
+            desde = m + 1
+
+        if not inicio_emitido:
+            if len(buf_x) == 0:
+                return
+            raise ValueError(f"Se requieren al menos {w} datos (hay {len(buf_x)})")
+
+        # Últimos m puntos del archivo
+        n = len(buf_x)
+        idx = np.arange(n - m, n)
+        s, d = self._evaluar_borde(buf_x, buf_y, idx, n - w)
+        yield buf_x[idx], s, d
+
+    def procesar_arreglos(self, x, y, tam_bloque=100_000):
+        """Atajo para datos en memoria; concatena el resultado."""
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        bloques = ((x[i:i + tam_bloque], y[i:i + tam_bloque]) for i in range(0, len(x), tam_bloque))
+        partes = list(self.procesar(bloques))
+        return tuple(np.concatenate([p[k] for p in partes]) for k in range(3))
+
+
+def leer_csv_por_bloques(ruta, col_x, col_y, tam_bloque=100_000):
+    """Lee (x, y) de un CSV sin cargar el archivo completo."""
+    for df in pd.read_csv(ruta, usecols=[col_x, col_y], chunksize=tam_bloque):
+        yield df[col_x].to_numpy(dtype=float), df[col_y].to_numpy(dtype=float)
+
+
+def derivar_csv(ruta_entrada, ruta_salida, col_x, col_y,
+                ventana=11, grado=3, deriv=1, tam_bloque=100_000):
+    """Escribe x, y suavizada y derivada en otro CSV, bloque por bloque."""
+    derivador = DerivadorSavitzkyGolay(ventana, grado, deriv)
+    bloques = leer_csv_por_bloques(ruta_entrada, col_x, col_y, tam_bloque)
+
+    total = 0
+    primero = True
+    for xs, ys, ds in derivador.procesar(bloques):
+        pd.DataFrame({col_x: xs, f"{col_y}_suave": ys, f"d{deriv}{col_y}": ds}).to_csv(
+            ruta_salida, mode='w' if primero else 'a', header=primero, index=False
+        )
+        primero = False
+        total += len(xs)
+    return total
+
+
+def main():
+    print("=== DERIVACIÓN DE DATOS CON RUIDO (SAVITZKY-GOLAY) ===")
+
+    try:
+        ruta = input("Archivo CSV de entrada: ").strip()
+        col_x = input("Columna de x: ").strip()
+        col_y = input("Columna de y: ").strip()
+        ventana = int(input("Tamaño de ventana (impar, ej. 11): "))
+        grado = int(input("Grado del polinomio local (ej. 3): "))
+        deriv = int(input("Orden de la derivada (ej. 1): "))
+        salida = input("Archivo CSV de salida: ").strip()
+    except ValueError:
+        print("Error: Los valores numéricos no son válidos.")
+        return
+
+    try:
+        total = derivar_csv(ruta, salida, col_x, col_y, ventana, grado, deriv)
+    except Exception as e:
+        print(f"Error: {e}")
+        return
+
+    print(f"\n[OK] {total} puntos procesados. Resultado en: {salida}")
+
+
+if __name__ == "__main__":
+    main()
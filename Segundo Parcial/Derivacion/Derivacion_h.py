@@ -1,5 +1,7 @@
 import math
+import numpy as np
 import sympy as sp
+from Derivacion_Compleja import crear_derivador
 
 def main():
     print("=== Generador de Tabla de Derivación (2, 3 y 5 Puntos) ===")
@@ -29,6 +31,9 @@ def main():
         # Derivada analítica para la columna Real
         diff_expr = sp.diff(expr, x_sym)
         df_real = sp.lambdify(x_sym, diff_expr, "math")
+        
+        # Paso complejo (con respaldo centrado si la función no es analítica)
+        df_comp, modo_comp = crear_derivador(expr, x_sym)
     except Exception as e:
         print(f"Error al interpretar la función: {e}")
         return
@@ -46,11 +51,18 @@ def main():
         X.append(xi)
         Y.append(yi)
 
+    # Columna de paso complejo: una sola llamada vectorizada para todos los xi
+    try:
+        D_comp = df_comp(np.array(X))
+    except Exception:
+        D_comp = [None] * n
+
     # 4. Construir la Tabla
     # Ajustamos el ancho para que quepan todas las columnas
-    print("\n" + "="*130)
-    print(f"{'i':<3} | {'xi':<8} | {'f(xi)':<12} | {'f\'(2 Pts)':<15} | {'f\'(3 Pts)':<15} | {'f\'(5 Pts)':<15} | {'Real':<15} | {'Err%(5p)':<10}")
-    print("="*130)
+    print(f"\nColumna 'Compleja': modo {modo_comp}")
+    print("\n" + "="*148)
+    print(f'''{"i":<3} | {"xi":<8} | {"f(xi)":<12} | {"f'(2 Pts)":<15} | {"f'(3 Pts)":<15} | {"f'(5 Pts)":<15} | {"Compleja":<15} | {"Real":<15} | {"Err%(5p)":<10}''')
+    print("="*148)
 
     for i in range(n):
         xi = X[i]
@@ -97,6 +109,7 @@ def main():
         s_d2 = f"{d2:.5f}" if d2 is not None else "---"
         s_d3 = f"{d3:.5f}" if d3 is not None else "---"
         s_d5 = f"{d5:.5f}" if d5 is not None else "---"
+        s_dc = f"{D_comp[i]:.5f}" if D_comp[i] is not None else "---"
         
         # Error Relativo (Comparando la mejor aprox disponible (5pts) vs Real)
         # Si no hay 5pts, usamos 3pts para calcular el error visual
@@ -108,9 +121,9 @@ def main():
         else:
             s_err = "---"
 
-        print(f"{i:<3} | {xi:<8.4f} | {fi:<12.5f} | {s_d2:<15} | {s_d3:<15} | {s_d5:<15} | {real_val:<15.5f} | {s_err:<10}")
+        print(f"{i:<3} | {xi:<8.4f} | {fi:<12.5f} | {s_d2:<15} | {s_d3:<15} | {s_d5:<15} | {s_dc:<15} | {real_val:<15.5f} | {s_err:<10}")
 
-    print("="*130)
+    print("="*148)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
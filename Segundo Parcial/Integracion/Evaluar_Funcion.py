@@ -0,0 +1,32 @@
+import numpy as np
+
+# --- EVALUACIÓN VECTORIZADA DE f(x) ESCRITA POR EL USUARIO ---
+# Compartida por las ventanas de cuadratura (adaptativa y gaussiana).
+
+def evaluar_funcion_vectorizada(x, funcion_str, respaldo=None):
+    """
+    Evalúa la función en un arreglo de puntos (NumPy) en una sola llamada.
+    Si la expresión no se puede vectorizar y se da 'respaldo' (evaluador
+    escalar respaldo(xi, funcion_str)), se evalúa punto a punto.
+    NumPy no lanza errores de dominio (da nan/inf), así que un valor no
+    finito se reporta con el mismo ValueError que el evaluador escalar.
+    """
+    contexto = {
+        "sin": np.sin, "cos": np.cos, "tan": np.tan, "exp": np.exp,
+        "log": np.log, "sqrt": np.sqrt, "abs": np.abs, "pi": np.pi,
+        "e": np.e, "math": np, "x": x
+    }
+    try:
+        with np.errstate(all='ignore'):
+            valores = eval(funcion_str.replace('^', '**'), {"__builtins__": {}}, contexto)
+        valores = np.broadcast_to(np.asarray(valores, dtype=float), np.shape(x))
+    except Exception:
+        if respaldo is None:
+            raise
+        puntos = np.ravel(x)
+        valores = np.array([respaldo(xi, funcion_str) for xi in puntos], dtype=float).reshape(np.shape(x))
+
+    malos = ~np.isfinite(valores)
+    if np.any(malos):
+        raise ValueError(f"Error al evaluar función en x={np.asarray(x, dtype=float)[malos].flat[0]}")
+    return valores
@@ -0,0 +1,149 @@
+import math
+import heapq
+import numpy as np
+import sympy as sp
+
+# --- 1. REGLAS DE GAUSS-KRONROD (TABLAS DE QUADPACK) ---
+# Solo la mitad positiva de los nodos (de mayor a menor, el último es 0).
+# Los nodos de índice impar son los de Gauss: la regla de Kronrod los
+# reutiliza, y |K - G| sale gratis como estimación del error.
+
+_XGK_15 = [
+    0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+    0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+    0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+    0.207784955007898467600689403773245, 0.000000000000000000000000000000000,
+]
+_WGK_15 = [
+    0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+    0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+    0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+    0.204432940075298892414161999234649, 0.209482141084727828012999174891714,
+]
+_WG_7 = [
+    0.129484966168869693270611432679082, 0.279705391489276667901467771423780,
+    0.381830050505118944950369775488975, 0.417959183673469387755102040816327,
+]
+
+_XGK_21 = [
+    0.995657163025808080735527280689003, 0.973906528517171720077964012084452,
+    0.930157491355708226001207180059508, 0.865063366688984510732096688423493,
+    0.780817726586416897063717578345042, 0.679409568299024406234327365114874,
+    0.562757134668604683339000099272694, 0.433395394129247190799265943165784,
+    0.294392862701460198131126603103866, 0.148874338981631210884826001129720,
+    0.000000000000000000000000000000000,
+]
+_WGK_21 = [
+    0.011694638867371874278064396062192, 0.032558162307964727478818972459390,
+    0.054755896574351996031381300244580, 0.075039674810919952767043140916190,
+    0.093125454583697605535065465083366, 0.109387158802297641899210590325805,
+    0.123491976262065851077958109831074, 0.134709217311473325928054001771707,
+    0.142775938577060080797094273138717, 0.147739104901338491374841515972068,
+    0.149445554002916905664936468389821,
+]
+_WG_10 = [
+    0.066671344308688137593568809893332, 0.149451349150580593145776339657697,
+    0.219086362515982043995534934228163, 0.269266719309996355091226921569469,
+    0.295524224714752870173892994651338,
+]
+
+def _regla_completa(xgk, wgk, wg):
+    """Nodos en [-1, 1] con pesos de Kronrod y de Gauss (0 en los nodos solo de Kronrod)."""
+    xgk, wgk = np.array(xgk), np.array(wgk)
+    wg_mitad = np.zeros(len(xgk))
+    wg_mitad[1::2] = wg[:len(wg_mitad[1::2])]
+    nodos = np.concatenate([-xgk[:-1], [0.0], xgk[:-1][::-1]])
+    pesos_k = np.concatenate([wgk[:-1], [wgk[-1]], wgk[:-1][::-1]])
+    pesos_g = np.concatenate([wg_mitad[:-1], [wg_mitad[-1]], wg_mitad[:-1][::-1]])
+    return nodos, pesos_k, pesos_g
+
+REGLAS = {
+    "G7K15": _regla_completa(_XGK_15, _WGK_15, _WG_7),
+    "G10K21": _regla_completa(_XGK_21, _WGK_21, _WG_10),
+}
+
+# --- 2. INTEGRADOR ADAPTATIVO ---
+def _evaluar_lote(f, intervalos, regla):
+    """K, G y |K - G| para un lote de subintervalos con UNA llamada a f."""
+    nodos, pesos_k, pesos_g = regla
+    a = np.array([iv[0] for iv in intervalos])
+    b = np.array([iv[1] for iv in intervalos])
+    centro = (a + b) / 2
+    radio = (b - a) / 2
+    X = centro[:, None] + radio[:, None] * nodos[None, :]
+    F = np.broadcast_to(np.asarray(f(X), dtype=float), X.shape)
+    K = radio * (F @ pesos_k)
+    G = radio * (F @ pesos_g)
+    return K, np.abs(K - G), X.size
+
+def gauss_kronrod_adaptativa(f, a, b, tol_abs=1e-10, tol_rel=1e-12, regla="G7K15",
+                             max_evaluaciones=1_000_000, lote=32):
+    """
+    Gauss-Kronrod adaptativo GLOBAL.
+
+    Cada subintervalo se integra con K (15 o 21 puntos) y con G (7 o 10
+    puntos, que son un subconjunto de los de K): error ≈ |K - G|.
+    Un montículo ordena los subintervalos por error; en cada paso se
+    bisecan los peores (hasta 'lote', y no más de 1/4 del montículo para
+    no refinar de más al inicio) y todos los hijos se evalúan en una sola
+    llamada vectorizada a f.
+    Termina cuando Σ errores <= max(tol_abs, tol_rel·|I|) o se agota el
+    presupuesto de evaluaciones.
+
+    Retorna (integral, error_estimado, evaluaciones, subintervalos).
+    """
+    if regla not in REGLAS:
+        raise ValueError(f"Regla desconocida: {regla}. Opciones: {list(REGLAS)}")
+    R = REGLAS[regla]
+
+    K, E, evaluaciones = _evaluar_lote(f, [(a, b)], R)
+    heap = [(-E[0], a, b, K[0])]
+    error_total = E[0]
+    integral = K[0]
+
+    while error_total > max(tol_abs, tol_rel * abs(integral)) and evaluaciones < max_evaluaciones:
+        peores = [heapq.heappop(heap) for _ in range(min(lote, max(1, len(heap) // 4)))]
+        hijos = []
+        for _, ai, bi, _ in peores:
+            m = (ai + bi) / 2
+            hijos.extend([(ai, m), (m, bi)])
+
+        K, E, n_eval = _evaluar_lote(f, hijos, R)
+        evaluaciones += n_eval
+        for (ai, bi), k, e in zip(hijos, K, E):
+            heapq.heappush(heap, (-e, ai, bi, k))
+
+        error_total = math.fsum(-item[0] for item in heap)
+        integral = math.fsum(item[3] for item in heap)
+
+    return integral, error_total, evaluaciones, len(heap)
+
+# --- 3. FUNCIÓN PRINCIPAL ---
+def main():
+    print("=== INTEGRACIÓN ADAPTATIVA DE GAUSS-KRONROD ===")
+    x = sp.symbols('x')
+    try:
+        expr = sp.sympify(input("Introduce la función f(x) (ej. exp(-x**2), sqrt(x)): ").replace("^", "**"))
+        f = sp.lambdify(x, expr, "numpy")
+        a = float(input("Límite inferior (a): "))
+        b = float(input("Límite superior (b): "))
+        tol_str = input("Tolerancia absoluta (Enter = 1e-10): ")
+        tol = float(tol_str) if tol_str else 1e-10
+    except Exception as e:
+        print(f"Error al procesar los datos: {e}")
+        return
+
+    print(f"\n{'Regla':<8} | {'Integral':>22} | {'Error est.':>10} | {'Evaluaciones':>12} | {'Subintervalos':>13}")
+    print("-" * 78)
+    for regla in REGLAS:
+        valor, error, evaluaciones, subintervalos = gauss_kronrod_adaptativa(f, a, b, tol, regla=regla)
+        print(f"{regla:<8} | {valor:>22.15f} | {error:>10.2e} | {evaluaciones:>12} | {subintervalos:>13}")
+
+    try:
+        exacto = float(sp.integrate(expr, (x, a, b)))
+        print(f"\nIntegral Exacta (Analítica): {exacto:.15f}")
+    except Exception:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import math
+from functools import lru_cache
+import numpy as np
+
+# --- 1. NODOS Y PESOS DE GAUSS-LEGENDRE PARA CUALQUIER n ---
+# Golub-Welsch (eigenvalores de la matriz de Jacobi) para n moderado y
+# aproximación asintótica + Newton para n grande. En ambos casos se termina
+# con Newton sobre la recurrencia de Legendre, así nodos y pesos quedan
+# en precisión doble completa. Cada n se calcula UNA vez (lru_cache).
+
+LIMITE_GOLUB_WELSCH = 100
+
+def _legendre_y_derivada(x, n):
+    """P_n(x) y P_n'(x) con la recurrencia de tres términos (vectorizado en x)."""
+    p0 = np.ones_like(x)
+    p1 = x.copy()
+    for k in range(2, n + 1):
+        p0, p1 = p1, ((2 * k - 1) * x * p1 - (k - 1) * p0) / k
+    dp = n * (x * p1 - p0) / (x * x - 1)
+    return p1, dp
+
+def _golub_welsch(n):
+    """Nodos = eigenvalores de la matriz tridiagonal de Jacobi, β_k = k / sqrt(4k² - 1)."""
+    k = np.arange(1, n)
+    beta = k / np.sqrt(4.0 * k * k - 1)
+    J = np.diag(beta, 1) + np.diag(beta, -1)
+    return np.linalg.eigvalsh(J)
+
+def _asintoticos(n):
+    """Aproximación de Tricomi para los ceros de P_n (de mayor a menor)."""
+    k = np.arange(1, n + 1)
+    theta = np.pi * (4 * k - 1) / (4 * n + 2)
+    return (1 - 1 / (8 * n**2) + 1 / (8 * n**3)) * np.cos(theta)
+
+@lru_cache(maxsize=None)
+def nodos_pesos_legendre(n):
+    """
+    Nodos ξ_i y pesos w_i de Gauss-Legendre con n puntos en [-1, 1]:
+        ∫_{-1}^{1} f ≈ Σ w_i f(ξ_i),   exacta para polinomios de grado ≤ 2n - 1
+    Pesos: w_i = 2 / ((1 - ξ_i²) P_n'(ξ_i)²).
+    """
+    if n < 1:
+        raise ValueError("Se requiere al menos 1 punto.")
+    if n == 1:
+        nodos, pesos = np.array([0.0]), np.array([2.0])
+    else:
+        x = np.sort(_golub_welsch(n) if n <= LIMITE_GOLUB_WELSCH else _asintoticos(n))
+        # Newton (todos los nodos a la vez) hasta precisión de máquina
+        for _ in range(100):
+            p, dp = _legendre_y_derivada(x, n)
+            dx = p / dp
+            x -= dx
+            if np.max(np.abs(dx)) < 1e-16:
+                break
+        _, dp = _legendre_y_derivada(x, n)
+        # Simetría exacta: ξ_i = -ξ_{n-1-i}
+        x = (x - x[::-1]) / 2
+        nodos = x
+        pesos = 2 / ((1 - x * x) * dp * dp)
+        pesos = (pesos + pesos[::-1]) / 2
+
+    nodos.flags.writeable = False
+    pesos.flags.writeable = False
+    return nodos, pesos
+
+# --- 2. REGLA COMPUESTA VECTORIZADA ---
+def gauss_legendre_compuesta(f, a, b, n_intervalos, n_puntos, tam_bloque=1_000_000):
+    """
+    ∫_a^b f ≈ Σ_i (h/2) Σ_j w_j f(c_i + (h/2) ξ_j),   c_i = a + (i + 1/2) h
+
+    Todos los nodos de los subintervalos se arman como una matriz
+    (subintervalos × n_puntos) y f se evalúa en UNA llamada por bloque.
+    """
+    nodos, pesos = nodos_pesos_legendre(n_puntos)
+    h = (b - a) / n_intervalos
+    por_bloque = max(1, tam_bloque // n_puntos)
+    total = []
+
+    for inicio in range(0, n_intervalos, por_bloque):
+        i = np.arange(inicio, min(inicio + por_bloque, n_intervalos))
+        centros = a + (i + 0.5) * h
+        X = centros[:, None] + (h / 2) * nodos[None, :]
+        F = np.broadcast_to(np.asarray(f(X), dtype=float), X.shape)
+        total.append(np.sum(F @ pesos))
+
+    return (h / 2) * math.fsum(total)
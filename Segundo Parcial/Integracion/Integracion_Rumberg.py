@@ -1,6 +1,47 @@
 import sympy as sp
+import numpy as np
 import math
 
+def romberg(f, a, b, tol=1e-10, max_filas=30, min_filas=3, tam_bloque=1_000_000):
+    """
+    Romberg con reutilización de evaluaciones.
+
+    Fila i (2^i segmentos): solo se evalúan los 2^(i-1) puntos medios nuevos,
+        R[i][0] = R[i-1][0] / 2 + h_i · Σ f(a + (2k-1)·h_i)
+    en bloques vectorizados. Richardson:
+        R[i][j] = R[i][j-1] + (R[i][j-1] - R[i-1][j-1]) / (4^j - 1)
+    Se detiene cuando |R[i][i] - R[i-1][i-1]| <= tol·max(1, |R[i][i]|).
+
+    Retorna (valor, R, evaluaciones, error_estimado); R es la tabla triangular.
+    """
+    def evaluar(x):
+        return np.broadcast_to(np.asarray(f(x), dtype=float), x.shape)
+
+    h = b - a
+    R = [[h / 2 * float(np.sum(evaluar(np.array([a, b]))))]]
+    evaluaciones = 2
+    error = math.inf
+
+    for i in range(1, max_filas):
+        h /= 2
+        nuevos = 2**(i - 1)
+        suma = 0.0
+        for inicio in range(0, nuevos, tam_bloque):
+            k = np.arange(inicio, min(inicio + tam_bloque, nuevos))
+            suma += float(np.sum(evaluar(a + (2 * k + 1) * h)))
+        evaluaciones += nuevos
+
+        fila = [R[i-1][0] / 2 + h * suma]
+        for j in range(1, i + 1):
+            fila.append(fila[j-1] + (fila[j-1] - R[i-1][j-1]) / (4**j - 1))
+        R.append(fila)
+
+        error = abs(R[i][i] - R[i-1][i-1])
+        if i + 1 >= min_filas and error <= tol * max(1.0, abs(R[i][i])):
+            break
+
+    return R[-1][-1], R, evaluaciones, error
+
 def metodo_romberg():
     print("--- INTEGRACIÓN DE ROMBERG CON CÁLCULO DE ERROR REAL ---")
     
@@ -12,7 +53,9 @@ def metodo_romberg():
         funcion_str = input("Introduce la función f(x) (ej. sin(x), x**2, exp(x)): ")
         a = float(input("Límite inferior (a): "))
         b = float(input("Límite superior (b): "))
-        n = int(input("Número de filas (iteraciones) para la tabla de Romberg: "))
+        n = int(input("Número MÁXIMO de filas para la tabla de Romberg: "))
+        tol_str = input("Tolerancia para detenerse (Enter = 1e-10): ")
+        tol = float(tol_str) if tol_str else 1e-10
     except ValueError:
         print("Error: Asegúrate de ingresar números válidos.")
         return
@@ -22,7 +65,7 @@ def metodo_romberg():
     try:
         funcion_sym = sp.sympify(funcion_str)
         # Creamos una función rápida para cálculos numéricos
-        f = sp.lambdify(x, funcion_sym, "math") 
+        f = sp.lambdify(x, funcion_sym, "numpy")
     except:
         print("Error: No se pudo interpretar la función.")
         return
@@ -37,39 +80,11 @@ def metodo_romberg():
         print("No se pudo calcular un valor numérico exacto (posible integral no elemental).")
         valor_exacto = None
 
-    # 5. Inicializar la Tabla de Romberg (Matriz R)
-    # R[i][j] donde i es la fila (paso) y j es la columna (nivel de extrapolación)
-    R = [[0 for _ in range(n)] for _ in range(n)]
-
+    # 5. Tabla de Romberg: cada fila evalúa solo los puntos medios nuevos
+    # y se detiene en cuanto la diagonal converge a la tolerancia.
     print("\n--- INICIANDO ITERACIONES ---")
-    
-    # 6. Primera columna: Regla del Trapecio (R[i][0])
-    # Hacemos esto iterativamente para reutilizar puntos si quisiéramos, 
-    # pero aquí usamos la fórmula directa del trapecio compuesto.
-    for i in range(n):
-        pasos = 2**i      # 1, 2, 4, 8, ... segmentos
-        h = (b - a) / pasos
-        
-        # Sumatoria interna del trapecio: f(a) + 2*sum(f) + f(b)
-        suma = f(a) + f(b)
-        for k in range(1, pasos):
-            suma += 2 * f(a + k * h)
-            
-        R[i][0] = (h / 2) * suma
-        
-    # 7. Aplicar la Fórmula de Extrapolación de Richardson
-    # R[i][j] = R[i][j-1] + (R[i][j-1] - R[i-1][j-1]) / (4^j - 1)
-    
-    for j in range(1, n):             # Columnas (Nivel de mejora)
-        for i in range(j, n):         # Filas (Tamaño de paso)
-            
-            # TU FÓRMULA ESTÁ AQUÍ:
-            # R[i][j-1] es la estimación actual con paso h/2 (más preciso)
-            # R[i-1][j-1] es la estimación previa con paso h (menos preciso)
-            numerador = R[i][j-1] - R[i-1][j-1]
-            denominador = 4**j - 1
-            
-            R[i][j] = R[i][j-1] + (numerador / denominador)
+    resultado_final, R, evaluaciones, error_estimado = romberg(f, a, b, tol, max_filas=max(n, 1))
+    n = len(R)
 
     # 8. Mostrar Resultados
     print("\n--- TABLA DE ROMBERG ---")
@@ -83,9 +98,10 @@ def metodo_romberg():
         print(fila_str)
 
     # 9. Cálculo final del error
-    resultado_final = R[n-1][n-1]
     print("\n--- RESULTADO FINAL ---")
     print(f"Aproximación de Romberg: {resultado_final:.10f}")
+    print(f"Filas usadas: {n}   Evaluaciones de f: {evaluaciones}")
+    print(f"Error estimado |R[n][n] - R[n-1][n-1]|: {error_estimado:.2e}")
     
     if valor_exacto is not None:
         error_abs = abs(valor_exacto - resultado_final)
@@ -1,4 +1,11 @@
+import io
+import math
+import time
+from contextlib import redirect_stdout
+import numpy as np
 import sympy as sp
+from Gauss_Legendre import nodos_pesos_legendre
+from Gauss_Kronrod import gauss_kronrod_adaptativa
 
 def obtener_funcion_y_simbolos():
     """
@@ -114,10 +121,248 @@ def simpson_doble(f_func, x0, xn, y0, yn, n, m):
 
     return (hx * hy / 9) * suma_total
 
+# --- VERSIÓN VECTORIZADA (PRODUCTO TENSORIAL) ---
+def regla_1d(metodo, a, b, n, n_puntos=5):
+    """
+    Nodos y pesos 1-D ya escalados a [a, b] (n = subintervalos):
+        'trapecio': h·[1/2, 1, ..., 1, 1/2]
+        'simpson' : h/3·[1, 4, 2, 4, ..., 4, 1]   (n se ajusta a par)
+        'gauss'   : Gauss-Legendre de n_puntos en cada subintervalo
+    """
+    if metodo == "trapecio":
+        nodos = np.linspace(a, b, n + 1)
+        pesos = np.full(n + 1, (b - a) / n)
+        pesos[[0, -1]] /= 2
+    elif metodo == "simpson":
+        if n % 2 != 0: n += 1
+        nodos = np.linspace(a, b, n + 1)
+        pesos = np.ones(n + 1)
+        pesos[1:-1:2], pesos[2:-1:2] = 4, 2
+        pesos *= (b - a) / n / 3
+    elif metodo == "gauss":
+        xi, wi = nodos_pesos_legendre(n_puntos)
+        h = (b - a) / n
+        centros = a + (np.arange(n) + 0.5) * h
+        nodos = (centros[:, None] + (h / 2) * xi[None, :]).ravel()
+        pesos = np.tile((h / 2) * wi, n)
+    else:
+        raise ValueError(f"Método desconocido: {metodo}")
+    return nodos, pesos
+
+def integral_tensorial(f_vec, reglas, tam_bloque=1_000_000):
+    """
+    Regla producto en 2-D o 3-D a partir de reglas 1-D (nodos, pesos):
+        2-D:  ∫∫ f ≈ wxᵀ F wy,           F[i, j]    = f(x_i, y_j)
+        3-D:  ∫∫∫ f ≈ Σ wx_i wy_j wz_k F[i, j, k]
+    f se evalúa en mallas abiertas (broadcasting, sin meshgrid completo)
+    por bloques de filas en x de ~tam_bloque puntos; cada bloque se
+    contrae eje por eje con productos matriz-vector.
+    Igual que en los bucles, los errores de dominio (nan, ±inf) cuentan como 0.
+    """
+    nodos = [np.asarray(r[0], dtype=float) for r in reglas]
+    pesos = [np.asarray(r[1], dtype=float) for r in reglas]
+    d = len(nodos)
+    resto = math.prod(len(nd) for nd in nodos[1:])
+    filas = max(1, tam_bloque // resto)
+    # Malla abierta: el eje k tiene forma (1, ..., n_k, ..., 1)
+    mallas = [nd.reshape([1] * k + [-1] + [1] * (d - k - 1)) for k, nd in enumerate(nodos)]
+    forma_resto = tuple(len(nd) for nd in nodos[1:])
+    parciales = []
+
+    for inicio in range(0, len(nodos[0]), filas):
+        bloque = slice(inicio, inicio + filas)
+        X = mallas[0][bloque]
+        with np.errstate(all='ignore'):
+            F = np.broadcast_to(np.asarray(f_vec(X, *mallas[1:]), dtype=float), (X.shape[0],) + forma_resto)
+        F = np.where(np.isfinite(F), F, 0.0)
+        for w in reversed(pesos[1:]):
+            F = F @ w
+        parciales.append(pesos[0][bloque] @ F)
+
+    return math.fsum(parciales)
+
+def trapecio_doble_vectorizado(f_vec, x0, xn, y0, yn, n, m):
+    return integral_tensorial(f_vec, [regla_1d("trapecio", x0, xn, n), regla_1d("trapecio", y0, yn, m)])
+
+def simpson_doble_vectorizado(f_vec, x0, xn, y0, yn, n, m):
+    return integral_tensorial(f_vec, [regla_1d("simpson", x0, xn, n), regla_1d("simpson", y0, yn, m)])
+
+def gauss_doble(f_vec, x0, xn, y0, yn, n, m, n_puntos=5):
+    return integral_tensorial(f_vec, [regla_1d("gauss", x0, xn, n, n_puntos), regla_1d("gauss", y0, yn, m, n_puntos)])
+
+def integral_triple(f_vec, limites, subintervalos, metodo="simpson", n_puntos=5):
+    """limites = [(x0, xn), (y0, yn), (z0, zn)], subintervalos = [n, m, p]."""
+    reglas = [regla_1d(metodo, a, b, k, n_puntos) for (a, b), k in zip(limites, subintervalos)]
+    return integral_tensorial(f_vec, reglas)
+
+def comparar_rendimiento(f_num, f_vec, x0, xn, y0, yn, n, m):
+    """Tiempo y puntos/s de los bucles originales contra la versión vectorizada."""
+    print(f"\n{'Método':<24} | {'Integral':>18} | {'Tiempo (s)':>10} | {'Puntos/s':>12}")
+    print("-" * 74)
+    casos = [
+        ("Trapecio (bucles)", lambda: trapecio_doble(f_num, x0, xn, y0, yn, n, m), (n + 1) * (m + 1)),
+        ("Trapecio (vectorizado)", lambda: trapecio_doble_vectorizado(f_vec, x0, xn, y0, yn, n, m), (n + 1) * (m + 1)),
+        ("Simpson (bucles)", lambda: simpson_doble(f_num, x0, xn, y0, yn, n, m), (n + n % 2 + 1) * (m + m % 2 + 1)),
+        ("Simpson (vectorizado)", lambda: simpson_doble_vectorizado(f_vec, x0, xn, y0, yn, n, m), (n + n % 2 + 1) * (m + m % 2 + 1)),
+        ("Gauss 5×5 (vectorizado)", lambda: gauss_doble(f_vec, x0, xn, y0, yn, n, m), 25 * n * m),
+    ]
+    for nombre, calculo, puntos in casos:
+        inicio = time.perf_counter()
+        with redirect_stdout(io.StringIO()):  # los bucles imprimen diagnósticos por punto
+            valor = calculo()
+        t = time.perf_counter() - inicio
+        print(f"{nombre:<24} | {valor:>18.12f} | {t:>10.4f} | {puntos / t:>12.3e}")
+
+def main_triple():
+    print("=== INTEGRAL TRIPLE (PRODUCTO TENSORIAL) ===")
+    x, y, z = sp.symbols('x y z')
+    try:
+        expr = sp.sympify(input("Introduce la función f(x, y, z) (ej: x*y*z + z**2): "))
+        f_vec = sp.lambdify((x, y, z), expr, "numpy")
+        limites = []
+        for var in "xyz":
+            limites.append((float(input(f"Límite inferior {var}: ")), float(input(f"Límite superior {var}: "))))
+        subintervalos = [int(input(f"Intervalos en {var.upper()}: ")) for var in "xyz"]
+    except Exception as e:
+        print(f"Error en los datos: {e}")
+        return
+
+    print("\nMétodo: 1. Trapecio  2. Simpson 1/3  3. Gauss-Legendre (5 puntos)")
+    metodo = {"1": "trapecio", "2": "simpson", "3": "gauss"}.get(input("Opción: "), "simpson")
+    resultado = integral_triple(f_vec, limites, subintervalos, metodo)
+
+    print("\n" + "="*40)
+    print(f"Integral Numérica ({metodo}): {resultado:.10f}")
+    try:
+        valor_real = float(sp.integrate(expr, (x, *limites[0]), (y, *limites[1]), (z, *limites[2])))
+        print(f"Integral Exacta:     {valor_real:.10f}")
+        print(f"Error Absoluto:      {abs(valor_real - resultado):.3e}")
+    except Exception as e:
+        print(f"No se pudo calcular la integral exacta simbólicamente: {e}")
+    print("="*40)
+
+# --- REGIONES NO RECTANGULARES (LÍMITES INTERNOS VARIABLES) ---
+def _integral_cortes(f_vec, X, limites, reglas):
+    """
+    Integrales internas para TODOS los cortes X (arreglo de cualquier forma):
+        G(x) = ∫_{g1(x)}^{g2(x)} f(x, y) dy                 (2-D)
+        G(x) = ∫_{g1(x)}^{g2(x)} ∫_{h1(x,y)}^{h2(x,y)} f dz dy   (3-D)
+    Cada corte se lleva al intervalo de referencia [0, 1]:
+        y = g1 + (g2 - g1)·t,   dy = (g2 - g1) dt
+    así los nodos de todos los cortes forman un solo arreglo y f se evalúa
+    en UNA llamada. limites = [(g1, g2), (h1, h2)], reglas = [(t, v)] en [0, 1].
+    """
+    variables, jacobianos = [np.asarray(X, dtype=float)], []
+    for (inferior, superior), (t, _) in zip(limites, reglas):
+        previas = [v[..., None] for v in variables]
+        forma = previas[-1].shape
+        lo = np.broadcast_to(inferior(*previas), forma)
+        hi = np.broadcast_to(superior(*previas), forma)
+        variables = previas[:-1] + [np.broadcast_to(previas[-1], forma[:-1] + (len(t),)), lo + (hi - lo) * t]
+        jacobianos.append((hi - lo)[..., 0])
+
+    with np.errstate(all='ignore'):
+        F = np.broadcast_to(np.asarray(f_vec(*variables), dtype=float), variables[-1].shape)
+    # Errores de dominio (nan, ±inf) cuentan como 0, igual que en los bucles
+    F = np.where(np.isfinite(F), F, 0.0)
+    for (_, v), J in zip(reversed(reglas), reversed(jacobianos)):
+        F = (F @ v) * J
+    return F
+
+def integral_region(f_vec, x0, xn, limites, subintervalos, metodo="simpson", n_puntos=5, tam_bloque=1_000_000):
+    """
+    Regla fija (trapecio, Simpson o Gauss) sobre una región tipo I:
+        x ∈ [x0, xn],  y ∈ [g1(x), g2(x)]  (y en 3-D  z ∈ [h1(x,y), h2(x,y)]).
+    subintervalos = [n, m] o [n, m, p]. Para una región tipo II basta
+    intercambiar el orden de las variables en f.
+    """
+    nodos, pesos = regla_1d(metodo, x0, xn, subintervalos[0], n_puntos)
+    reglas = [regla_1d(metodo, 0.0, 1.0, k, n_puntos) for k in subintervalos[1:]]
+    filas = max(1, tam_bloque // math.prod(len(t) for t, _ in reglas))
+    parciales = [pesos[i:i + filas] @ _integral_cortes(f_vec, nodos[i:i + filas], limites, reglas)
+                 for i in range(0, len(nodos), filas)]
+    return math.fsum(parciales)
+
+def integral_region_adaptativa(f_vec, x0, xn, limites, subintervalos_internos, n_puntos=5,
+                               tol=1e-10, regla="G7K15"):
+    """
+    Variable externa ADAPTATIVA: G(x) (cortes con Gauss compuesto fijo) se
+    integra con Gauss-Kronrod global, que pide G en lotes de nodos y así
+    todos los cortes de un lote se evalúan juntos. Útil cuando g1, g2 tienen
+    derivadas singulares (p. ej. sqrt(1 - x**2) en x = ±1).
+    Retorna (integral, error_externo, cortes, evaluaciones_de_f).
+    """
+    reglas = [regla_1d("gauss", 0.0, 1.0, k, n_puntos) for k in subintervalos_internos]
+    G = lambda X: _integral_cortes(f_vec, X, limites, reglas)
+    valor, error, cortes, _ = gauss_kronrod_adaptativa(G, x0, xn, tol, regla=regla)
+    return valor, error, cortes, cortes * math.prod(len(t) for t, _ in reglas)
+
+def main_region():
+    print("=== INTEGRAL SOBRE UNA REGIÓN NO RECTANGULAR ===")
+    x, y, z = sp.symbols('x y z')
+    try:
+        dimension = 3 if input("¿Doble (2) o triple (3)? [2]: ").strip() == "3" else 2
+        tipo = "I"
+        if dimension == 2:
+            tipo = "II" if input("Tipo I (y entre g1(x) y g2(x)) o Tipo II (x entre h1(y) y h2(y))? [I]: ").strip().upper() == "II" else "I"
+        externa, interna = (x, y) if tipo == "I" else (y, x)
+
+        expr = sp.sympify(input(f"Introduce la función f({', '.join(str(v) for v in (x, y, z)[:dimension])}): ").replace("^", "**"))
+        a = float(input(f"Límite inferior de {externa}: "))
+        b = float(input(f"Límite superior de {externa}: "))
+        g1 = sp.sympify(input(f"Límite inferior de {interna} (función de {externa}): ").replace("^", "**"))
+        g2 = sp.sympify(input(f"Límite superior de {interna} (función de {externa}): ").replace("^", "**"))
+        limites_sym = [(interna, g1, g2)]
+        limites = [(sp.lambdify(externa, g1, "numpy"), sp.lambdify(externa, g2, "numpy"))]
+        if dimension == 3:
+            h1 = sp.sympify(input("Límite inferior de z (función de x, y): ").replace("^", "**"))
+            h2 = sp.sympify(input("Límite superior de z (función de x, y): ").replace("^", "**"))
+            limites_sym.insert(0, (z, h1, h2))
+            limites.append((sp.lambdify((x, y), h1, "numpy"), sp.lambdify((x, y), h2, "numpy")))
+        # Orden de integración: la variable externa va primero
+        f_vec = sp.lambdify((externa, interna) + ((z,) if dimension == 3 else ()), expr, "numpy")
+        subintervalos = [int(input(f"Intervalos en {v}: ")) for v in ((externa, interna) + ((z,) if dimension == 3 else ()))]
+    except Exception as e:
+        print(f"Error en los datos: {e}")
+        return
+
+    print("\nMétodo: 1. Simpson 1/3  2. Gauss-Legendre (5 puntos)  3. Gauss + variable externa adaptativa")
+    opcion = input("Opción: ")
+    if opcion == "3":
+        tol_str = input("Tolerancia (Enter = 1e-10): ")
+        resultado, error, cortes, evaluaciones = integral_region_adaptativa(
+            f_vec, a, b, limites, subintervalos[1:], tol=float(tol_str) if tol_str else 1e-10)
+        print(f"Cortes evaluados: {cortes}   Evaluaciones de f: {evaluaciones}   Error externo estimado: {error:.2e}")
+    else:
+        metodo = "gauss" if opcion == "2" else "simpson"
+        resultado = integral_region(f_vec, a, b, limites, subintervalos, metodo)
+
+    print("\n" + "="*40)
+    print(f"Integral Numérica:   {resultado:.10f}")
+    try:
+        valor_real = float(sp.integrate(expr, *limites_sym, (externa, a, b)))
+        print(f"Integral Exacta:     {valor_real:.10f}")
+        print(f"Error Absoluto:      {abs(valor_real - resultado):.3e}")
+    except Exception as e:
+        print(f"No se pudo calcular la integral exacta simbólicamente: {e}")
+    print("="*40)
+
 def main():
+    print("1. Integral doble sobre un rectángulo")
+    print("2. Integral triple sobre una caja")
+    print("3. Región no rectangular (límites internos variables)")
+    tipo = input("Opción [1]: ").strip()
+    if tipo == "2":
+        main_triple()
+        return
+    if tipo == "3":
+        main_region()
+        return
+
     # 1. Obtener función y compilarla
     expr, f_num, x_sym, y_sym = obtener_funcion_y_simbolos()
     if not expr: return
+    f_vec = sp.lambdify((x_sym, y_sym), expr, "numpy")
 
     # 2. Pedir límites
     try:
@@ -138,7 +383,15 @@ def main():
     print("\nSelecciona Método Numérico:")
     print("1. Trapecio")
     print("2. Simpson 1/3")
+    print("3. Gauss-Legendre 5×5 (compuesta)")
+    print("4. Comparar rendimiento (bucles vs vectorizado)")
     opcion = input("Opción: ")
+
+    if opcion == '4':
+        n = int(input("Intervalos en X: "))
+        m = int(input("Intervalos en Y: "))
+        comparar_rendimiento(f_num, f_vec, x0, xn, y0, yn, n, m)
+        return
     
     print("Variante:")
     print("S. Simple")
@@ -160,6 +413,13 @@ def main():
             n = int(input("Intervalos en X (par): "))
             m = int(input("Intervalos en Y (par): "))
         resultado = simpson_doble(f_num, x0, xn, y0, yn, n, m)
+
+    elif opcion == '3': # Gauss-Legendre
+        if variante == 'S': n, m = 1, 1
+        else:
+            n = int(input("Intervalos en X: "))
+            m = int(input("Intervalos en Y: "))
+        resultado = gauss_doble(f_vec, x0, xn, y0, yn, n, m)
     else:
         print("Opción inválida.")
         return
@@ -1,3 +1,4 @@
+import numpy as np
 import sympy as sp
 
 def obtener_datos():
@@ -39,30 +40,66 @@ def trapecio_simple(f, a, b):
     
     return (h / 2) * (fa + fb)
 
-def trapecio_compuesto(f, a, b, n):
+class SumaKahan:
+    """
+    Acumulador con suma compensada (Kahan-Neumaier): guarda en 'compensacion'
+    los bits que se pierden al sumar, así el error no crece con el número
+    de bloques sumados.
+    """
+
+    def __init__(self):
+        self.suma = 0.0
+        self.compensacion = 0.0
+
+    def agregar(self, valor):
+        valor = float(valor)
+        t = self.suma + valor
+        if abs(self.suma) >= abs(valor):
+            self.compensacion += (self.suma - t) + valor
+        else:
+            self.compensacion += (valor - t) + self.suma
+        self.suma = t
+
+    @property
+    def total(self):
+        return self.suma + self.compensacion
+
+def _evaluar_bloque(f, x):
+    """Evalúa f (vectorizada) en un arreglo; admite funciones constantes."""
+    return np.broadcast_to(np.asarray(f(x), dtype=float), x.shape)
+
+def trapecio_compuesto(f, a, b, n, tam_bloque=1_000_000, mostrar_tabla=True, filas=5):
+    """
+    Trapecio compuesto con f vectorizada (NumPy), por bloques de tamaño fijo:
+    memoria constante aunque n sea de miles de millones.
+    Dentro de cada bloque np.sum suma por pares; entre bloques se acumula
+    con SumaKahan. La tabla solo muestra las primeras y últimas 'filas'.
+    """
     h = (b - a) / n
-    suma_interna = 0
-    
-    print(f"\n--- Tabla de Iteraciones (n={n}, h={h:.4f}) ---")
-    print(f"{'i':<5} | {'x_i':<10} | {'f(x_i)':<12} | {'Peso'}")
-    print("-" * 45)
-    
-    # x0
-    f_x0 = f(a)
-    print(f"{0:<5} | {a:<10.4f} | {f_x0:<12.6f} | 1")
-    
-    # x1 hasta x_n-1
-    for i in range(1, n):
+    acumulado = SumaKahan()
+
+    for inicio in range(0, n + 1, tam_bloque):
+        i = np.arange(inicio, min(inicio + tam_bloque, n + 1))
         x_i = a + i * h
-        f_xi = f(x_i)
-        suma_interna += f_xi
-        print(f"{i:<5} | {x_i:<10.4f} | {f_xi:<12.6f} | 2")
-        
-    # xn
-    f_xn = f(b)
-    print(f"{n:<5} | {b:<10.4f} | {f_xn:<12.6f} | 1")
-    
-    return (h / 2) * (f_x0 + 2 * suma_interna + f_xn)
+        x_i[i == n] = b                      # el último nodo exacto
+        f_xi = _evaluar_bloque(f, x_i)
+        peso = np.where((i == 0) | (i == n), 1.0, 2.0)
+        acumulado.agregar(np.sum(peso * f_xi))
+
+    if mostrar_tabla:
+        print(f"\n--- Tabla de Iteraciones (n={n}, h={h:.4g}) ---")
+        print(f"{'i':<12} | {'x_i':<14} | {'f(x_i)':<14} | {'Peso'}")
+        print("-" * 55)
+        primeras = np.arange(0, min(filas, n + 1))
+        ultimas = np.arange(max(n + 1 - filas, len(primeras)), n + 1)
+        for bloque in (primeras, ultimas):
+            if bloque is ultimas and len(ultimas) and ultimas[0] > primeras[-1] + 1:
+                print(f"{'...':<12} | {'...':<14} | {'...':<14} |")
+            x_i = np.where(bloque == n, b, a + bloque * h)
+            for i, xi, fi in zip(bloque, x_i, _evaluar_bloque(f, x_i)):
+                print(f"{i:<12} | {xi:<14.6f} | {fi:<14.8f} | {1 if i in (0, n) else 2}")
+
+    return (h / 2) * acumulado.total
 
 def main():
     print("=== CALCULADORA INTEGRAL: TRAPECIO VS EXACTA ===")
@@ -85,7 +122,9 @@ def main():
         val_aprox = trapecio_simple(f_num, a, b)
     elif opcion == "2":
         n = int(input("Número de segmentos (n): "))
-        val_aprox = trapecio_compuesto(f_num, a, b, n)
+        # Versión vectorizada de f para evaluar bloques completos
+        f_vec = sp.lambdify(x, expresion, modules=['numpy'])
+        val_aprox = trapecio_compuesto(f_vec, a, b, n)
     else:
         print("Opción inválida")
         return
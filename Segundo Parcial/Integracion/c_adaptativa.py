@@ -1,6 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import math
+import heapq
+import numpy as np
+from Evaluar_Funcion import evaluar_funcion_vectorizada
 
 class CuadraturaAdaptativaWindow:
     def __init__(self, parent):
@@ -323,6 +326,60 @@ class CuadraturaAdaptativaWindow:
             )
             return left_result + right_result, max(left_nivel, right_nivel)
     
+    def cuadratura_adaptativa_global(self, a, b, error_max, funcion_str, max_evaluaciones=200000, lote=64):
+        """
+        Simpson adaptativo GLOBAL e iterativo.
+
+        - Cada subintervalo guarda f en sus 5 puntos (extremos, medio y cuartos),
+          su Simpson S, el de sus dos mitades S2 y el error |S2 - S| / 15.
+        - Un montículo (heapq) ordena los subintervalos por error: siempre se
+          divide el peor, no se reparte la tolerancia a ciegas.
+        - Al dividir, las mitades heredan 3 de sus 5 valores; solo se evalúan
+          2 puntos nuevos por mitad, y los de todo un lote en UNA llamada.
+        - Termina cuando la suma de errores <= error_max o se agota el
+          presupuesto de evaluaciones.
+        Retorna (integral, error_estimado, evaluaciones, subintervalos).
+        """
+        def simpson(h, f0, f1, f2):
+            return (h / 3) * (f0 + 4 * f1 + f2)
+
+        def crear(a_i, b_i, f0, f1, f2, f3, f4):
+            # f0..f4 en a, a+h/4, m, a+3h/4, b
+            h = (b_i - a_i) / 2
+            S = simpson(h, f0, f2, f4)
+            S2 = simpson(h / 2, f0, f1, f2) + simpson(h / 2, f2, f3, f4)
+            err = abs(S2 - S) / 15
+            # Corrección de Richardson en el valor
+            return (-err, a_i, b_i, (f0, f1, f2, f3, f4), S2 + (S2 - S) / 15, err)
+
+        x0 = np.linspace(a, b, 5)
+        valores = evaluar_funcion_vectorizada(x0, funcion_str, self.evaluar_funcion)
+        evaluaciones = 5
+        heap = [crear(a, b, *valores)]
+        error_total = heap[0][-1]
+
+        while error_total > error_max and evaluaciones < max_evaluaciones:
+            # Lote de los peores subintervalos
+            peores = [heapq.heappop(heap) for _ in range(min(lote, len(heap)))]
+            nuevos_x = []
+            for _, a_i, b_i, _, _, _ in peores:
+                q = (b_i - a_i) / 8
+                nuevos_x.extend([a_i + q, a_i + 3 * q, a_i + 5 * q, a_i + 7 * q])
+            nuevos_f = evaluar_funcion_vectorizada(np.array(nuevos_x), funcion_str, self.evaluar_funcion)
+            evaluaciones += len(nuevos_x)
+
+            for k, (_, a_i, b_i, (f0, f1, f2, f3, f4), _, _) in enumerate(peores):
+                g = nuevos_f[4 * k:4 * k + 4]
+                m = (a_i + b_i) / 2
+                heapq.heappush(heap, crear(a_i, m, f0, g[0], f1, g[1], f2))
+                heapq.heappush(heap, crear(m, b_i, f2, g[2], f3, g[3], f4))
+
+            # Suma exacta (fsum) para que el criterio no arrastre redondeo
+            error_total = math.fsum(item[-1] for item in heap)
+
+        integral = math.fsum(item[4] for item in heap)
+        return integral, error_total, evaluaciones, len(heap)
+
     def calcular(self):
         """Ejecutar cuadratura adaptativa"""
         try:
@@ -353,7 +410,7 @@ class CuadraturaAdaptativaWindow:
                 return
             
             # Calcular integral adaptativa
-            resultado, niveles = self.cuadratura_adaptativa_rec(a, b, error, funcion)
+            resultado, error_est, evaluaciones, subintervalos = self.cuadratura_adaptativa_global(a, b, error, funcion)
             
             # Mostrar resultados
             self.result_text.delete(1.0, tk.END)
@@ -365,7 +422,9 @@ class CuadraturaAdaptativaWindow:
             self.result_text.insert(tk.END, f"Error máximo: {error:.2e}\n\n")
             self.result_text.insert(tk.END, f"════════════════════════════════════════\n")
             self.result_text.insert(tk.END, f"Valor de la integral: {resultado:.10f}\n")
-            self.result_text.insert(tk.END, f"Niveles de recursión: {niveles}\n")
+            self.result_text.insert(tk.END, f"Error estimado: {error_est:.2e}\n")
+            self.result_text.insert(tk.END, f"Evaluaciones de f: {evaluaciones}\n")
+            self.result_text.insert(tk.END, f"Subintervalos: {subintervalos}\n")
             self.result_text.insert(tk.END, f"════════════════════════════════════════\n")
             
             # Colorizar resultado
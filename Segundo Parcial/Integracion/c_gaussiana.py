@@ -1,6 +1,8 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import math
+from Gauss_Legendre import nodos_pesos_legendre, gauss_legendre_compuesta
+from Evaluar_Funcion import evaluar_funcion_vectorizada
 
 class CuadraturaGaussianaWindow:
     def __init__(self, parent):
@@ -17,21 +19,10 @@ class CuadraturaGaussianaWindow:
         # Configurar eventos
         self.setup_events()
         
-        # Coeficientes de Gauss-Legendre predefinidos
-        self.coeficientes = {
-            2: {
-                'nodos': [-0.5773502692, 0.5773502692],
-                'pesos': [1.0, 1.0]
-            },
-            3: {
-                'nodos': [-0.7745966692, 0.0, 0.7745966692],
-                'pesos': [0.5555555556, 0.8888888889, 0.5555555556]
-            },
-            4: {
-                'nodos': [-0.8611363116, -0.3399810436, 0.3399810436, 0.8611363116],
-                'pesos': [0.3478548451, 0.6521451549, 0.6521451549, 0.3478548451]
-            }
-        }
+    def obtener_coeficientes(self, grado):
+        """Nodos y pesos de Gauss-Legendre para cualquier número de puntos (en caché)"""
+        nodos, pesos = nodos_pesos_legendre(grado)
+        return {'nodos': nodos, 'pesos': pesos}
     
     def setup_styles(self):
         """Configurar estilos"""
@@ -168,10 +159,9 @@ class CuadraturaGaussianaWindow:
         self.grado_combo = ttk.Combobox(
             params_frame,
             textvariable=self.grado_var,
-            values=["2", "3", "4"],
+            values=["2", "3", "4", "5", "6", "8", "10", "16", "20", "32", "64"],
             font=("Arial", 11),
-            width=10,
-            state="readonly"
+            width=10
         )
         self.grado_combo.grid(row=1, column=3, padx=(0, 15), pady=10, sticky=tk.W)
         self.grado_combo.set("3")
@@ -180,10 +170,9 @@ class CuadraturaGaussianaWindow:
         info_frame = tk.Frame(main_frame, bg=self.bg_color)
         info_frame.pack(fill=tk.X, pady=(0, 15))
         
-        info_text = "Grados disponibles:\n" \
-                   "• Grado 2: 2 puntos de Gauss, exacto para polinomios hasta grado 3\n" \
-                   "• Grado 3: 3 puntos de Gauss, exacto para polinomios hasta grado 5\n" \
-                   "• Grado 4: 4 puntos de Gauss, exacto para polinomios hasta grado 7"
+        info_text = "Cualquier número de puntos n (se puede escribir en la lista):\n" \
+                   "• n puntos de Gauss son exactos para polinomios hasta grado 2n - 1\n" \
+                   "• Nodos y pesos en precisión doble completa, calculados una vez por n"
         
         info_label = tk.Label(
             info_frame,
@@ -347,10 +336,19 @@ class CuadraturaGaussianaWindow:
         """Transformar punto de [-1,1] a [a,b]"""
         return ((b - a) * x + (a + b)) / 2
     
+    def cuadratura_gaussiana_vectorizada(self, a, b, n_intervalos, grado, funcion_str):
+        """Cuadratura gaussiana compuesta: todos los nodos en una llamada a la función"""
+        try:
+            f = lambda X: evaluar_funcion_vectorizada(X, funcion_str, self.evaluar_funcion)
+            return gauss_legendre_compuesta(f, a, b, n_intervalos, grado)
+        except Exception:
+            # Respaldo: versión punto a punto
+            return self.cuadratura_gaussiana(a, b, n_intervalos, grado, funcion_str)
+
     def cuadratura_gaussiana(self, a, b, n_intervalos, grado, funcion_str):
         """Aplicar cuadratura gaussiana compuesta"""
         # Obtener coeficientes para el grado seleccionado
-        coef = self.coeficientes[grado]
+        coef = self.obtener_coeficientes(grado)
         nodos = coef['nodos']
         pesos = coef['pesos']
         
@@ -401,8 +399,8 @@ class CuadraturaGaussianaWindow:
                 messagebox.showerror("Error", "El número de intervalos debe ser positivo")
                 return
             
-            if grado not in [2, 3, 4]:
-                messagebox.showerror("Error", "El grado debe ser 2, 3 o 4")
+            if grado < 1:
+                messagebox.showerror("Error", "El número de puntos debe ser al menos 1")
                 return
             
             # Verificar que la función es evaluable
@@ -413,10 +411,7 @@ class CuadraturaGaussianaWindow:
                 return
             
             # Calcular integral
-            resultado = self.cuadratura_gaussiana(a, b, n, grado, funcion)
-            
-            # Obtener coeficientes para mostrar
-            coef = self.coeficientes[grado]
+            resultado = self.cuadratura_gaussiana_vectorizada(a, b, n, grado, funcion)
             
             # Mostrar resultados
             self.result_text.delete(1.0, tk.END)
@@ -445,11 +440,11 @@ class CuadraturaGaussianaWindow:
         """Mostrar puntos y pesos de Gauss"""
         try:
             grado = int(self.grado_combo.get())
-            coef = self.coeficientes[grado]
+            coef = self.obtener_coeficientes(grado)
             
             puntos_window = tk.Toplevel(self.parent)
             puntos_window.title(f"Puntos y Pesos - Grado {grado}")
-            puntos_window.geometry("400x300")
+            puntos_window.geometry("560x300")
             puntos_window.configure(bg="#f5f5f5")
             
             # Título
@@ -478,7 +473,8 @@ class CuadraturaGaussianaWindow:
                 ).grid(row=0, column=col, padx=2, pady=5)
             
             # Datos
-            for i in range(grado):
+            # Con muchos puntos solo se muestran los primeros 20
+            for i in range(min(grado, 20)):
                 tk.Label(
                     table_frame,
                     text=f"{i+1}",
@@ -490,20 +486,20 @@ class CuadraturaGaussianaWindow:
                 
                 tk.Label(
                     table_frame,
-                    text=f"{coef['nodos'][i]:.10f}",
+                    text=f"{coef['nodos'][i]:.16f}",
                     font=("Courier New", 9),
                     fg="#2980b9",
                     bg="#f5f5f5",
-                    width=15
+                    width=22
                 ).grid(row=i+1, column=1, padx=2, pady=3)
                 
                 tk.Label(
                     table_frame,
-                    text=f"{coef['pesos'][i]:.10f}",
+                    text=f"{coef['pesos'][i]:.16f}",
                     font=("Courier New", 9),
                     fg="#27ae60",
                     bg="#f5f5f5",
-                    width=15
+                    width=22
                 ).grid(row=i+1, column=2, padx=2, pady=3)
             
             # Botón cerrar
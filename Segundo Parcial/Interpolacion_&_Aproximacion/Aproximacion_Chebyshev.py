@@ -0,0 +1,202 @@
+import numpy as np
+from Metodo_Neville import evaluar_funcion_usuario, solicitar_float
+
+# --- 1. TRANSFORMADA (DCT-I VÍA FFT, O(n log n)) ---
+def puntos_chebyshev(n, a=-1.0, b=1.0):
+    """Puntos de Chebyshev-Lobatto x_j = cos(πj/n), j = 0..n, en [a, b]."""
+    x = np.cos(np.pi * np.arange(n + 1) / n)
+    return (a + b) / 2 + (b - a) / 2 * x
+
+def valores_a_coeficientes(v):
+    """Valores en los puntos de Chebyshev -> coeficientes c_k de Σ c_k T_k."""
+    v = np.asarray(v, dtype=float)
+    n = len(v) - 1
+    if n == 0:
+        return v.copy()
+    extendido = np.concatenate([v, v[n-1:0:-1]])
+    c = np.real(np.fft.fft(extendido))[:n + 1] / n
+    c[0] /= 2
+    c[n] /= 2
+    return c
+
+def clenshaw(c, t):
+    """Σ c_k T_k(t) con la recurrencia de Clenshaw (t escalar o arreglo)."""
+    t = np.asarray(t, dtype=float)
+    b1 = np.zeros_like(t)
+    b2 = np.zeros_like(t)
+    for ck in c[:0:-1]:
+        b1, b2 = ck + 2 * t * b1 - b2, b1
+    return c[0] + t * b1 - b2
+
+# --- 2. APROXIMANTE ---
+class AproximacionChebyshev:
+    """
+    f(x) ≈ Σ_{k=0}^{n} c_k T_k(t),   t = (2x - a - b) / (b - a)
+
+    El grado se duplica (16, 32, 64, ...) hasta que los últimos coeficientes
+    caen por debajo de tol·max|c_k|; después se recortan los que sobran.
+    """
+
+    def __init__(self, funcion=None, a=-1.0, b=1.0, tol=1e-14, n_max=65536, coeficientes=None):
+        if b <= a:
+            raise ValueError("Se requiere a < b")
+        self.a = float(a)
+        self.b = float(b)
+        self.tol = tol
+        self.convergio = True
+
+        if coeficientes is not None:
+            self.c = np.asarray(coeficientes, dtype=float)
+            return
+
+        f = funcion if callable(funcion) else (lambda x: evaluar_funcion_usuario(funcion, x))
+        n = 16
+        while True:
+            valores = np.broadcast_to(f(puntos_chebyshev(n, a, b)), (n + 1,))
+            c = valores_a_coeficientes(valores)
+            escala = max(np.max(np.abs(c)), np.finfo(float).tiny)
+            if np.all(np.abs(c[-3:]) <= tol * escala) or n >= n_max:
+                self.convergio = n < n_max or np.all(np.abs(c[-3:]) <= tol * escala)
+                break
+            n *= 2
+
+        # Recorte: último coeficiente significativo
+        significativos = np.nonzero(np.abs(c) > tol * escala)[0]
+        self.c = c[:significativos[-1] + 1] if len(significativos) else c[:1]
+
+    @property
+    def grado(self):
+        return len(self.c) - 1
+
+    def _t(self, x):
+        return (2 * np.asarray(x, dtype=float) - self.a - self.b) / (self.b - self.a)
+
+    def evaluar(self, x_val):
+        p = clenshaw(self.c, self._t(x_val))
+        return float(p) if p.ndim == 0 else p
+
+    __call__ = evaluar
+
+    def derivada(self):
+        """Aproximante de f' (recurrencia c'_{k-1} = c'_{k+1} + 2k·c_k)."""
+        n = self.grado
+        if n == 0:
+            return AproximacionChebyshev(a=self.a, b=self.b, coeficientes=[0.0])
+        k = np.arange(n + 1)
+        w = 2 * k * self.c
+        R = np.empty_like(w)
+        R[0::2] = np.cumsum(w[0::2][::-1])[::-1]
+        R[1::2] = np.cumsum(w[1::2][::-1])[::-1]
+        d = R[1:].copy()
+        d[0] /= 2
+        return AproximacionChebyshev(a=self.a, b=self.b, coeficientes=d * 2 / (self.b - self.a))
+
+    def primitiva(self):
+        """Aproximante de F(x) = ∫_a^x f (coeficientes (c_{k-1} - c_{k+1}) / 2k)."""
+        c = np.concatenate([self.c, [0.0, 0.0]])
+        n = self.grado + 1
+        C = np.zeros(n + 1)
+        k = np.arange(1, n + 1)
+        C[1:] = (c[:n] - c[2:n + 2]) / (2 * k)
+        C[1] = (2 * c[0] - c[2]) / 2
+        C *= (self.b - self.a) / 2
+        # Constante para que F(a) = 0 (T_k(-1) = (-1)^k)
+        C[0] = -np.sum(C[1:] * (-1.0) ** k)
+        return AproximacionChebyshev(a=self.a, b=self.b, coeficientes=C)
+
+    def integral(self):
+        """∫_a^b f(x) dx = Σ c_k ∫ T_k (solo términos pares)."""
+        k = np.arange(0, self.grado + 1, 2)
+        return (self.b - self.a) / 2 * np.sum(self.c[k] * 2 / (1 - k**2))
+
+    def raices(self, grado_max=50):
+        """
+        Raíces reales en [a, b] con la matriz colega (eigenvalores).
+        Una raíz doble (f no cambia de signo, p. ej. x**2 en 0) da un par
+        de eigenvalores casi complejos que se descarta; por eso también se
+        revisan los puntos críticos (raíces de f') donde |f| ≈ 0.
+        """
+        simples = self._raices_simples(grado_max)
+        criticos = self.derivada()._raices_simples(grado_max) if self.grado > 1 else np.array([])
+        umbral = 1e3 * np.finfo(float).eps * max(np.max(np.abs(self.c)), np.finfo(float).tiny)
+        multiples = criticos[np.abs(np.broadcast_to(self.evaluar(criticos), criticos.shape)) <= umbral]
+
+        r = np.sort(np.concatenate([simples, multiples]))
+        # Una raíz múltiple puede aparecer más de una vez (casi repetida)
+        distintas = np.concatenate([[True], np.diff(r) > 1e-7 * (self.b - self.a)]) if len(r) else []
+        return r[distintas]
+
+    def _raices_simples(self, grado_max):
+        """
+        Eigenvalores reales de la matriz colega. Si el grado es alto, se
+        subdivide el intervalo (remuestreando el aproximante) para que cada
+        matriz sea pequeña.
+        """
+        if self.grado > grado_max:
+            m = (self.a + self.b) / 2
+            izq = AproximacionChebyshev(self.evaluar, self.a, m, self.tol)
+            der = AproximacionChebyshev(self.evaluar, m, self.b, self.tol)
+            r = np.concatenate([izq._raices_simples(grado_max), der._raices_simples(grado_max)])
+            return np.unique(np.round(r, 14))
+
+        c = self.c.copy()
+        escala = np.max(np.abs(c)) if len(c) else 0.0
+        # Se quitan coeficientes finales despreciables
+        while len(c) > 1 and abs(c[-1]) <= self.tol * escala:
+            c = c[:-1]
+        n = len(c) - 1
+        if n < 1:
+            return np.array([])
+        if n == 1:
+            t = np.array([-c[0] / c[1]])
+        else:
+            C = np.zeros((n, n))
+            C[0, 1] = 1.0
+            idx = np.arange(1, n - 1)
+            C[idx, idx - 1] = 0.5
+            C[idx, idx + 1] = 0.5
+            C[n-1, n-2] = 0.5
+            C[n-1, :] -= c[:n] / (2 * c[n])
+            t = np.linalg.eigvals(C)
+
+        t = np.real(t[np.abs(np.imag(t)) < 1e-8])
+        t = np.sort(t[np.abs(t) <= 1 + 1e-10].clip(-1, 1))
+        return (self.a + self.b) / 2 + (self.b - self.a) / 2 * t
+
+# --- 3. FUNCIÓN PRINCIPAL ---
+def main():
+    print("==========================================")
+    print("     APROXIMACIÓN DE CHEBYSHEV (DCT)       ")
+    print("==========================================\n")
+
+    try:
+        funcion_str = input("Función f(x) (ej. exp(x)*sin(5*x), 1/(1+25*x^2)): ")
+        a = solicitar_float("Límite inferior a: ")
+        b = solicitar_float("Límite superior b: ")
+        tol = input("Tolerancia (Enter = 1e-14): ")
+        tol = float(tol) if tol else 1e-14
+        aprox = AproximacionChebyshev(funcion_str, a, b, tol)
+    except Exception as e:
+        print(f"Error: {e}")
+        return
+
+    print(f"\nGrado necesario: {aprox.grado}" + ("" if aprox.convergio else "  (⚠️ no alcanzó la tolerancia)"))
+    print("Primeros coeficientes c_k:")
+    for k, ck in enumerate(aprox.c[:8]):
+        print(f"   c_{k:<3} = {ck: .12e}")
+    if aprox.grado >= 8:
+        print(f"   ...  |c_{aprox.grado}| = {abs(aprox.c[-1]):.2e}")
+
+    print(f"\n∫ f(x) dx en [{a}, {b}] ≈ {aprox.integral():.14f}")
+    raices = aprox.raices()
+    print(f"Raíces en [{a}, {b}]: " + (", ".join(f"{r:.12f}" for r in raices) if len(raices) else "ninguna"))
+
+    x_input = input("\n¿En qué punto 'x' deseas evaluar? (Enter para salir): ")
+    if x_input:
+        x_val = float(x_input)
+        print(f"   p({x_val})  = {aprox(x_val):.14f}")
+        print(f"   p'({x_val}) = {aprox.derivada()(x_val):.14f}")
+        print(f"   Error Real: {abs(evaluar_funcion_usuario(funcion_str, x_val) - aprox(x_val)):.3e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+import numpy as np
+from numpy.polynomial import chebyshev as C
+from Metodo_Neville import evaluar_funcion_usuario, solicitar_float
+from Evaluacion_Horner import horner_taylor
+
+# --- 1. LÓGICA MATEMÁTICA (INTERCAMBIO DE REMEZ) ---
+def _extremos_alternantes(e, n_ref):
+    """
+    Extremos locales de e(x) en la malla: un máximo de |e| por cada tramo de
+    signo constante (np.maximum.reduceat). Si sobran, se descartan los
+    extremos de menor |e| en las orillas hasta quedarse con n_ref; si faltan
+    (referencia simétrica con E = 0), se agregan los extremos del intervalo.
+    """
+    signo = np.sign(e)
+    signo[signo == 0] = 1
+    inicios = np.concatenate([[0], np.nonzero(np.diff(signo))[0] + 1])
+    maximos = np.maximum.reduceat(np.abs(e), inicios)
+    # Índice del máximo dentro de cada tramo
+    tramo = np.repeat(np.arange(len(inicios)), np.diff(np.append(inicios, len(e))))
+    es_max = np.abs(e) == maximos[tramo]
+    primero = np.full(len(inicios), -1)
+    idx_max = np.nonzero(es_max)[0]
+    primero[tramo[idx_max[::-1]]] = idx_max[::-1]
+    idx = primero
+
+    if len(idx) < n_ref and idx[0] != 0:
+        idx = np.concatenate([[0], idx])
+    if len(idx) < n_ref and idx[-1] != len(e) - 1:
+        idx = np.concatenate([idx, [len(e) - 1]])
+    while len(idx) > n_ref:
+        if abs(e[idx[0]]) < abs(e[idx[-1]]):
+            idx = idx[1:]
+        else:
+            idx = idx[:-1]
+    return idx
+
+class AproximacionMinimax:
+    """
+    Polinomio p de grado n que minimiza max |f(x) - p(x)| en [a, b].
+
+    1. Referencia inicial: n+2 extremos de Chebyshev (cos(πk/(n+1))).
+    2. Se resuelve  p(x_i) + (-1)^i E = f(x_i)  (p en base de Chebyshev).
+    3. Se buscan los extremos del error en una malla densa (vectorizado),
+       se refinan localmente y se intercambia la referencia.
+    4. Se repite hasta que max|f - p| ≈ |E| (error equioscilante) o hasta
+       que la diferencia cae al nivel del redondeo; si el error deja de
+       bajar se detiene y se queda con el mejor iterado.
+    """
+
+    def __init__(self, funcion, a, b, grado, tol=1e-6, max_iter=50, puntos_malla=None):
+        if b <= a:
+            raise ValueError("Se requiere a < b")
+        self.f = funcion if callable(funcion) else (lambda x: evaluar_funcion_usuario(funcion, x))
+        self.a, self.b = float(a), float(b)
+        self.grado = grado
+        n_ref = grado + 2
+        m = puntos_malla or max(4000, 200 * n_ref)
+
+        malla_t = np.cos(np.pi * np.arange(m)[::-1] / (m - 1))    # más densa en los bordes
+        malla_x = self._x(malla_t)
+        f_malla = self._evaluar_f(malla_x)
+
+        t_ref = np.cos(np.pi * np.arange(n_ref)[::-1] / (n_ref - 1))
+        signos = (-1.0) ** np.arange(n_ref)
+        # Piso de redondeo: por debajo, la equioscilación ya no se puede medir
+        piso = 16 * np.finfo(float).eps * max(float(np.max(np.abs(f_malla))), np.finfo(float).tiny)
+        self.historial = []
+        mejor = None
+        sin_mejora = 0
+        self.convergio = False
+        for self.iteraciones in range(1, max_iter + 1):
+            # Sistema (n+2) × (n+2): [T_0..T_n | (-1)^i]
+            A = np.column_stack([C.chebvander(t_ref, grado), signos])
+            sol = np.linalg.solve(A, self._evaluar_f(self._x(t_ref)))
+            c, E = sol[:-1], sol[-1]
+
+            error = f_malla - C.chebval(malla_t, c)
+            error_max = float(np.max(np.abs(error)))
+            self.historial.append((abs(E), error_max))
+
+            # Se conserva el mejor iterado (cerca del redondeo el intercambio puede divergir)
+            if mejor is None or error_max < mejor[2]:
+                mejor = (c, E, error_max)
+                sin_mejora = 0
+            else:
+                sin_mejora += 1
+
+            if error_max - abs(E) <= max(tol * error_max, piso):
+                self.convergio = True
+                break
+            if sin_mejora >= 3:
+                break
+
+            self.c = c
+            idx = _extremos_alternantes(error, n_ref)
+            t_nueva = self._refinar(malla_t, idx)
+            if len(t_nueva) == n_ref:
+                t_ref = t_nueva
+
+        self.c, self.E, self.error_max = mejor
+        # Sin mejora pero ya en el redondeo: no hay nada más que ganar
+        self.convergio = self.convergio or self.error_max <= piso
+        self._coeficientes_potencias()
+
+    def _x(self, t):
+        return (self.a + self.b) / 2 + (self.b - self.a) / 2 * t
+
+    def _evaluar_f(self, x):
+        return np.broadcast_to(self.f(x), np.shape(x)).astype(float)
+
+    def _refinar(self, malla_t, idx):
+        """Malla fina alrededor de cada extremo (todas a la vez: n_ref × 101)."""
+        izq = malla_t[np.maximum(idx - 1, 0)]
+        der = malla_t[np.minimum(idx + 1, len(malla_t) - 1)]
+        fino = izq[:, None] + (der - izq)[:, None] * np.linspace(0, 1, 101)
+        error = self._evaluar_f(self._x(fino)) - C.chebval(fino, self.c)
+        mejor = np.argmax(np.abs(error), axis=1)
+        return fino[np.arange(len(idx)), mejor]
+
+    def _coeficientes_potencias(self):
+        """Coeficientes en potencias de (x - centro), listos para Horner."""
+        self.centro = (self.a + self.b) / 2
+        escala = 2 / (self.b - self.a)
+        potencias_t = C.cheb2poly(self.c)
+        self.coeficientes = potencias_t * escala ** np.arange(len(potencias_t))
+
+    def evaluar(self, x_val):
+        return horner_taylor(self.coeficientes, self.centro, x_val)
+
+    __call__ = evaluar
+
+    def codigo_python(self, nombre="f_aprox"):
+        """Fuente de una función independiente con la forma de Horner desplegada."""
+        coef = [repr(float(ck)) for ck in self.coeficientes]
+        cuerpo = coef[-1]
+        for ck in reversed(coef[:-1]):
+            cuerpo = f"{ck} + t * ({cuerpo})"
+        return (f"def {nombre}(x):\n"
+                f"    # Minimax grado {self.grado} en [{self.a}, {self.b}], error máx ≈ {self.error_max:.3e}\n"
+                f"    t = x - {self.centro!r}\n"
+                f"    return {cuerpo}\n")
+
+def grado_minimo(funcion, a, b, error_objetivo, grado_max=40):
+    """Menor grado cuyo minimax alcanza el error objetivo (o None)."""
+    for grado in range(grado_max + 1):
+        aprox = AproximacionMinimax(funcion, a, b, grado)
+        if aprox.error_max <= error_objetivo:
+            return aprox
+    return None
+
+# --- 2. FUNCIÓN PRINCIPAL ---
+def main():
+    print("==========================================")
+    print("   APROXIMACIÓN MINIMAX (REMEZ)            ")
+    print("==========================================\n")
+
+    try:
+        funcion_str = input("Función f(x) (ej. exp(x), sin(x)/x, sqrt(x)): ")
+        evaluar_funcion_usuario(funcion_str, 1.0)
+        a = solicitar_float("Límite inferior a: ")
+        b = solicitar_float("Límite superior b: ")
+        print("\n  [1] Dar el GRADO del polinomio")
+        print("  [2] Dar el ERROR objetivo (se busca el menor grado)")
+        if input("Opción: ") == "2":
+            objetivo = solicitar_float("   Error máximo permitido: ")
+            aprox = grado_minimo(funcion_str, a, b, objetivo)
+            if aprox is None:
+                print("   ⚠️ Ningún grado hasta 40 alcanza ese error.")
+                return
+        else:
+            aprox = AproximacionMinimax(funcion_str, a, b, int(solicitar_float("   Grado n: ")))
+    except Exception as e:
+        print(f"\n❌ Ocurrió un error: {e}")
+        return
+
+    print(f"\nGrado: {aprox.grado}   Iteraciones: {aprox.iteraciones}" + ("" if aprox.convergio else "  (⚠️ sin convergencia)"))
+    print(f"Error nivelado |E| = {abs(aprox.E):.6e}   max|f - p| = {aprox.error_max:.6e}")
+    print(f"\nCoeficientes en potencias de (x - {aprox.centro}):")
+    for k, ck in enumerate(aprox.coeficientes):
+        print(f"   a_{k:<3} = {ck: .16e}")
+
+    print("\n--- Evaluador (Horner) ---")
+    print(aprox.codigo_python())
+
+    x_input = input("¿En qué punto 'x' deseas evaluar? (Enter para salir): ")
+    if x_input:
+        x_val = float(x_input)
+        print(f"   p({x_val}) = {aprox(x_val):.14f}")
+        print(f"   Error Real: {abs(evaluar_funcion_usuario(funcion_str, x_val) - aprox(x_val)):.3e}")
+
+if __name__ == "__main__":
+    main()
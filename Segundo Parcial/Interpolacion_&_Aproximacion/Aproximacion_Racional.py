@@ -0,0 +1,176 @@
+import numpy as np
+import sympy as sp
+from Series_Taylor import coeficientes_taylor
+from Evaluacion_Horner import horner_taylor
+from Metodo_Neville import evaluar_funcion_usuario, solicitar_float
+
+# --- 1. PADÉ [L/M] A PARTIR DE LOS COEFICIENTES DE TAYLOR ---
+def coeficientes_pade(c, L, M):
+    """
+    R(x) = P_L(t) / Q_M(t),  t = x - x0,  Q(0) = 1,  con  Q·f - P = O(t^{L+M+1}).
+
+    Denominador (sistema de Toeplitz M × M):
+        Σ_{j=1}^{M} q_j c_{L+k-j} = -c_{L+k},   k = 1..M   (c_i = 0 si i < 0)
+    Numerador:
+        p_k = Σ_{j=0}^{min(k, M)} q_j c_{k-j},  k = 0..L
+    """
+    c = np.asarray(c, dtype=float)
+    if len(c) < L + M + 1:
+        raise ValueError(f"Se requieren {L + M + 1} coeficientes de Taylor.")
+    cc = lambda i: c[i] if i >= 0 else 0.0
+
+    q = np.ones(M + 1)
+    if M > 0:
+        A = np.array([[cc(L + k - j) for j in range(1, M + 1)] for k in range(1, M + 1)])
+        b = -c[L + 1:L + M + 1]
+        # lstsq: si el sistema es singular (bloques de la tabla de Padé) da la solución mínima
+        q[1:] = np.linalg.lstsq(A, b, rcond=None)[0]
+
+    p = np.array([sum(q[j] * cc(k - j) for j in range(min(k, M) + 1)) for k in range(L + 1)])
+    return p, q
+
+class AproximantePade:
+    """Padé [L/M] de f alrededor de x0; se evalúa con Horner en numerador y denominador."""
+
+    def __init__(self, funcion_str, x0, L, M):
+        x = sp.symbols('x')
+        f = sp.sympify(funcion_str.replace("^", "**"), locals={'e': sp.E})
+        self.x0 = float(x0)
+        self.L, self.M = L, M
+        self.taylor, self.metodo = coeficientes_taylor(f, x, self.x0, L + M)
+        self.p, self.q = coeficientes_pade(self.taylor, L, M)
+
+    def evaluar(self, x_val):
+        return horner_taylor(self.p, self.x0, x_val) / horner_taylor(self.q, self.x0, x_val)
+
+    __call__ = evaluar
+
+    def evaluar_taylor(self, x_val):
+        """Taylor del mismo orden L+M (para comparar)."""
+        return horner_taylor(self.taylor, self.x0, x_val)
+
+    def polos(self):
+        """Ceros reales del denominador (donde R no es válido)."""
+        if self.M == 0:
+            return np.array([])
+        raices = np.roots(self.q[::-1])
+        return np.sort(raices[np.abs(raices.imag) < 1e-12].real + self.x0)
+
+# --- 2. INTERPOLACIÓN RACIONAL (BULIRSCH-STOER) ---
+def interpolacion_racional(x_points, y_points, x_vals, tam_bloque=65536):
+    """
+    Tabla de Bulirsch-Stoer (análoga a Neville, pero con funciones racionales
+    de grado diagonal), para muchos puntos a la vez: las columnas C y D de
+    correcciones son matrices (puntos × n).
+    Retorna (valores, error_estimado) con error = última corrección.
+    El interpolante racional puede tener polos dentro del intervalo (o no
+    existir, p. ej. si f ya es racional de grado menor): se refleja en
+    valores inf/nan o en un error estimado grande.
+    """
+    xs = np.asarray(x_points, dtype=float)
+    ys = np.asarray(y_points, dtype=float)
+    n = len(xs)
+    if len(np.unique(xs)) != n:
+        raise ValueError("¡Error! Puntos x repetidos.")
+    TINY = 1e-25
+
+    xq = np.asarray(x_vals, dtype=float)
+    plano = xq.ravel()
+    valores = np.empty_like(plano)
+    errores = np.zeros_like(plano)
+
+    for b in range(0, len(plano), tam_bloque):
+        X = plano[b:b + tam_bloque]
+        filas = np.arange(len(X))
+        dist = np.abs(X[:, None] - xs)
+        ns = np.argmin(dist, axis=1)                # nodo más cercano a cada x
+        C = np.tile(ys, (len(X), 1))
+        D = C + TINY                                # evita 0/0 en la primera columna
+        y = ys[ns].copy()
+        ns = ns - 1
+        dy = np.zeros_like(X)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for m in range(1, n):
+                w = C[:, 1:n-m+1] - D[:, :n-m]
+                h = xs[m:n] - X[:, None]
+                t = (xs[:n-m] - X[:, None]) * D[:, :n-m] / h
+                # w = 0: la columna ya es exacta (f racional de grado menor), corrección nula.
+                # Si solo el denominador es 0 hay un polo en x (dd infinito).
+                dd = np.where(w == 0, 0.0, w / (t - C[:, 1:n-m+1]))
+                D[:, :n-m] = C[:, 1:n-m+1] * dd
+                C[:, :n-m] = t * dd
+                # Se avanza por la tabla hacia el camino más "centrado"
+                por_c = 2 * (ns + 1) < n - m
+                dy = np.where(por_c, C[filas, np.clip(ns + 1, 0, n - m - 1)], D[filas, np.clip(ns, 0, n - m - 1)])
+                ns = np.where(por_c, ns, ns - 1)
+                y += dy
+
+        # Si x coincide con un nodo el resultado es exacto
+        exacto = dist.min(axis=1) == 0
+        y[exacto] = ys[np.argmin(dist[exacto], axis=1)]
+        dy[exacto] = 0.0
+        valores[b:b + tam_bloque] = y
+        errores[b:b + tam_bloque] = np.abs(dy)
+
+    if xq.ndim == 0:
+        return float(valores[0]), float(errores[0])
+    return valores.reshape(xq.shape), errores.reshape(xq.shape)
+
+# --- 3. FUNCIÓN PRINCIPAL ---
+def main():
+    print("==========================================")
+    print("       APROXIMACIÓN RACIONAL              ")
+    print("==========================================\n")
+    print("  [1] PADÉ [L/M] (a partir de la serie de Taylor)")
+    print("  [2] INTERPOLACIÓN RACIONAL (Bulirsch-Stoer) con puntos")
+    modo = ""
+    while modo not in ["1", "2"]:
+        modo = input("Selecciona una opción (1 o 2): ")
+
+    if modo == "1":
+        try:
+            funcion_str = input("\nFunción f(x) (ej. exp(x), log(1+x), tan(x)): ")
+            x0 = solicitar_float("Punto centro x0: ")
+            L = int(solicitar_float("Grado del numerador L: "))
+            M = int(solicitar_float("Grado del denominador M: "))
+            pade = AproximantePade(funcion_str, x0, L, M)
+        except Exception as e:
+            print(f"\n❌ Ocurrió un error: {e}")
+            return
+
+        print(f"\nNumerador   p_k: {np.array2string(pade.p, precision=8)}")
+        print(f"Denominador q_k: {np.array2string(pade.q, precision=8)}")
+        polos = pade.polos()
+        if len(polos):
+            print(f"Polos reales: {', '.join(f'{p:.6f}' for p in polos)}")
+
+        a = solicitar_float("\nComparar desde x = ")
+        b = solicitar_float("hasta x = ")
+        xs = np.linspace(a, b, 11)
+        real = np.broadcast_to(evaluar_funcion_usuario(funcion_str, xs), xs.shape)
+        print(f"\n{'x':>10} | {'Padé':>16} | {'Error Padé':>11} | {'Error Taylor':>12}")
+        for xv, fv, rv, tv in zip(xs, real, pade(xs), pade.evaluar_taylor(xs)):
+            print(f"{xv:>10.4f} | {rv:>16.10f} | {abs(fv - rv):>11.3e} | {abs(fv - tv):>12.3e}")
+    else:
+        funcion_str = input("\nf(x) para calcular y (Enter para ingresar y a mano): ") or None
+        n = max(int(solicitar_float("¿Cuántos puntos? ")), 2)
+        x_points, y_points = [], []
+        for i in range(n):
+            xi = solicitar_float(f"   x[{i}]: ")
+            x_points.append(xi)
+            y_points.append(evaluar_funcion_usuario(funcion_str, xi) if funcion_str else solicitar_float(f"   y[{i}]: "))
+
+        x_val = solicitar_float("\n¿Qué valor de 'x' deseas interpolar? ")
+        try:
+            valor, error = interpolacion_racional(x_points, y_points, x_val)
+        except ValueError as e:
+            print(f"\n❌ Ocurrió un error: {e}")
+            return
+        print(f"   R({x_val}) = {valor:.10f}")
+        print(f"   Error estimado: {error:.4e}")
+        if funcion_str:
+            print(f"   Error Real: {abs(evaluar_funcion_usuario(funcion_str, x_val) - valor):.4e}")
+
+if __name__ == "__main__":
+    main()
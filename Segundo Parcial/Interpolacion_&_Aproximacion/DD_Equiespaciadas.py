@@ -2,6 +2,119 @@ import numpy as np
 import sympy as sp
 import pandas as pd
 import math
+from Evaluacion_Horner import horner_newton_gregory
+
+# --- DIFERENCIAS FINITAS CON ARREGLOS (MEMORIA O(n)) ---
+def diferencias_principales(y_datos, centro=None, max_orden=None):
+    """
+    Recorre Δ^k y con np.diff sucesivos; en cada momento solo vive un
+    arreglo de longitud n - k. Se guardan únicamente las diferencias que
+    usan las fórmulas de Newton-Gregory:
+
+    - 'adelante': Δ^k y_0
+    - 'atras':    ∇^k y_n = Δ^k y_{n-k}
+    - 'central':  por nivel k, (inicio, valores) con Δ^k y_i para
+                  i = centro - ⌈k/2⌉ ... centro - ⌊k/2⌋ + 1 (Stirling/Bessel)
+
+    Stirling usa todos los nodos cuando n es impar; Bessel, cuando n es par.
+    """
+    delta = np.asarray(y_datos, dtype=float)
+    n = len(delta)
+    if centro is None:
+        centro = (n - 1) // 2
+    orden = n - 1 if max_orden is None else min(max_orden, n - 1)
+
+    adelante, atras, central = [], [], []
+    for k in range(orden + 1):
+        if k > 0:
+            delta = np.diff(delta)
+        adelante.append(delta[0])
+        atras.append(delta[-1])
+
+        inicio = max(centro - (k + 1) // 2, 0)
+        fin = min(centro - k // 2 + 2, len(delta))
+        if inicio >= fin:
+            break
+        central.append((inicio, delta[inicio:fin].copy()))
+
+    return {'adelante': np.array(adelante), 'atras': np.array(atras),
+            'central': central, 'centro': centro}
+
+def evaluar_stirling(central, centro, x_centro, h, x_val):
+    """
+    Stirling (centrada en x_m), s = (x - x_m)/h:
+    P = y_m + s·μδy + s²/2!·δ²y + s(s²-1)/3!·μδ³y + s²(s²-1)/4!·δ⁴y + ...
+    """
+    s = (np.asarray(x_val, dtype=float) - x_centro) / h
+    p = np.full_like(s, central[0][1][0])
+    producto = s.copy()            # s·Π (s² - i²)
+    factorial = 1.0
+    for k in range(1, len(central)):
+        inicio, valores = central[k]
+        factorial *= k
+        j = (k + 1) // 2
+        # Δ^k y_{m-j}: posición dentro del tramo guardado
+        idx = centro - j - inicio
+        if k % 2 == 1:
+            # μδ^k: promedio de Δ^k y_{m-j} y Δ^k y_{m-j+1}
+            if idx < 0 or idx + 1 >= len(valores): break
+            p = p + producto / factorial * (valores[idx] + valores[idx + 1]) / 2
+        else:
+            if idx < 0 or idx >= len(valores): break
+            p = p + s * producto / factorial * valores[idx]
+            producto = producto * (s**2 - j**2)
+    return float(p) if p.ndim == 0 else p
+
+def evaluar_bessel(central, centro, x_centro, h, x_val):
+    """
+    Bessel (entre x_m y x_{m+1}), s = (x - x_m)/h, u = s - 1/2:
+    P = μy + u·δy + s(s-1)/2!·μδ²y + u·s(s-1)/3!·δ³y + ...
+    """
+    s = (np.asarray(x_val, dtype=float) - x_centro) / h
+    u = s - 0.5
+    nivel0 = central[0][1]
+    p = np.full_like(s, (nivel0[0] + nivel0[1]) / 2)
+    Q = np.ones_like(s)            # Π (s+i)(s-1-i)
+    factorial = 1.0
+    for k in range(1, len(central)):
+        inicio, valores = central[k]
+        factorial *= k
+        j = k // 2
+        # Δ^k y_{m-j}: posición dentro del tramo guardado
+        idx = centro - j - inicio
+        if k % 2 == 1:
+            if idx < 0 or idx >= len(valores): break
+            p = p + u * Q / factorial * valores[idx]
+        else:
+            Q = Q * (s + j - 1) * (s - j)
+            if idx < 0 or idx + 1 >= len(valores): break
+            p = p + Q / factorial * (valores[idx] + valores[idx + 1]) / 2
+    return float(p) if p.ndim == 0 else p
+
+def tabla_por_bloques(x_datos, y_datos, tam_bloque=1000, max_orden=None, filas=None):
+    """
+    Vista perezosa de la tabla completa: genera DataFrames de tam_bloque
+    filas. Para las filas [i0, i1) solo se necesita y[i0 : i1 + orden].
+    filas: rango opcional (i0, i1) para ver solo una parte.
+    """
+    x = np.asarray(x_datos, dtype=float)
+    y = np.asarray(y_datos, dtype=float)
+    n = len(y)
+    orden = n - 1 if max_orden is None else min(max_orden, n - 1)
+    i_ini, i_fin = (0, n) if filas is None else (max(filas[0], 0), min(filas[1], n))
+
+    for i0 in range(i_ini, i_fin, tam_bloque):
+        i1 = min(i0 + tam_bloque, i_fin)
+        tramo = y[i0:min(i1 + orden, n)]
+        columnas = {"i": np.arange(i0, i1), "xi": x[i0:i1], "y(x)": y[i0:i1]}
+        delta = tramo
+        for k in range(1, orden + 1):
+            delta = np.diff(delta)
+            col = np.full(i1 - i0, np.nan)
+            m = min(len(delta), i1 - i0)
+            col[:m] = delta[:m]
+            columnas[f"Delta^{k}"] = col
+        yield pd.DataFrame(columnas)
 
 def diferencias_finitas_equiespaciadas():
     print("\n=== INTERPOLACIÓN DE NEWTON-GREGORY (EQUIESPACIADA) ===")
@@ -68,67 +181,63 @@ def diferencias_finitas_equiespaciadas():
     else:
         print(f"\n[OK] Puntos equiespaciados detectados. Paso h = {h:.6f}")
 
-    # --- 3. Cálculo de Tabla de Diferencias Finitas (ADELANTE) ---
+    # --- 3. Cálculo de Diferencias Finitas (ADELANTE) ---
     # Aquí solo restamos y_{i+1} - y_i. NO dividimos entre h.
-    matriz_delta = np.zeros((n, n))
-    matriz_delta[:, 0] = y_datos
-
-    for j in range(1, n):
-        for i in range(n - j):
-            # Delta simple: Valor de abajo menos valor actual
-            matriz_delta[i, j] = matriz_delta[i+1, j-1] - matriz_delta[i, j-1]
+    # np.diff sucesivos: solo se guardan las diferencias que usa el polinomio.
+    difs = diferencias_principales(y_datos)
 
     # --- 4. Mostrar Tabla (Estilo Delta) ---
-    headers = ["i", "xi", "y(x)"] + [f"Delta^{k}" for k in range(1, n)]
-    tabla_visual = []
-    
-    for i in range(n):
-        fila = [i, x_datos[i], y_datos[i]]
-        for j in range(1, n):
-            if i < n - j: # Mostrar forma triangular superior invertida (estándar forward)
-                fila.append(matriz_delta[i, j])
-            else:
-                fila.append(None)
-        tabla_visual.append(fila)
-
-    df = pd.DataFrame(tabla_visual, columns=headers)
+    # Con muchos puntos solo se muestran las primeras y últimas filas
     pd.options.display.float_format = '{:.6f}'.format
+    max_filas = 30
+    if n <= max_filas:
+        partes = [pd.concat(tabla_por_bloques(x_datos, y_datos))]
+    else:
+        partes = [next(tabla_por_bloques(x_datos, y_datos, max_orden=10, filas=(0, 10))),
+                  next(tabla_por_bloques(x_datos, y_datos, max_orden=10, filas=(n - 10, n)))]
     
     print("\n" + "="*60)
     print(" TABLA DE DIFERENCIAS FINITAS (Forward) ")
     print("="*60)
-    print(df.fillna('').to_string(index=False))
+    for k, df in enumerate(partes):
+        if k > 0:
+            print("   ...")
+        print(df.astype(object).where(df.notna(), '').to_string(index=False))
     print("="*60)
 
     # --- 5. Construcción del Polinomio (Newton-Gregory) ---
     # P(s) = y0 + s*Delta0 + s(s-1)/2! * Delta^2 + ...
     # donde s = (x - x0) / h
     
-    coefs_delta = matriz_delta[0, :] # Primera fila (Diagonal superior)
-    pol_s = coefs_delta[0]
-    
-    # Construcción simbólica en función de 's'
-    termino_s = 1
-    factorial = 1
+    coefs_delta = difs['adelante'] # Primera fila (Diagonal superior)
+    x0 = x_datos[0]
     
-    for k in range(1, n):
-        termino_s *= (s_sym - (k-1)) # Genera s, s(s-1), s(s-1)(s-2)...
-        factorial *= k # k!
-        coef_k = coefs_delta[k]
+    # La forma simbólica (SymPy) solo se construye si se pide: con muchos
+    # nodos expandirla es lento y la evaluación no la necesita.
+    if input("\n¿Mostrar el polinomio simbólico? (s/n): ").lower() == 's':
+        pol_s = coefs_delta[0]
         
-        termino_actual = (coef_k / factorial) * termino_s
-        pol_s += termino_actual
+        # Construcción simbólica en función de 's'
+        termino_s = 1
+        factorial = 1
+        
+        for k in range(1, n):
+            termino_s *= (s_sym - (k-1)) # Genera s, s(s-1), s(s-1)(s-2)...
+            factorial *= k # k!
+            coef_k = coefs_delta[k]
+            
+            termino_actual = (coef_k / factorial) * termino_s
+            pol_s += termino_actual
 
-    # Convertimos s -> (x - x0)/h para mostrarlo en función de x
-    x0 = x_datos[0]
-    pol_x = pol_s.subs(s_sym, (x_sym - x0) / h)
+        # Convertimos s -> (x - x0)/h para mostrarlo en función de x
+        pol_x = pol_s.subs(s_sym, (x_sym - x0) / h)
 
-    print("\nPolinomio en función de 's' (s = (x - x0)/h):")
-    print(sp.pprint(pol_s))
-    
-    print("\nPolinomio expandido en función de 'x' (Simplificado):")
-    pol_expandido = sp.expand(pol_x)
-    print(sp.pprint(sp.Poly(pol_expandido, x_sym).as_expr()))
+        print("\nPolinomio en función de 's' (s = (x - x0)/h):")
+        print(sp.pprint(pol_s))
+        
+        print("\nPolinomio expandido en función de 'x' (Simplificado):")
+        pol_expandido = sp.expand(pol_x)
+        print(sp.pprint(sp.Poly(pol_expandido, x_sym).as_expr()))
 
     # --- 6. Evaluación ---
     try:
@@ -139,12 +248,26 @@ def diferencias_finitas_equiespaciadas():
             # Calculamos 's' para el punto deseado
             s_val = (x_val - x0) / h
             
-            # Evaluamos usando la fórmula en s (es más estable numéricamente)
-            f_eval_s = sp.lambdify(s_sym, pol_s)
-            res_aprox = f_eval_s(s_val)
+            # Evaluamos la fórmula en s en forma anidada (más estable y sin SymPy)
+            res_aprox = horner_newton_gregory(coefs_delta, x0, h, x_val)
+            
+            # Atrás da el mismo polinomio; las centrales usan una ventana simétrica:
+            # Stirling x_0..x_2m (n impar: todos), Bessel x_(n mod 2)..x_(n-1) (n par: todos)
+            xc = x_datos[difs['centro']]
+            res_atras = horner_newton_gregory(difs['atras'], x_datos[-1], h, x_val, hacia_atras=True)
+            res_stirling = evaluar_stirling(difs['central'], difs['centro'], xc, h, x_val)
+            res_bessel = evaluar_bessel(difs['central'], difs['centro'], xc, h, x_val)
+            n_nodos = len(x_datos)
+            fin_stirling = 2 * difs['centro']
+            inicio_bessel = n_nodos % 2
             
             print(f"\nResultados en x = {x_val} (s = {s_val:.4f}):")
-            print(f"Interpolación:        {res_aprox:.6f}")
+            print(f"Interpolación:        {res_aprox:.6f}   (nodos x_0..x_{n_nodos - 1})")
+            print(f"  Atrás:              {res_atras:.6f}   (nodos x_0..x_{n_nodos - 1})")
+            print(f"  Stirling (central): {res_stirling:.6f}   (nodos x_0..x_{fin_stirling}"
+                  + ("" if fin_stirling == n_nodos - 1 else f", {fin_stirling + 1} de {n_nodos}") + ")")
+            print(f"  Bessel (central):   {res_bessel:.6f}   (nodos x_{inicio_bessel}..x_{n_nodos - 1}"
+                  + ("" if inicio_bessel == 0 else f", {n_nodos - 1} de {n_nodos}") + ")")
             
             if f_func:
                 res_real = f_func(x_val)
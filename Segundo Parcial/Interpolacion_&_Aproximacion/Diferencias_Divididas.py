@@ -2,6 +2,96 @@ import numpy as np
 import sympy as sp
 import pandas as pd
 import math
+from Evaluacion_Horner import horner_newton, polinomio_newton_texto
+
+class TablaDiferenciasDivididas:
+    """
+    Tabla de diferencias divididas incremental (nodos que llegan uno a uno).
+
+    Solo se guarda la última diagonal de la tabla:
+        f[x_k], f[x_{k-1}, x_k], ..., f[x_0, ..., x_k]
+    Con ella, agregar un nodo cuesta O(n) y produce el nuevo coeficiente
+    de Newton f[x_0, ..., x_n] sin recalcular la tabla.
+
+    Hermite: un nodo puede repetirse (de forma consecutiva) si se conocen
+    sus derivadas; la diferencia con nodos iguales es
+        f[x_i, x_i, ..., x_i] (j+1 veces) = f^(j)(x_i) / j!
+    """
+
+    def __init__(self, x_datos=(), y_datos=()):
+        self.nodos = []
+        self.coeficientes = []   # f[x0], f[x0,x1], ..., f[x0..xn]
+        self._diagonal = []
+        self._derivadas = {}     # x -> [f(x), f'(x), f''(x), ...] (Hermite)
+        for xi, yi in zip(x_datos, y_datos):
+            self.agregar_nodo(xi, yi)
+
+    @classmethod
+    def hermite(cls, x_datos, valores):
+        """
+        Tabla de Hermite: valores[i] = [f(x_i), f'(x_i), ..., f^(m_i)(x_i)].
+        El nodo x_i se repite m_i + 1 veces.
+        """
+        tabla = cls()
+        for xi, vals in zip(x_datos, valores):
+            tabla.agregar_nodo_hermite(xi, vals)
+        return tabla
+
+    def agregar_nodo_hermite(self, x_nuevo, valores):
+        """Agrega x_nuevo con f y sus derivadas (len(valores) copias del nodo)."""
+        x_nuevo = float(x_nuevo)
+        if x_nuevo in self._derivadas:
+            raise ValueError(f"¡Error! El nodo x={x_nuevo} ya fue agregado.")
+        self._derivadas[x_nuevo] = [float(v) for v in valores]
+        for _ in valores:
+            self.agregar_nodo(x_nuevo, valores[0])
+
+    def __len__(self):
+        return len(self.nodos)
+
+    def agregar_nodo(self, x_nuevo, y_nuevo):
+        """Agrega (x_nuevo, y_nuevo) en O(n) y retorna el nuevo coeficiente."""
+        x_nuevo = float(x_nuevo)
+        n = len(self.nodos)
+        nueva = [float(y_nuevo)]
+        for j in range(1, n + 1):
+            denominador = x_nuevo - self.nodos[n - j]
+            if denominador == 0:
+                nueva.append(self._diferencia_repetida(x_nuevo, j))
+                continue
+            nueva.append((nueva[j - 1] - self._diagonal[j - 1]) / denominador)
+
+        self.nodos.append(x_nuevo)
+        self._diagonal = nueva
+        self.coeficientes.append(nueva[-1])
+        return nueva[-1]
+
+    def _diferencia_repetida(self, x_nuevo, j):
+        """f[x, ..., x] (j+1 veces) = f^(j)(x) / j!, sólo con repeticiones consecutivas."""
+        derivadas = self._derivadas.get(x_nuevo, [])
+        consecutivo = all(xk == x_nuevo for xk in self.nodos[len(self.nodos) - j:])
+        if j >= len(derivadas) or not consecutivo:
+            raise ValueError(f"¡Error! El nodo x={x_nuevo} está repetido.")
+        return derivadas[j] / math.factorial(j)
+
+    def evaluar(self, x_val):
+        """
+        Forma de Newton anidada (Horner) sobre escalares o arreglos:
+        P(x) = c0 + (x-x0)(c1 + (x-x1)(c2 + ...))
+        """
+        if not self.nodos:
+            raise ValueError("La tabla no tiene nodos.")
+        return horner_newton(self.coeficientes, self.nodos, x_val)
+
+    __call__ = evaluar
+
+    def polinomio_simbolico(self, expandir=False):
+        """Polinomio de SymPy (solo se construye si se pide)."""
+        x_sym = sp.symbols('x')
+        pol = sp.Float(self.coeficientes[-1])
+        for k in range(len(self.nodos) - 2, -1, -1):
+            pol = pol * (x_sym - self.nodos[k]) + self.coeficientes[k]
+        return sp.expand(pol) if expandir else pol
 
 def diferencias_divididas_formato_libro_corregido():
     print("\n=== GENERADOR DE TABLA (FORMATO IMAGEN 3.11) ===")
@@ -88,23 +178,8 @@ def diferencias_divididas_formato_libro_corregido():
     coefs_fwd = [matriz_calc[0, j] for j in range(n)]
     
     # 5.1 Construcción Texto (Para imprimir bonito)
-    pol_str = f"{coefs_fwd[0]:.7f}"
-    for j in range(1, n):
-        signo = " + " if coefs_fwd[j] >= 0 else " - "
-        val = abs(coefs_fwd[j])
-        terminos_x = "".join([f"(x - {x_datos[k]})" for k in range(j)])
-        pol_str += f"{signo}{val:.7f}{terminos_x}"
-
     print("\nPolinomio de Interpolación (Newton):")
-    print(pol_str)
-
-    # 5.2 Construcción Simbólica (AGREGADO: Necesario para evaluar)
-    pol_sym = coefs_fwd[0]
-    for j in range(1, n):
-        termino = coefs_fwd[j]
-        for k in range(j):
-            termino *= (x_sym - x_datos[k])
-        pol_sym += termino
+    print(polinomio_newton_texto(coefs_fwd, x_datos))
 
     # --- 6. Evaluación ---
     try:
@@ -112,9 +187,8 @@ def diferencias_divididas_formato_libro_corregido():
         if x_input:
             x_val = float(x_input)
             
-            # Evaluamos usando el polinomio simbólico creado en 5.2
-            f_eval = sp.lambdify(x_sym, pol_sym)
-            res_aprox = f_eval(x_val)
+            # Evaluamos la forma anidada directamente con los coeficientes
+            res_aprox = horner_newton(coefs_fwd, x_datos, x_val)
             
             print(f"\nResultado en x = {x_val}: {res_aprox:.6f}")
             
@@ -0,0 +1,61 @@
+import numpy as np
+
+# --- EVALUACIÓN NUMÉRICA EN FORMA ANIDADA (SIN SYMPY) ---
+# Construir el polinomio con SymPy, expandirlo y usar lambdify es lento con
+# muchos nodos y además pierde exactitud (la forma expandida cancela términos).
+# Aquí el polinomio se evalúa directamente a partir del vector de coeficientes,
+# con una multiplicación anidada por término, sobre escalares o arreglos.
+
+def horner_newton(coeficientes, nodos, x_val):
+    """
+    Forma de Newton con diferencias divididas c_k = f[x_0, ..., x_k]:
+        P(x) = c0 + (x-x0)(c1 + (x-x1)(c2 + ... + (x-x_{n-1})·c_n))
+    """
+    c = np.asarray(coeficientes, dtype=float)
+    xs = np.asarray(nodos, dtype=float)
+    x = np.asarray(x_val, dtype=float)
+
+    p = np.full_like(x, c[-1])
+    for k in range(len(c) - 2, -1, -1):
+        p = p * (x - xs[k]) + c[k]
+    return float(p) if p.ndim == 0 else p
+
+def horner_newton_gregory(diferencias, x_base, h, x_val, hacia_atras=False):
+    """
+    Newton-Gregory con diferencias finitas (sin dividir entre h):
+
+    Adelante (x_base = x0, diferencias Δ^k y0), s = (x - x0)/h:
+        P = Δ0 + s(Δ1 + (s-1)/2 (Δ2 + (s-2)/3 (Δ3 + ...)))
+    Atrás (x_base = xn, diferencias ∇^k yn), s = (x - xn)/h:
+        P = ∇0 + s(∇1 + (s+1)/2 (∇2 + (s+2)/3 (∇3 + ...)))
+    """
+    d = np.asarray(diferencias, dtype=float)
+    s = (np.asarray(x_val, dtype=float) - x_base) / h
+    signo = 1 if hacia_atras else -1
+
+    p = np.full_like(s, d[-1])
+    for k in range(len(d) - 1, 0, -1):
+        p = d[k - 1] + (s + signo * (k - 1)) / k * p
+    return float(p) if p.ndim == 0 else p
+
+def polinomio_newton_texto(coeficientes, nodos, decimales=7):
+    """Polinomio de Newton como texto (para imprimir, sin SymPy)."""
+    pol_str = f"{coeficientes[0]:.{decimales}f}"
+    for j in range(1, len(coeficientes)):
+        signo = " + " if coeficientes[j] >= 0 else " - "
+        terminos_x = "".join([f"(x - {nodos[k]})" for k in range(j)])
+        pol_str += f"{signo}{abs(coeficientes[j]):.{decimales}f}{terminos_x}"
+    return pol_str
+
+def horner_taylor(coeficientes, x0, x_val):
+    """
+    Polinomio de Taylor con a_k = f^(k)(x0)/k!:
+        P(x) = a0 + t(a1 + t(a2 + ... + t·a_n)),   t = x - x0
+    """
+    a = np.asarray(coeficientes, dtype=float)
+    t = np.asarray(x_val, dtype=float) - x0
+
+    p = np.full_like(t, a[-1])
+    for k in range(len(a) - 2, -1, -1):
+        p = p * t + a[k]
+    return float(p) if p.ndim == 0 else p
@@ -0,0 +1,177 @@
+import numpy as np
+from Metodo_Neville import metodo_neville, evaluar_funcion_usuario, solicitar_float
+
+# --- 1. LÓGICA MATEMÁTICA (LAGRANGE BARICÉNTRICO) ---
+class InterpoladorBaricentrico:
+    """
+    Forma baricéntrica de Lagrange:
+
+                 Σ w_j·y_j / (x - x_j)
+        P(x) = -------------------------      w_j = 1 / Π_{k≠j} (x_j - x_k)
+                 Σ w_j / (x - x_j)
+
+    Pesos: O(n²) UNA sola vez. Evaluación: O(n) por punto (vectorizada).
+    Agregar un nodo: O(n).
+    """
+
+    def __init__(self, x_points, y_points, tam_bloque=4096):
+        x = np.asarray(x_points, dtype=float)
+        y = np.asarray(y_points, dtype=float)
+        if len(x) != len(y):
+            raise ValueError("x e y deben tener la misma longitud")
+        if len(np.unique(x)) != len(x):
+            raise ValueError("¡Error! Puntos x repetidos.")
+
+        self.x = x
+        self.y = y
+        self.tam_bloque = tam_bloque
+        self.w = self._calcular_pesos()
+
+    def _calcular_pesos(self):
+        """
+        w_j en escala logarítmica (por bloques de filas) para que el
+        producto no se desborde con cientos o miles de nodos.
+        Los pesos sólo importan salvo un factor común: se normalizan a
+        max|w| = 1 y se guarda ese factor (en log) para agregar_nodo.
+        """
+        n = len(self.x)
+        log_w = np.empty(n)
+        signo = np.empty(n)
+        for i in range(0, n, self.tam_bloque):
+            D = self.x[i:i + self.tam_bloque, None] - self.x[None, :]
+            D[np.arange(len(D)), np.arange(i, i + len(D))] = 1.0
+            log_w[i:i + self.tam_bloque] = -np.sum(np.log(np.abs(D)), axis=1)
+            signo[i:i + self.tam_bloque] = np.prod(np.sign(D), axis=1)
+        self._escala_log = log_w.max()
+        return signo * np.exp(log_w - self._escala_log)
+
+    def agregar_nodo(self, x_nuevo, y_nuevo):
+        """Actualiza los pesos en O(n) al agregar (x_nuevo, y_nuevo)."""
+        if np.any(self.x == x_nuevo):
+            raise ValueError(f"¡Error! El nodo x={x_nuevo} ya existe.")
+        dif = self.x - x_nuevo
+        log_dif = np.log(np.abs(dif))
+        # Peso del nodo nuevo, en la misma escala que los pesos guardados
+        log_nuevo = -np.sum(log_dif) - self._escala_log
+        signo_nuevo = np.prod(np.sign(-dif))
+
+        # w_j <- w_j / (x_j - x_nuevo), todo en logaritmos y renormalizado
+        log_w = np.append(np.log(np.abs(self.w)) - log_dif, log_nuevo)
+        signo = np.append(np.sign(self.w) * np.sign(dif), signo_nuevo)
+        maximo = log_w.max()
+        self._escala_log += maximo
+        self.w = signo * np.exp(log_w - maximo)
+        self.x = np.append(self.x, x_nuevo)
+        self.y = np.append(self.y, y_nuevo)
+
+    def evaluar(self, x_val):
+        """Evalúa P en un escalar o en un arreglo de puntos."""
+        xq = np.asarray(x_val, dtype=float)
+        plano = xq.ravel()
+        resultado = np.empty_like(plano)
+
+        # Por bloques: memoria (bloque × n) acotada
+        for i in range(0, len(plano), self.tam_bloque):
+            q = plano[i:i + self.tam_bloque]
+            dif = q[:, None] - self.x[None, :]
+            exacto = dif == 0
+            dif[exacto] = 1.0
+            coef = self.w / dif
+            valores = (coef @ self.y) / coef.sum(axis=1)
+
+            # Si x coincide con un nodo, P(x_j) = y_j
+            fila, col = np.nonzero(exacto)
+            valores[fila] = self.y[col]
+            resultado[i:i + self.tam_bloque] = valores
+
+        return resultado.reshape(xq.shape) if xq.ndim else float(resultado[0])
+
+    __call__ = evaluar
+
+    def tabla_neville(self, x_val):
+        """Diagnóstico opcional: tabla completa de Neville en un punto."""
+        return metodo_neville(list(self.x), list(self.y), x_val, tabla=True)
+
+
+# --- 2. FUNCIÓN PRINCIPAL ---
+def main():
+    print("==========================================")
+    print("   INTERPOLACIÓN DE LAGRANGE BARICÉNTRICA ")
+    print("==========================================\n")
+
+    print("¿Cómo deseas ingresar los datos?")
+    print("  [1] MANUALMENTE (Ingresar pares x, y)")
+    print("  [2] POR FUNCIÓN (Ingresar f(x) y calcular y)")
+
+    modo = ""
+    while modo not in ["1", "2"]:
+        modo = input("Selecciona una opción (1 o 2): ")
+
+    funcion_str = None
+    if modo == "2":
+        print("\n>> Ingresa la función en términos de 'x' (ej: exp(x), x^2, sin(x)):")
+        while True:
+            funcion_str = input("   f(x) = ")
+            try:
+                evaluar_funcion_usuario(funcion_str, 1.0)
+                print("   ✅ Función válida.")
+                break
+            except Exception as e:
+                print(f"   ❌ Error en la sintaxis: {e}")
+
+    while True:
+        try:
+            n = int(input("\n¿Cuántos puntos (nodos) vas a usar? "))
+            if n >= 2: break
+            print("Se requieren al menos 2 puntos.")
+        except ValueError: pass
+
+    x_points = []
+    y_points = []
+    print(f"\n--- Ingreso de {n} Puntos ---")
+    for i in range(n):
+        xi = solicitar_float(f"   x[{i}]: ")
+        x_points.append(xi)
+        if modo == "1":
+            y_points.append(solicitar_float(f"   y[{i}]: "))
+        else:
+            yi = evaluar_funcion_usuario(funcion_str, xi)
+            y_points.append(yi)
+            print(f"   -> y[{i}] calculado: {yi:.6f}")
+
+    try:
+        interp = InterpoladorBaricentrico(x_points, y_points)
+    except ValueError as e:
+        print(f"\n❌ Ocurrió un error: {e}")
+        return
+
+    print("\n--- PESOS BARICÉNTRICOS (normalizados) ---")
+    for xi, wi in zip(interp.x, interp.w):
+        print(f"   x = {xi:<12.6f} w = {wi:.8e}")
+
+    # --- EVALUACIÓN EN MALLA ---
+    print("\n" + "-"*30)
+    a = solicitar_float("Evaluar desde x = ")
+    b = solicitar_float("hasta x = ")
+    m = int(solicitar_float("Número de puntos de evaluación: "))
+    xs = np.linspace(a, b, max(m, 1))
+    ps = interp(xs)
+
+    print(f"\n{'x':>14} | {'P(x)':>16}" + (f" | {'Error':>12}" if funcion_str else ""))
+    print("-" * (34 + (15 if funcion_str else 0)))
+    paso = max(1, len(xs) // 20)   # Solo se muestran ~20 filas
+    for xv, pv in zip(xs[::paso], ps[::paso]):
+        fila = f"{xv:>14.6f} | {pv:>16.8f}"
+        if funcion_str:
+            fila += f" | {abs(evaluar_funcion_usuario(funcion_str, xv) - pv):>12.4e}"
+        print(fila)
+
+    # --- DIAGNÓSTICO OPCIONAL ---
+    if input("\n¿Mostrar tabla de Neville en un punto? (s/n): ").lower() == 's':
+        x_val = solicitar_float("   x = ")
+        resultado, tabla = interp.tabla_neville(x_val)
+        print(f"\n   Neville: {resultado:.8f}   Baricéntrico: {interp(x_val):.8f}")
+        print(tabla)
+
+if __name__ == "__main__":
+    main()
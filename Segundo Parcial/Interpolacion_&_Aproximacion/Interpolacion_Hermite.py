@@ -0,0 +1,178 @@
+import numpy as np
+import sympy as sp
+from Metodo_Neville import evaluar_funcion_usuario, solicitar_float
+from Diferencias_Divididas import TablaDiferenciasDivididas
+from Spline_Cubico import SplineCubico
+from Evaluacion_Horner import polinomio_newton_texto
+
+# --- 1. PENDIENTES MONÓTONAS (PCHIP) ---
+def pendientes_pchip(x, y):
+    """
+    Pendientes de Fritsch-Carlson (forma de Brodlie): media armónica
+    ponderada de las pendientes secantes vecinas; 0 si cambian de signo
+    (extremo local).
+    Así el interpolante no se sale del rango de los datos en cada tramo.
+    """
+    h = np.diff(x)
+    delta = np.diff(y) / h
+    n = len(x)
+    d = np.zeros(n)
+    if n == 2:
+        d[:] = delta[0]
+        return d
+
+    # Interiores
+    w1 = 2 * h[1:] + h[:-1]
+    w2 = h[1:] + 2 * h[:-1]
+    mismo_signo = delta[:-1] * delta[1:] > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        armonica = (w1 + w2) / (w1 / delta[:-1] + w2 / delta[1:])
+    d[1:-1] = np.where(mismo_signo, armonica, 0.0)
+
+    # Extremos: fórmula de 3 puntos, recortada para conservar la forma
+    def extremo(h0, h1, d0, d1):
+        m = ((2 * h0 + h1) * d0 - h0 * d1) / (h0 + h1)
+        if np.sign(m) != np.sign(d0):
+            return 0.0
+        if np.sign(d0) != np.sign(d1) and abs(m) > 3 * abs(d0):
+            return 3 * d0
+        return m
+
+    d[0] = extremo(h[0], h[1], delta[0], delta[1])
+    d[-1] = extremo(h[-1], h[-2], delta[-1], delta[-2])
+    return d
+
+# --- 2. HERMITE CÚBICO POR TRAMOS ---
+class HermiteCubicoPorTramos(SplineCubico):
+    """
+    En cada tramo, el cúbico que interpola y_i, y_{i+1} y las pendientes
+    d_i, d_{i+1}:
+        S_i(x) = y_i + d_i t + c_i t² + e_i t³,   t = x - x_i
+        c_i = (3δ_i - 2d_i - d_{i+1}) / h_i,   e_i = (d_i + d_{i+1} - 2δ_i) / h_i²
+
+    Si no se dan pendientes se usan las de PCHIP (monótono).
+    La evaluación por bloques (searchsorted) se hereda de SplineCubico.
+    """
+
+    def __init__(self, x_points, y_points, pendientes=None, tam_bloque=1_000_000):
+        x = np.asarray(x_points, dtype=float)
+        y = np.asarray(y_points, dtype=float)
+        orden = np.argsort(x)
+        x, y = x[orden], y[orden]
+        if len(x) < 2:
+            raise ValueError("Se requieren al menos 2 puntos.")
+        if np.any(np.diff(x) == 0):
+            raise ValueError("¡Error! Puntos x repetidos.")
+
+        self.x = x
+        self.y = y
+        self.tam_bloque = tam_bloque
+        if pendientes is None:
+            self.tipo = "pchip"
+            self.d = pendientes_pchip(x, y)
+        else:
+            self.tipo = "hermite"
+            self.d = np.asarray(pendientes, dtype=float)[orden]
+
+        h = np.diff(x)
+        delta = np.diff(y) / h
+        d0, d1 = self.d[:-1], self.d[1:]
+        self.a = y[:-1]
+        self.b = d0
+        self.c = (3 * delta - 2 * d0 - d1) / h
+        self.e = (d0 + d1 - 2 * delta) / h**2
+        self._integral_acumulada()
+
+# --- 3. FUNCIÓN PRINCIPAL ---
+def main():
+    print("==========================================")
+    print("   INTERPOLACIÓN DE HERMITE Y PCHIP        ")
+    print("==========================================\n")
+
+    print("Método:")
+    print("  [1] HERMITE (un polinomio, nodos repetidos con f, f', f'', ...)")
+    print("  [2] HERMITE CÚBICO POR TRAMOS (f y f' en cada nodo)")
+    print("  [3] PCHIP (monótono, solo f)")
+    metodo = ""
+    while metodo not in ["1", "2", "3"]:
+        metodo = input("Selecciona una opción (1, 2 o 3): ")
+
+    funcion_str = input("\nf(x) para calcular los datos (Enter para ingresarlos a mano): ") or None
+
+    while True:
+        try:
+            n = int(input("\n¿Cuántos nodos distintos vas a usar? "))
+            if n >= 2: break
+            print("Se requieren al menos 2 puntos.")
+        except ValueError: pass
+
+    # Derivadas exactas (SymPy + lambdify) si se da f(x): sirven para cualquier orden.
+    # La expresión se interpreta una vez y cada orden se deriva y compila una vez.
+    if funcion_str:
+        x_sym = sp.symbols('x')
+        try:
+            f_sym = sp.sympify(funcion_str.replace("^", "**"), locals={'e': sp.E, 'ln': sp.log})
+        except (sp.SympifyError, TypeError) as e:
+            print(f"\n❌ Ocurrió un error: {e}")
+            return
+    derivadas = {}
+
+    def derivada(xi, orden):
+        if orden not in derivadas:
+            derivadas[orden] = sp.lambdify(x_sym, f_sym.diff(x_sym, orden), "numpy")
+        return float(derivadas[orden](xi))
+
+    x_points, valores = [], []
+    for i in range(n):
+        xi = solicitar_float(f"   x[{i}]: ")
+        x_points.append(xi)
+        if metodo == "3":
+            m = 0
+        elif metodo == "2":
+            m = 1
+        else:
+            m = solicitar_float(f"   ¿Cuántas derivadas conoces en x[{i}]? (0, 1, 2, ...): ")
+            while m < 0 or m != int(m):
+                m = solicitar_float("   ⚠️ Debe ser un entero >= 0: ")
+            m = int(m)
+        vals = []
+        for k in range(m + 1):
+            nombre = "f" + "'" * k
+            if funcion_str:
+                vals.append(evaluar_funcion_usuario(funcion_str, xi) if k == 0 else derivada(xi, k))
+                print(f"   -> {nombre}(x[{i}]) = {vals[-1]:.6f}")
+            else:
+                vals.append(solicitar_float(f"   {nombre}(x[{i}]): "))
+        valores.append(vals)
+
+    try:
+        if metodo == "1":
+            interp = TablaDiferenciasDivididas.hermite(x_points, valores)
+            print("\nPolinomio de Hermite (Newton con nodos repetidos):")
+            print(polinomio_newton_texto(interp.coeficientes, interp.nodos))
+        else:
+            pendientes = [v[1] for v in valores] if metodo == "2" else None
+            interp = HermiteCubicoPorTramos(x_points, [v[0] for v in valores], pendientes)
+            print(f"\n{'i':<4} | {'x_i':>10} | {'y_i':>12} | {'pendiente':>12}")
+            for i in range(len(interp.x)):
+                print(f"{i:<4} | {interp.x[i]:>10.4f} | {interp.y[i]:>12.6f} | {interp.d[i]:>12.6f}")
+    except ValueError as e:
+        print(f"\n❌ Ocurrió un error: {e}")
+        return
+
+    # --- EVALUACIÓN EN MALLA ---
+    a = solicitar_float("\nEvaluar desde x = ")
+    b = solicitar_float("hasta x = ")
+    m = max(int(solicitar_float("Número de puntos de evaluación: ")), 1)
+    xs = np.linspace(a, b, m)
+    ps = interp(xs)
+    print(f"\n{'x':>14} | {'P(x)':>16}" + (f" | {'Error':>12}" if funcion_str else ""))
+    paso = max(1, m // 20)   # Solo se muestran ~20 filas
+    for xv, pv in zip(xs[::paso], ps[::paso]):
+        fila = f"{xv:>14.6f} | {pv:>16.8f}"
+        if funcion_str:
+            fila += f" | {abs(evaluar_funcion_usuario(funcion_str, xv) - pv):>12.4e}"
+        print(fila)
+
+if __name__ == "__main__":
+    main()
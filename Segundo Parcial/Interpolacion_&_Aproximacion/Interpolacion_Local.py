@@ -0,0 +1,188 @@
+import numpy as np
+from Metodo_Neville import evaluar_funcion_usuario, solicitar_float
+
+# --- 1. CARGA DE LA TABLA (MEMORIA MAPEADA) ---
+def cargar_tabla(ruta_x, ruta_y=None):
+    """
+    Carga la tabla desde archivos .npy sin copiarla a RAM (mmap_mode='r').
+    - Dos archivos: ruta_x (x) y ruta_y (y).
+    - Un archivo de forma (N, 2): columnas x, y.
+    """
+    datos_x = np.load(ruta_x, mmap_mode='r')
+    if ruta_y is not None:
+        return datos_x, np.load(ruta_y, mmap_mode='r')
+    if datos_x.ndim != 2 or datos_x.shape[1] != 2:
+        raise ValueError("Se esperaba un arreglo de forma (N, 2) con columnas x, y.")
+    return datos_x[:, 0], datos_x[:, 1]
+
+def esta_ordenado(x, tam_bloque=1_000_000):
+    """Verifica x estrictamente creciente leyendo por bloques (no carga toda la tabla)."""
+    for i in range(0, len(x) - 1, tam_bloque):
+        bloque = np.asarray(x[i:i + tam_bloque + 1])
+        if np.any(np.diff(bloque) <= 0):
+            return False
+    return True
+
+# --- 2. INTERPOLACIÓN LOCAL ---
+class InterpoladorLocal:
+    """
+    Interpolación por tramos sobre tablas enormes (10^6 nodos o más).
+
+    Para cada punto x solo se usan los k = grado + 1 nodos más cercanos:
+      1. searchsorted (bisección vectorizada) ubica x en la tabla ordenada.
+      2. La ventana [ini, ini + k) se abre hacia el vecino más cercano, k pasos.
+      3. Se aplica Neville o Newton de grado 'grado' sobre cada ventana,
+         todas a la vez como matrices (puntos × k).
+    Costo por punto: O(log N + k²) en lugar de O(N²).
+    """
+
+    def __init__(self, x_datos, y_datos, grado=3, metodo="neville", tam_bloque=65536):
+        if len(x_datos) != len(y_datos):
+            raise ValueError("x e y deben tener la misma longitud")
+        if grado < 0 or grado + 1 > len(x_datos):
+            raise ValueError(f"El grado debe estar entre 0 y {len(x_datos) - 1}.")
+        if metodo not in ("neville", "newton"):
+            raise ValueError(f"Método desconocido: {metodo}")
+
+        # Los arreglos (incluidos los memmap) se conservan sin copiar; listas -> arreglo
+        x_datos = x_datos if isinstance(x_datos, np.ndarray) else np.asarray(x_datos, dtype=float)
+        y_datos = y_datos if isinstance(y_datos, np.ndarray) else np.asarray(y_datos, dtype=float)
+        if esta_ordenado(x_datos):
+            self.x, self.y = x_datos, y_datos
+        else:
+            orden = np.argsort(x_datos, kind='stable')
+            self.x = np.asarray(x_datos)[orden]
+            self.y = np.asarray(y_datos)[orden]
+            if np.any(np.diff(self.x) == 0):
+                raise ValueError("¡Error! Puntos x repetidos.")
+
+        self.grado = grado
+        self.metodo = metodo
+        self.tam_bloque = tam_bloque
+
+    def ventanas(self, xq):
+        """Índice inicial de la ventana de k nodos más cercanos a cada punto."""
+        N = len(self.x)
+        k = self.grado + 1
+        hi = np.searchsorted(self.x, xq)          # primer nodo > x (o = x)
+        lo = hi.copy()                            # ventana vacía [lo, hi)
+        for _ in range(k):
+            puede_izq = lo > 0
+            puede_der = hi < N
+            d_izq = np.where(puede_izq, xq - np.asarray(self.x[np.maximum(lo - 1, 0)]), np.inf)
+            d_der = np.where(puede_der, np.asarray(self.x[np.minimum(hi, N - 1)]) - xq, np.inf)
+            izquierda = d_izq <= d_der
+            lo = np.where(izquierda, lo - 1, lo)
+            hi = np.where(izquierda, hi, hi + 1)
+        return lo
+
+    def _neville(self, X, Y, q):
+        """Neville sobre ventanas (puntos × k); retorna valor y |Q[k-1,k-1] - Q[k-1,k-2]|."""
+        k = X.shape[1]
+        Q = Y.copy()
+        penultima = Q[:, -1].copy()
+        for j in range(1, k):
+            penultima = Q[:, -1].copy()
+            Q[:, j:] = ((q - X[:, :k-j]) * Q[:, j:] - (q - X[:, j:]) * Q[:, j-1:-1]) / (X[:, j:] - X[:, :k-j])
+        return Q[:, -1], np.abs(Q[:, -1] - penultima)
+
+    def _newton(self, X, Y, q):
+        """Diferencias divididas por ventana y evaluación anidada (Horner)."""
+        k = X.shape[1]
+        c = Y.copy()
+        for j in range(1, k):
+            c[:, j:] = (c[:, j:] - c[:, j-1:-1]) / (X[:, j:] - X[:, :k-j])
+        p = c[:, -1].copy()
+        for j in range(k - 2, -1, -1):
+            p = p * (q[:, 0] - X[:, j]) + c[:, j]
+        # Estimación del error: último término de Newton
+        ultimo = c[:, -1] * np.prod(q - X[:, :-1], axis=1)
+        return p, np.abs(ultimo)
+
+    def evaluar(self, x_val, devolver_error=False):
+        """Interpola en un escalar o en un arreglo de puntos (por bloques)."""
+        xq = np.asarray(x_val, dtype=float)
+        plano = xq.ravel()
+        valores = np.empty_like(plano)
+        errores = np.empty_like(plano)
+        offsets = np.arange(self.grado + 1)
+        interpolar = self._neville if self.metodo == "neville" else self._newton
+
+        for i in range(0, len(plano), self.tam_bloque):
+            q = plano[i:i + self.tam_bloque]
+            idx = self.ventanas(q)[:, None] + offsets
+            # Indexado avanzado: del memmap solo se leen las páginas necesarias
+            X = np.asarray(self.x[idx.ravel()], dtype=float).reshape(idx.shape)
+            Y = np.asarray(self.y[idx.ravel()], dtype=float).reshape(idx.shape)
+            valores[i:i + self.tam_bloque], errores[i:i + self.tam_bloque] = interpolar(X, Y, q[:, None])
+
+        if xq.ndim == 0:
+            valores, errores = float(valores[0]), float(errores[0])
+        else:
+            valores, errores = valores.reshape(xq.shape), errores.reshape(xq.shape)
+        return (valores, errores) if devolver_error else valores
+
+    __call__ = evaluar
+
+# --- 3. FUNCIÓN PRINCIPAL ---
+def main():
+    print("==========================================")
+    print("   INTERPOLACIÓN LOCAL EN TABLAS GRANDES   ")
+    print("==========================================\n")
+
+    print("¿De dónde vienen los datos?")
+    print("  [1] ARCHIVOS .npy (x.npy y y.npy, o uno solo de forma (N, 2))")
+    print("  [2] GENERAR TABLA desde f(x) (N nodos equiespaciados)")
+    modo = ""
+    while modo not in ["1", "2"]:
+        modo = input("Selecciona una opción (1 o 2): ")
+
+    funcion_str = None
+    try:
+        if modo == "1":
+            ruta_x = input("   Ruta del archivo x (o de la tabla (N, 2)): ")
+            ruta_y = input("   Ruta del archivo y (Enter si es una sola tabla): ") or None
+            x_datos, y_datos = cargar_tabla(ruta_x, ruta_y)
+        else:
+            funcion_str = input("   f(x) = ")
+            a = solicitar_float("   Desde x = ")
+            b = solicitar_float("   Hasta x = ")
+            N = int(solicitar_float("   Número de nodos N: "))
+            x_datos = np.linspace(a, b, N)
+            y_datos = np.broadcast_to(evaluar_funcion_usuario(funcion_str, x_datos), x_datos.shape)
+    except Exception as e:
+        print(f"\n❌ Ocurrió un error: {e}")
+        return
+
+    grado = int(solicitar_float("\nGrado del polinomio local (ej. 3): "))
+    metodo = "newton" if input("Método [1] Neville  [2] Newton: ") == "2" else "neville"
+
+    try:
+        interp = InterpoladorLocal(x_datos, y_datos, grado, metodo)
+    except ValueError as e:
+        print(f"\n❌ Ocurrió un error: {e}")
+        return
+    print(f"   Tabla de {len(interp.x)} nodos en [{interp.x[0]}, {interp.x[-1]}]")
+
+    while True:
+        x_input = input("\n¿Qué valor de 'x' deseas interpolar? (Enter para salir): ")
+        if not x_input:
+            break
+        try:
+            x_val = float(x_input)
+        except ValueError:
+            print("⚠️ Entrada inválida.")
+            continue
+
+        valor, error = interp.evaluar(x_val, devolver_error=True)
+        ini = int(interp.ventanas(np.array([x_val]))[0])
+        print(f"   Nodos usados: índices {ini} a {ini + grado}  "
+              f"(x de {interp.x[ini]:.6f} a {interp.x[ini + grado]:.6f})")
+        print(f"   P({x_val}) = {valor:.10f}")
+        print(f"   Error estimado: {error:.4e}")
+        if funcion_str:
+            real = evaluar_funcion_usuario(funcion_str, x_val)
+            print(f"   Error Real: {abs(real - valor):.4e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+import numpy as np
+import sympy as sp
+from concurrent.futures import ThreadPoolExecutor
+
+# --- 1. LÓGICA MATEMÁTICA (MALLA REGULAR f(x, y)) ---
+class InterpoladorMalla:
+    """
+    Interpolación en una malla Z[i, j] = f(x_i, y_j) (como las mallas que
+    muestrean trapecio_doble / simpson_doble).
+
+    'bilineal': en la celda [x_i, x_i+1] × [y_j, y_j+1], con t, u ∈ [0, 1]:
+        f ≈ (1-t)(1-u) Z00 + t(1-u) Z10 + (1-t)u Z01 + t·u Z11
+    'bicubico': Hermite bicúbico con f, f_x, f_y, f_xy en las 4 esquinas
+        (derivadas por diferencias finitas con np.gradient), C¹ entre celdas.
+    La celda de cada punto se ubica con searchsorted (todo vectorizado).
+    """
+
+    def __init__(self, x_nodos, y_nodos, Z, metodo="bilineal"):
+        self.x = np.asarray(x_nodos, dtype=float)
+        self.y = np.asarray(y_nodos, dtype=float)
+        self.Z = np.asarray(Z, dtype=float)
+        if self.Z.shape != (len(self.x), len(self.y)):
+            raise ValueError(f"Z debe tener forma ({len(self.x)}, {len(self.y)}).")
+        if np.any(np.diff(self.x) <= 0) or np.any(np.diff(self.y) <= 0):
+            raise ValueError("Los nodos x e y deben ser estrictamente crecientes.")
+        if metodo not in ("bilineal", "bicubico"):
+            raise ValueError(f"Método desconocido: {metodo}")
+        if metodo == "bicubico" and (len(self.x) < 3 or len(self.y) < 3):
+            raise ValueError("El método bicúbico requiere al menos 3 nodos por eje.")
+
+        self.metodo = metodo
+        if metodo == "bicubico":
+            self.Zx = np.gradient(self.Z, self.x, axis=0, edge_order=2)
+            self.Zy = np.gradient(self.Z, self.y, axis=1, edge_order=2)
+            self.Zxy = np.gradient(self.Zx, self.y, axis=1, edge_order=2)
+
+    @classmethod
+    def desde_funcion(cls, f_num, x0, xn, y0, yn, n, m, metodo="bilineal"):
+        """Muestrea f(x, y) en una malla de (n+1) × (m+1) nodos."""
+        xs = np.linspace(x0, xn, n + 1)
+        ys = np.linspace(y0, yn, m + 1)
+        X, Y = np.meshgrid(xs, ys, indexing="ij")
+        Z = np.broadcast_to(f_num(X, Y), X.shape)
+        return cls(xs, ys, Z, metodo)
+
+    @staticmethod
+    def _celda(nodos, valores):
+        i = np.clip(np.searchsorted(nodos, valores, side='right') - 1, 0, len(nodos) - 2)
+        h = nodos[i + 1] - nodos[i]
+        return i, (valores - nodos[i]) / h, h
+
+    def _evaluar_bloque(self, xq, yq):
+        i, t, hx = self._celda(self.x, xq)
+        j, u, hy = self._celda(self.y, yq)
+        Z = self.Z
+        if self.metodo == "bilineal":
+            return ((1 - t) * (1 - u) * Z[i, j] + t * (1 - u) * Z[i + 1, j]
+                    + (1 - t) * u * Z[i, j + 1] + t * u * Z[i + 1, j + 1])
+
+        # Bases de Hermite cúbicas en cada eje
+        t2, t3, u2, u3 = t * t, t**3, u * u, u**3
+        bx = [2*t3 - 3*t2 + 1, -2*t3 + 3*t2, (t3 - 2*t2 + t) * hx, (t3 - t2) * hx]
+        by = [2*u3 - 3*u2 + 1, -2*u3 + 3*u2, (u3 - 2*u2 + u) * hy, (u3 - u2) * hy]
+        resultado = np.zeros_like(t)
+        for a, di in ((0, 0), (1, 1)):
+            for b, dj in ((0, 0), (1, 1)):
+                ii, jj = i + di, j + dj
+                resultado += (bx[a] * by[b] * Z[ii, jj] + bx[a + 2] * by[b] * self.Zx[ii, jj]
+                              + bx[a] * by[b + 2] * self.Zy[ii, jj] + bx[a + 2] * by[b + 2] * self.Zxy[ii, jj])
+        return resultado
+
+    def evaluar(self, x_val, y_val, tam_bloque=1_000_000, trabajadores=1):
+        """Evalúa en escalares o arreglos (mismo tamaño), por bloques independientes."""
+        xq, yq = np.broadcast_arrays(np.asarray(x_val, dtype=float), np.asarray(y_val, dtype=float))
+        px, py = xq.ravel(), yq.ravel()
+        rangos = [(k, k + tam_bloque) for k in range(0, len(px), tam_bloque)]
+        tarea = lambda r: self._evaluar_bloque(px[r[0]:r[1]], py[r[0]:r[1]])
+        if trabajadores > 1:
+            with ThreadPoolExecutor(max_workers=trabajadores) as ejecutor:
+                partes = list(ejecutor.map(tarea, rangos))
+        else:
+            partes = [tarea(r) for r in rangos]
+        salida = np.concatenate(partes) if partes else np.empty(0)
+        return salida.reshape(xq.shape) if xq.ndim else float(salida[0])
+
+    __call__ = evaluar
+
+# --- 2. FUNCIÓN PRINCIPAL ---
+def main():
+    print("==========================================")
+    print("   INTERPOLACIÓN EN MALLA f(x, y)          ")
+    print("==========================================\n")
+
+    x, y = sp.symbols('x y')
+    try:
+        f_str = input("Introduce la función f(x, y) (ej: sin(x)*exp(-y)): ")
+        expr = sp.sympify(f_str.replace("^", "**"))
+        f_num = sp.lambdify((x, y), expr, "numpy")
+        x0 = float(input("x0: ")); xn = float(input("xn: "))
+        y0 = float(input("y0: ")); yn = float(input("yn: "))
+        n = int(input("Subintervalos en x (n): "))
+        m = int(input("Subintervalos en y (m): "))
+    except Exception as e:
+        print(f"Error: {e}")
+        return
+
+    interpoladores = {}
+    for metodo in ("bilineal", "bicubico"):
+        try:
+            interpoladores[metodo] = InterpoladorMalla.desde_funcion(f_num, x0, xn, y0, yn, n, m, metodo)
+        except ValueError as e:
+            print(f"   {metodo}: {e}")
+
+    # Error máximo sobre una malla fina de prueba
+    xf, yf = np.meshgrid(np.linspace(x0, xn, 401), np.linspace(y0, yn, 401), indexing="ij")
+    real = np.broadcast_to(f_num(xf, yf), xf.shape)
+    print(f"\n{'Método':<10} | {'Error máx. (malla 401×401)':>28}")
+    for metodo, interp in interpoladores.items():
+        print(f"{metodo:<10} | {np.max(np.abs(interp(xf, yf) - real)):>28.6e}")
+
+    while True:
+        entrada = input("\nPunto (x, y) a evaluar (Enter para salir): ")
+        if not entrada:
+            break
+        try:
+            xv, yv = (float(v) for v in entrada.split(","))
+        except ValueError:
+            print("⚠️ Entrada inválida. Usa el formato: 0.5, 1.2")
+            continue
+        exacto = float(f_num(xv, yv))
+        for metodo, interp in interpoladores.items():
+            valor = interp(xv, yv)
+            print(f"   {metodo:<9}: {valor:.10f}   (error {abs(valor - exacto):.3e})")
+
+if __name__ == "__main__":
+    main()
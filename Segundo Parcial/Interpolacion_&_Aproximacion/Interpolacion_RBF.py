@@ -0,0 +1,204 @@
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+# --- 1. ÁRBOL KD (VECINOS MÁS CERCANOS, SIN SCIPY) ---
+class ArbolKD:
+    """
+    Árbol k-d con hojas de hasta 'tam_hoja' puntos.
+
+    La búsqueda de k vecinos se hace para un LOTE de consultas a la vez:
+    en cada nodo el lote se parte según el lado del plano de corte, se
+    visita primero el hijo cercano y luego el lejano, pero solo con las
+    consultas cuya esfera (distancia al k-ésimo vecino actual) cruza el plano.
+    En las hojas las distancias se calculan como matriz (consultas × hoja).
+    """
+
+    def __init__(self, puntos, tam_hoja=32):
+        self.puntos = np.asarray(puntos, dtype=float)
+        if self.puntos.ndim != 2:
+            raise ValueError("Los puntos deben tener forma (N, d).")
+        self.tam_hoja = tam_hoja
+        self.indices = np.arange(len(self.puntos))
+        # Nodo: [dim, corte, izq, der, inicio, fin]; dim = -1 en las hojas
+        self.nodos = []
+        self._construir(0, len(self.puntos))
+
+    def _construir(self, inicio, fin):
+        id_nodo = len(self.nodos)
+        self.nodos.append([-1, 0.0, -1, -1, inicio, fin])
+        if fin - inicio <= self.tam_hoja:
+            return id_nodo
+
+        bloque = self.puntos[self.indices[inicio:fin]]
+        dim = int(np.argmax(bloque.max(axis=0) - bloque.min(axis=0)))
+        medio = (fin - inicio) // 2
+        orden = np.argpartition(bloque[:, dim], medio)
+        self.indices[inicio:fin] = self.indices[inicio:fin][orden]
+        corte = self.puntos[self.indices[inicio + medio], dim]
+
+        izq = self._construir(inicio, inicio + medio)
+        der = self._construir(inicio + medio, fin)
+        self.nodos[id_nodo][:4] = [dim, corte, izq, der]
+        return id_nodo
+
+    def consultar(self, consultas, k):
+        """Retorna (distancias, indices), cada uno de forma (m, k), ordenados."""
+        q = np.asarray(consultas, dtype=float)
+        m = len(q)
+        k = min(k, len(self.puntos))
+        mejores_d2 = np.full((m, k), np.inf)
+        mejores_i = np.full((m, k), -1)
+        self._visitar(0, q, np.arange(m), mejores_d2, mejores_i)
+
+        orden = np.argsort(mejores_d2, axis=1)
+        fila = np.arange(m)[:, None]
+        return np.sqrt(mejores_d2[fila, orden]), mejores_i[fila, orden]
+
+    def _visitar(self, id_nodo, q, sel, mejores_d2, mejores_i):
+        if len(sel) == 0:
+            return
+        dim, corte, izq, der, inicio, fin = self.nodos[id_nodo]
+
+        if dim < 0:
+            idx = self.indices[inicio:fin]
+            d2 = np.sum((q[sel, None, :] - self.puntos[None, idx, :])**2, axis=2)
+            todos_d2 = np.concatenate([mejores_d2[sel], d2], axis=1)
+            todos_i = np.concatenate([mejores_i[sel], np.broadcast_to(idx, d2.shape)], axis=1)
+            k = mejores_d2.shape[1]
+            elegidos = np.argpartition(todos_d2, k - 1, axis=1)[:, :k]
+            fila = np.arange(len(sel))[:, None]
+            mejores_d2[sel] = todos_d2[fila, elegidos]
+            mejores_i[sel] = todos_i[fila, elegidos]
+            return
+
+        diferencia = q[sel, dim] - corte
+        for cercano, lejano, lado in ((izq, der, diferencia < 0), (der, izq, diferencia >= 0)):
+            grupo = sel[lado]
+            self._visitar(cercano, q, grupo, mejores_d2, mejores_i)
+            # Solo cruzan el plano las consultas con esfera que lo alcanza
+            cruza = diferencia[lado]**2 < mejores_d2[grupo].max(axis=1)
+            self._visitar(lejano, q, grupo[cruza], mejores_d2, mejores_i)
+
+# --- 2. FUNCIONES DE BASE RADIAL ---
+NUCLEOS = {
+    "cubica": lambda r, eps: r**3,
+    "placa_delgada": lambda r, eps: np.where(r > 0, r**2 * np.log(np.where(r > 0, r, 1.0)), 0.0),
+    "multicuadrica": lambda r, eps: np.sqrt(1 + (eps * r)**2),
+    "gaussiana": lambda r, eps: np.exp(-(eps * r)**2),
+}
+
+# --- 3. RBF LOCAL ---
+class InterpoladorRBF:
+    """
+    Interpolación RBF con vecindarios locales (2D o 3D, datos dispersos).
+
+    Para cada consulta q se toman sus k vecinos x_j (árbol k-d) y se resuelve
+    el sistema pequeño
+        [ Φ   P ] [λ]   [y]
+        [ Pᵀ  0 ] [μ] = [0],   Φ_ij = φ(|x_i - x_j|),  P = [1, x - q]
+    s(q) = Σ λ_j φ(|q - x_j|) + μ_0.
+    Todos los sistemas de un bloque se resuelven juntos (np.linalg.solve
+    sobre una pila (bloque, k+d+1, k+d+1)); los bloques son independientes
+    y pueden repartirse entre hilos.
+    """
+
+    def __init__(self, puntos, valores, vecinos=20, nucleo="cubica", epsilon=1.0, tam_hoja=32):
+        self.puntos = np.asarray(puntos, dtype=float)
+        self.valores = np.asarray(valores, dtype=float)
+        if len(self.puntos) != len(self.valores):
+            raise ValueError("Puntos y valores deben tener la misma longitud.")
+        if nucleo not in NUCLEOS:
+            raise ValueError(f"Núcleo desconocido: {nucleo}. Opciones: {list(NUCLEOS)}")
+        self.dim = self.puntos.shape[1]
+        self.vecinos = min(vecinos, len(self.puntos))
+        if self.vecinos < self.dim + 1:
+            raise ValueError(f"Se requieren al menos {self.dim + 1} vecinos.")
+        self.phi = NUCLEOS[nucleo]
+        self.epsilon = epsilon
+        self.arbol = ArbolKD(self.puntos, tam_hoja)
+
+    def _evaluar_bloque(self, q):
+        _, idx = self.arbol.consultar(q, self.vecinos)
+        k, d = self.vecinos, self.dim
+        # Coordenadas locales (centradas en q y escaladas) para el condicionamiento
+        X = self.puntos[idx] - q[:, None, :]
+        escala = np.max(np.abs(X), axis=(1, 2))[:, None, None]
+        escala[escala == 0] = 1.0
+        X = X / escala
+
+        r = np.linalg.norm(X[:, :, None, :] - X[:, None, :, :], axis=3)
+        A = np.zeros((len(q), k + d + 1, k + d + 1))
+        A[:, :k, :k] = self.phi(r, self.epsilon * escala)
+        A[:, :k, k] = 1.0
+        A[:, :k, k+1:] = X
+        A[:, k, :k] = 1.0
+        A[:, k+1:, :k] = np.transpose(X, (0, 2, 1))
+
+        b = np.zeros((len(q), k + d + 1))
+        b[:, :k] = self.valores[idx]
+        coef = np.linalg.solve(A, b[..., None])[..., 0]
+
+        # En coordenadas locales q = 0: s(q) = Σ λ_j φ(|x_j|) + μ_0
+        r_q = np.linalg.norm(X, axis=2)
+        return np.sum(coef[:, :k] * self.phi(r_q, self.epsilon * escala[:, :, 0]), axis=1) + coef[:, k]
+
+    def evaluar(self, consultas, tam_bloque=2048, trabajadores=1):
+        """Evalúa en un arreglo (m, d) de consultas, por bloques (en paralelo si trabajadores > 1)."""
+        q = np.atleast_2d(np.asarray(consultas, dtype=float))
+        bloques = [q[i:i + tam_bloque] for i in range(0, len(q), tam_bloque)]
+        if trabajadores > 1:
+            # NumPy libera el GIL en el álgebra lineal: los hilos sí trabajan en paralelo
+            with ThreadPoolExecutor(max_workers=trabajadores) as ejecutor:
+                partes = list(ejecutor.map(self._evaluar_bloque, bloques))
+        else:
+            partes = [self._evaluar_bloque(b) for b in bloques]
+        return np.concatenate(partes) if partes else np.empty(0)
+
+    __call__ = evaluar
+
+# --- 4. FUNCIÓN PRINCIPAL ---
+def main():
+    print("==========================================")
+    print("   INTERPOLACIÓN DISPERSA (RBF + ÁRBOL KD) ")
+    print("==========================================\n")
+
+    try:
+        dim = int(input("Dimensión (2 o 3): "))
+        if dim not in (2, 3):
+            raise ValueError("La dimensión debe ser 2 o 3.")
+        ruta = input("Archivo .npy/.csv con columnas (x, y[, z], valor) (Enter = datos de prueba): ")
+        if ruta:
+            datos = np.load(ruta) if ruta.endswith(".npy") else np.loadtxt(ruta, delimiter=",")
+            puntos, valores = datos[:, :dim], datos[:, dim]
+        else:
+            N = int(input("Número de puntos aleatorios (ej. 20000): "))
+            puntos = np.random.default_rng(0).uniform(-1, 1, (N, dim))
+            valores = np.sin(np.pi * puntos[:, 0]) * np.cos(np.pi * puntos[:, 1])
+            print("   Datos de prueba: f = sin(πx)·cos(πy) en [-1, 1]^d")
+
+        vecinos = int(input("Vecinos por consulta (Enter = 20): ") or 20)
+        print(f"Núcleos disponibles: {', '.join(NUCLEOS)}")
+        nucleo = input("Núcleo (Enter = cubica): ") or "cubica"
+        interp = InterpoladorRBF(puntos, valores, vecinos, nucleo)
+    except Exception as e:
+        print(f"\n❌ Ocurrió un error: {e}")
+        return
+
+    while True:
+        entrada = input(f"\nPunto a evaluar ({dim} valores separados por coma, Enter para salir): ")
+        if not entrada:
+            break
+        try:
+            q = np.array([float(v) for v in entrada.split(",")])
+            if len(q) != dim:
+                raise ValueError(f"Se esperaban {dim} coordenadas.")
+        except ValueError as e:
+            print(f"⚠️ {e}")
+            continue
+        valor = interp(q[None, :])[0]
+        print(f"   s({', '.join(f'{v:g}' for v in q)}) = {valor:.10f}")
+        if not ruta:
+            print(f"   Error Real: {abs(np.sin(np.pi*q[0])*np.cos(np.pi*q[1]) - valor):.4e}")
+
+if __name__ == "__main__":
+    main()
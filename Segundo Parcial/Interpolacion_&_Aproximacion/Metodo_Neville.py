@@ -1,11 +1,13 @@
 import numpy as np
+import sympy as sp
 import pandas as pd
 import math
 
 # --- 1. LÓGICA MATEMÁTICA (NEVILLE) ---
-def metodo_neville(x_points, y_points, x_val):
+def metodo_neville(x_points, y_points, x_val, tabla=False):
     """
-    Algoritmo de Neville. Retorna el valor aproximado y la tabla.
+    Algoritmo de Neville. Retorna el valor aproximado.
+    Con tabla=True retorna (valor, tabla) con la tabla en un DataFrame.
     """
     n = len(x_points)
     # Inicializamos matriz con ceros
@@ -30,27 +32,118 @@ def metodo_neville(x_points, y_points, x_val):
 
     resultado = Q[n-1][n-1]
     
-    # Formato visual con Pandas
-    columnas = [f"Grado {k}" for k in range(n)]
+    if tabla:
+        return resultado, formatear_tabla_neville(Q, x_points)
+    return resultado
+
+def formatear_tabla_neville(Q, x_points):
+    """Formato visual con Pandas (opcional, sólo para mostrar)."""
+    columnas = [f"Grado {k}" for k in range(len(x_points))]
     df_tabla = pd.DataFrame(Q, columns=columnas, index=x_points)
     df_tabla.replace(0, np.nan, inplace=True) # Limpieza visual
-    
-    return resultado, df_tabla
+    return df_tabla
+
+def metodo_neville_vectorizado(x_points, y_points, x_vals, tam_bloque=65536, devolver_tablas=False):
+    """
+    Neville para MUCHOS puntos a la vez.
+    Cada columna se actualiza como un arreglo (puntos × n) en una sola operación:
+        Q[:, i] <- ((x - x_{i-j})·Q[:, i] - (x - x_i)·Q[:, i-1]) / (x_i - x_{i-j})
+    Retorna (valores, error_estimado) con error = |Q[n-1][n-1] - Q[n-1][n-2]|.
+    Con devolver_tablas=True también retorna las tablas completas (puntos × n × n).
+    """
+    xs = np.asarray(x_points, dtype=float)
+    ys = np.asarray(y_points, dtype=float)
+    n = len(xs)
+    if len(np.unique(xs)) != n:
+        raise ValueError("¡Error! Puntos x repetidos o división por cero.")
+
+    xq = np.asarray(x_vals, dtype=float)
+    plano = xq.ravel()
+    valores = np.empty_like(plano)
+    errores = np.zeros_like(plano)
+    tablas = np.zeros((len(plano), n, n)) if devolver_tablas else None
+
+    for b in range(0, len(plano), tam_bloque):
+        X = plano[b:b + tam_bloque, None]
+        Q = np.tile(ys, (len(X), 1))          # Columna 0 = Valores de y
+        if devolver_tablas:
+            tablas[b:b + tam_bloque, :, 0] = Q
+
+        for j in range(1, n):
+            # El lado derecho usa la columna anterior completa antes de asignar
+            penultima = Q[:, -1].copy()
+            Q[:, j:] = ((X - xs[:n-j]) * Q[:, j:] - (X - xs[j:]) * Q[:, j-1:-1]) / (xs[j:] - xs[:n-j])
+            if devolver_tablas:
+                tablas[b:b + tam_bloque, j:, j] = Q[:, j:]
+
+        valores[b:b + tam_bloque] = Q[:, -1]
+        if n > 1:
+            errores[b:b + tam_bloque] = np.abs(Q[:, -1] - penultima)
+
+    if xq.ndim == 0:
+        resultado = (float(valores[0]), float(errores[0]))
+    else:
+        resultado = (valores.reshape(xq.shape), errores.reshape(xq.shape))
+    return resultado + (tablas,) if devolver_tablas else resultado
 
 # --- 2. CÁLCULO DE COTA DE ERROR ---
+#   |f(x) - P(x)| <= max|f^(n+1)| / (n+1)! · |(x-x0)(x-x1)...(x-xn)|
 def calcular_cota_error(x_points, x_val, max_derivada):
-    n_grado = len(x_points) - 1
-    
-    # Producto |(x-x0)(x-x1)...|
-    producto_distancias = 1
-    for xi in x_points:
-        producto_distancias *= (x_val - xi)
-    producto_distancias = abs(producto_distancias)
-    
+    """Cota teórica en un punto o en un arreglo de puntos (producto vectorizado)."""
+    xs = np.asarray(x_points, dtype=float)
+    xq = np.asarray(x_val, dtype=float)
+    n_grado = len(xs) - 1
+
+    # Producto |(x-x0)(x-x1)...| para todos los puntos a la vez
+    producto_distancias = np.prod(np.abs(xq[..., None] - xs), axis=-1)
+
     factorial = math.factorial(n_grado + 1)
     error = (max_derivada / factorial) * producto_distancias
-    
-    return error
+
+    return float(error) if error.ndim == 0 else error
+
+def estimar_max_derivada(funcion_str, orden, a, b, m=20001):
+    """
+    max |f^(orden)(x)| en [a, b]: la derivada se calcula UNA vez con SymPy,
+    se compila con lambdify y se muestrea en una malla densa; después se
+    refina alrededor del máximo encontrado.
+    """
+    x = sp.symbols('x')
+    f = sp.sympify(funcion_str.replace("^", "**"), locals={'e': sp.E})
+    derivada = sp.lambdify(x, f.diff(x, orden), "numpy")
+
+    def muestrear(xs):
+        return np.abs(np.broadcast_to(derivada(xs), xs.shape).astype(float))
+
+    xs = np.linspace(a, b, m)
+    valores = muestrear(xs)
+    i = int(np.nanargmax(valores))
+    paso = (b - a) / (m - 1) if m > 1 else 0.0
+    fino = np.linspace(max(a, xs[i] - paso), min(b, xs[i] + paso), 1001)
+    return float(max(valores[i], np.nanmax(muestrear(fino))))
+
+def curva_cota_error(x_points, funcion_str, m=2001, max_derivada=None):
+    """
+    Curva de la cota sobre todo el intervalo de los nodos.
+    Retorna (xs, cotas, max_derivada).
+    """
+    xs_nodos = np.asarray(x_points, dtype=float)
+    a, b = xs_nodos.min(), xs_nodos.max()
+    if max_derivada is None:
+        max_derivada = estimar_max_derivada(funcion_str, len(xs_nodos), a, b)
+    xs = np.linspace(a, b, m)
+    return xs, calcular_cota_error(xs_nodos, xs, max_derivada), max_derivada
+
+def cota_maxima_por_nodos(funcion_str, a, b, lista_n, m=2001):
+    """
+    Para elegir cuántos nodos usar: max de la cota en [a, b] con n nodos
+    equiespaciados, para cada n de lista_n. Retorna {n: cota_maxima}.
+    """
+    resultado = {}
+    for n in lista_n:
+        _, cotas, _ = curva_cota_error(np.linspace(a, b, n), funcion_str, m)
+        resultado[n] = float(cotas.max())
+    return resultado
 
 # --- 3. UTILIDADES DE ENTRADA ---
 def evaluar_funcion_usuario(funcion_str, x):
@@ -135,7 +228,7 @@ def main():
     x_val = solicitar_float("¿Qué valor de 'x' deseas interpolar? ")
 
     try:
-        resultado, tabla = metodo_neville(x_points, y_points, x_val)
+        resultado, tabla = metodo_neville(x_points, y_points, x_val, tabla=True)
         
         print("\n" + "="*45)
         print(f" RESULTADO FINAL: P({x_val}) ≈ {resultado:.8f}")
@@ -160,16 +253,37 @@ def main():
             print(f"Valor Real: {valor_real:.8f}")
             print(f"Error Real: {error_abs:.8e}")
 
-        # 2. Cota de Error Teórica (Opcional)
+        # 2. Evaluación en malla (vectorizada, opcional)
+        print("\n" + "-"*30)
+        if input("¿Evaluar en una malla de puntos? (s/n): ").lower() == 's':
+            a = solicitar_float("   Desde x = ")
+            b = solicitar_float("   Hasta x = ")
+            m = max(int(solicitar_float("   Número de puntos: ")), 1)
+            xs = np.linspace(a, b, m)
+            valores, errores = metodo_neville_vectorizado(x_points, y_points, xs)
+            paso = max(1, m // 20)   # Solo se muestran ~20 filas
+            print(f"\n   {'x':>12} | {'P(x)':>16} | {'Error est.':>12}")
+            for xv, pv, ev in zip(xs[::paso], valores[::paso], errores[::paso]):
+                print(f"   {xv:>12.6f} | {pv:>16.8f} | {ev:>12.4e}")
+
+        # 3. Cota de Error Teórica (Opcional)
         print("\n" + "-"*30)
         if input("¿Calcular COTA de Error Teórica? (s/n): ").lower() == 's':
             grado = n - 1
-            print(f"\nℹ️ Requerido: Máximo de la derivada orden {grado+1} en el intervalo.")
-            max_derivada = solicitar_float(f"   Ingresa máx |f^({grado+1})(x)|: ")
-            
+            if modo == "2":
+                # El intervalo debe incluir x_val (si se extrapola queda fuera de los nodos)
+                a_cota, b_cota = min(x_points + [x_val]), max(x_points + [x_val])
+                max_derivada = estimar_max_derivada(funcion_str, grado + 1, a_cota, b_cota)
+                print(f"\nℹ️ máx |f^({grado+1})(x)| en [{a_cota}, {b_cota}] (muestreo denso): {max_derivada:.8e}")
+            else:
+                print(f"\nℹ️ Requerido: Máximo de la derivada orden {grado+1} en el intervalo.")
+                max_derivada = solicitar_float(f"   Ingresa máx |f^({grado+1})(x)|: ")
+
             cota = calcular_cota_error(x_points, x_val, max_derivada)
             print(f"   >>> Cota Teórica: {cota:.8e}")
-            
+            xs, cotas, _ = curva_cota_error(x_points, funcion_str, max_derivada=max_derivada)
+            print(f"   >>> Cota máxima en [{xs[0]}, {xs[-1]}]: {cotas.max():.8e} (en x = {xs[np.argmax(cotas)]:.6f})")
+
             if valor_real is not None:
                 if error_abs <= cota:
                     print("   ✅ El error real respeta la cota teórica.")
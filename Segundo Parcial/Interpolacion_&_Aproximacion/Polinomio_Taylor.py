@@ -1,4 +1,6 @@
 import sympy as sp
+from Series_Taylor import coeficientes_taylor, polinomio_taylor_simbolico
+from Evaluacion_Horner import horner_taylor
 
 def main():
     print("=== CALCULADORA DE POLINOMIO DE TAYLOR ===")
@@ -24,41 +26,41 @@ def main():
         return
 
     # 3. Construcción del Polinomio
-    polinomio = 0
+    # Todos los coeficientes f^(k)(x0)/k! salen en una sola pasada con
+    # aritmética de series truncadas (sin calcular f.diff(x, k) para cada k).
     print(f"\n--- Construyendo el polinomio alrededor de x0 = {x0} ---")
-    
-    for k in range(n + 1):
-        # Calcular derivada k-ésima
-        derivada = f.diff(x, k)
-        
-        # Evaluar la derivada en x0
-        derivada_en_x0 = derivada.subs(x, x0)
-        
-        # Crear el término: (f^(k)(x0) / k!) * (x - x0)^k
-        termino = (derivada_en_x0 / sp.factorial(k)) * (x - x0)**k
-        
-        # Sumar al polinomio total
-        polinomio += termino
+    try:
+        coeficientes, metodo = coeficientes_taylor(f, x, x0, n)
+    except (ValueError, TypeError, ZeroDivisionError) as e:
+        print(f"\nError: la función no tiene serie de Taylor real en x0 = {x0} ({e}).")
+        return
+    print(f"Coeficientes obtenidos por: {metodo}")
 
     # 4. Mostrar Resultados
     print("\n" + "="*40)
     print(f"POLINOMIO RESULTANTE (Grado {n}):")
-    # sp.pprint muestra la ecuación en formato 'bonito'
-    sp.pprint(polinomio)
+    if n <= 15:
+        # sp.pprint muestra la ecuación en formato 'bonito'
+        sp.pprint(polinomio_taylor_simbolico(coeficientes, x, x0))
+    else:
+        for k in list(range(6)) + ["..."] + list(range(n - 2, n + 1)):
+            if k == "...":
+                print("   ...")
+            else:
+                print(f"   a_{k:<4} = {coeficientes[k]: .12e}")
     print("="*40)
 
-    # 5. Evaluación Numérica
-    # Sustituimos la 'x' del polinomio por el valor que dio el usuario
-    resultado_aprox = polinomio.subs(x, val_aprox)
-    
+    # 5. Evaluación Numérica (Horner, sin sustituir en el polinomio simbólico)
+    resultado_aprox = horner_taylor(coeficientes, x0, val_aprox)
+
     # Calculamos el valor real para comparar
-    valor_real = f.subs(x, val_aprox)
+    valor_real = float(f.subs(x, val_aprox).evalf())
     error = abs(valor_real - resultado_aprox)
 
     print(f"\nRESULTADOS DE LA APROXIMACIÓN PARA x = {val_aprox}:")
-    print(f"Valor aproximado (Taylor): {float(resultado_aprox):.6f}")
-    print(f"Valor real (Exacto):       {float(valor_real):.6f}")
-    print(f"Error absoluto:            {float(error):.6f}")
+    print(f"Valor aproximado (Taylor): {resultado_aprox:.6f}")
+    print(f"Valor real (Exacto):       {valor_real:.6f}")
+    print(f"Error absoluto:            {error:.6e}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
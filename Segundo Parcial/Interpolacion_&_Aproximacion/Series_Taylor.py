@@ -0,0 +1,238 @@
+import math
+import numpy as np
+import sympy as sp
+
+# --- 1. ARITMÉTICA DE SERIES TRUNCADAS ---
+# Una serie u(x) = Σ_{k=0}^{n} a_k (x - x0)^k se guarda como el vector a.
+# Cada operación (producto, cociente, exp, log, sin, ...) produce los n+1
+# coeficientes del resultado con una recurrencia de O(n²), sin derivar
+# expresiones simbólicas: el costo NO crece con el tamaño de f^(k)(x).
+
+class SerieTaylor:
+    def __init__(self, coeficientes):
+        self.c = np.asarray(coeficientes, dtype=float)
+
+    @property
+    def n(self):
+        return len(self.c) - 1
+
+    @classmethod
+    def constante(cls, valor, n):
+        c = np.zeros(n + 1)
+        c[0] = valor
+        return cls(c)
+
+    @classmethod
+    def variable(cls, x0, n):
+        """La serie de x alrededor de x0: x0 + 1·(x - x0)."""
+        c = np.zeros(n + 1)
+        c[0] = x0
+        if n >= 1:
+            c[1] = 1.0
+        return cls(c)
+
+    def _como_serie(self, otro):
+        return otro if isinstance(otro, SerieTaylor) else SerieTaylor.constante(otro, self.n)
+
+    def __add__(self, otro):
+        return SerieTaylor(self.c + self._como_serie(otro).c)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return SerieTaylor(-self.c)
+
+    def __sub__(self, otro):
+        return SerieTaylor(self.c - self._como_serie(otro).c)
+
+    def __rsub__(self, otro):
+        return SerieTaylor(self._como_serie(otro).c - self.c)
+
+    def __mul__(self, otro):
+        if not isinstance(otro, SerieTaylor):
+            return SerieTaylor(self.c * otro)
+        return SerieTaylor(np.convolve(self.c, otro.c)[:self.n + 1])
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, otro):
+        if not isinstance(otro, SerieTaylor):
+            return SerieTaylor(self.c / otro)
+        a, b = self.c, otro.c
+        if b[0] == 0:
+            raise ZeroDivisionError("El denominador se anula en x0 (no hay serie de Taylor).")
+        q = np.zeros(self.n + 1)
+        for k in range(self.n + 1):
+            q[k] = (a[k] - np.dot(b[1:k+1], q[k-1::-1] if k else [])) / b[0]
+        return SerieTaylor(q)
+
+    def __rtruediv__(self, otro):
+        return self._como_serie(otro) / self
+
+    def __pow__(self, p):
+        if isinstance(p, SerieTaylor):
+            # u^v = exp(v·log u)
+            return exp(p * log(self))
+        if float(p).is_integer() and p >= 0:
+            return self._potencia_entera(int(p))
+        if float(p).is_integer():
+            return 1 / self._potencia_entera(-int(p))
+        a = self.c
+        if a[0] <= 0:
+            raise ValueError("Potencia no entera de una base ≤ 0 en x0.")
+        # w = u^p  ->  a0·k·w_k = Σ_{j=1}^{k} ((p+1)j - k) a_j w_{k-j}
+        w = np.zeros(self.n + 1)
+        w[0] = a[0] ** p
+        for k in range(1, self.n + 1):
+            j = np.arange(1, k + 1)
+            w[k] = np.dot(((p + 1) * j - k) * a[1:k+1], w[k-1::-1]) / (k * a[0])
+        return SerieTaylor(w)
+
+    def _potencia_entera(self, p):
+        resultado = SerieTaylor.constante(1.0, self.n)
+        base = self
+        while p:
+            if p & 1:
+                resultado = resultado * base
+            base = base * base
+            p >>= 1
+        return resultado
+
+    def derivada(self):
+        k = np.arange(1, self.n + 1)
+        return SerieTaylor(np.append(k * self.c[1:], 0.0))
+
+    def integral(self, constante=0.0):
+        k = np.arange(1, self.n + 1)
+        return SerieTaylor(np.concatenate([[constante], self.c[:-1] / k]))
+
+# --- 2. FUNCIONES ELEMENTALES SOBRE SERIES ---
+def exp(u):
+    """e = exp(u)  ->  k·e_k = Σ_{j=1}^{k} j a_j e_{k-j}."""
+    a, n = u.c, u.n
+    e = np.zeros(n + 1)
+    e[0] = math.exp(a[0])
+    for k in range(1, n + 1):
+        j = np.arange(1, k + 1)
+        e[k] = np.dot(j * a[1:k+1], e[k-1::-1]) / k
+    return SerieTaylor(e)
+
+def log(u):
+    """l = log(u)  ->  a0·l_k = a_k - (1/k) Σ_{j=1}^{k-1} j l_j a_{k-j}."""
+    a, n = u.c, u.n
+    if a[0] <= 0:
+        raise ValueError("log de un valor ≤ 0 en x0.")
+    l = np.zeros(n + 1)
+    l[0] = math.log(a[0])
+    for k in range(1, n + 1):
+        j = np.arange(1, k)
+        l[k] = (a[k] - np.dot(j * l[1:k], a[k-1:0:-1]) / k) / a[0]
+    return SerieTaylor(l)
+
+def _sen_cos(u, hiperbolico=False):
+    """s = sin(u), c = cos(u) a la vez: k·s_k = Σ j a_j c_{k-j}, k·c_k = ∓Σ j a_j s_{k-j}."""
+    a, n = u.c, u.n
+    s = np.zeros(n + 1)
+    c = np.zeros(n + 1)
+    signo = 1.0 if hiperbolico else -1.0
+    s[0] = math.sinh(a[0]) if hiperbolico else math.sin(a[0])
+    c[0] = math.cosh(a[0]) if hiperbolico else math.cos(a[0])
+    for k in range(1, n + 1):
+        ja = np.arange(1, k + 1) * a[1:k+1]
+        s[k] = np.dot(ja, c[k-1::-1]) / k
+        c[k] = signo * np.dot(ja, s[k-1::-1]) / k
+    return SerieTaylor(s), SerieTaylor(c)
+
+def sin(u):
+    return _sen_cos(u)[0]
+
+def cos(u):
+    return _sen_cos(u)[1]
+
+def tan(u):
+    s, c = _sen_cos(u)
+    return s / c
+
+def sinh(u):
+    return _sen_cos(u, hiperbolico=True)[0]
+
+def cosh(u):
+    return _sen_cos(u, hiperbolico=True)[1]
+
+def tanh(u):
+    s, c = _sen_cos(u, hiperbolico=True)
+    return s / c
+
+def sqrt(u):
+    return u ** 0.5
+
+def atan(u):
+    """atan(u) = ∫ u' / (1 + u²)."""
+    return (u.derivada() / (1 + u * u)).integral(math.atan(u.c[0]))
+
+def asin(u):
+    return (u.derivada() / sqrt(1 - u * u)).integral(math.asin(u.c[0]))
+
+def acos(u):
+    return (-u.derivada() / sqrt(1 - u * u)).integral(math.acos(u.c[0]))
+
+FUNCIONES_SERIE = {
+    sp.exp: exp, sp.log: log, sp.sin: sin, sp.cos: cos, sp.tan: tan,
+    sp.sinh: sinh, sp.cosh: cosh, sp.tanh: tanh,
+    sp.atan: atan, sp.asin: asin, sp.acos: acos,
+}
+
+# --- 3. MOTOR DE COEFICIENTES ---
+def serie_desde_sympy(expr, x, x0, n):
+    """Recorre el árbol de SymPy y lo evalúa con aritmética de series."""
+    if expr == x:
+        return SerieTaylor.variable(x0, n)
+    if expr.is_Number or expr.is_NumberSymbol or not expr.has(x):
+        return SerieTaylor.constante(float(expr), n)
+    if expr.is_Add:
+        resultado = SerieTaylor.constante(0.0, n)
+        for arg in expr.args:
+            resultado = resultado + serie_desde_sympy(arg, x, x0, n)
+        return resultado
+    if expr.is_Mul:
+        resultado = SerieTaylor.constante(1.0, n)
+        for arg in expr.args:
+            resultado = resultado * serie_desde_sympy(arg, x, x0, n)
+        return resultado
+    if expr.is_Pow:
+        base, exponente = expr.args
+        if exponente.has(x):
+            return serie_desde_sympy(base, x, x0, n) ** serie_desde_sympy(exponente, x, x0, n)
+        return serie_desde_sympy(base, x, x0, n) ** float(exponente)
+    if expr.func in FUNCIONES_SERIE:
+        return FUNCIONES_SERIE[expr.func](serie_desde_sympy(expr.args[0], x, x0, n))
+    raise NotImplementedError(f"Función sin regla de series: {expr.func}")
+
+def coeficientes_derivando(f, x, x0, n):
+    """
+    Respaldo: deriva la derivada ANTERIOR (no f desde cero) y evalúa en x0.
+    Sirve para funciones sin regla de series; el costo crece con la expresión.
+    """
+    coeficientes = np.zeros(n + 1)
+    derivada = f
+    factorial = 1.0
+    for k in range(n + 1):
+        if k:
+            derivada = derivada.diff(x)
+            factorial *= k
+        coeficientes[k] = float(derivada.subs(x, x0).evalf()) / factorial
+    return coeficientes
+
+def coeficientes_taylor(f, x, x0, n):
+    """
+    Coeficientes a_k = f^(k)(x0) / k!, k = 0..n, en una sola pasada.
+    Devuelve (coeficientes, metodo) con metodo 'series' o 'derivadas'.
+    """
+    try:
+        return serie_desde_sympy(f, x, float(x0), n).c, 'series'
+    except (NotImplementedError, TypeError):
+        return coeficientes_derivando(f, x, x0, n), 'derivadas'
+
+def polinomio_taylor_simbolico(coeficientes, x, x0):
+    """Polinomio Σ a_k (x - x0)^k con SymPy (solo para mostrarlo)."""
+    return sum(sp.Float(ak, 10) * (x - x0)**k for k, ak in enumerate(coeficientes) if ak != 0)
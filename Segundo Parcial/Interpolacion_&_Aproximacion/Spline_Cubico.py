@@ -0,0 +1,235 @@
+import numpy as np
+from Metodo_Neville import evaluar_funcion_usuario, solicitar_float
+
+# --- 1. SISTEMA TRIDIAGONAL (THOMAS, O(n)) ---
+def resolver_tridiagonal(a, b, c, d):
+    """
+    Resuelve el sistema tridiagonal con subdiagonal a, diagonal b,
+    superdiagonal c y lado derecho d (a[0] y c[-1] no se usan).
+    """
+    n = len(b)
+    cp = np.empty(n)
+    dp = np.empty(n)
+    cp[0] = c[0] / b[0] if n > 1 else 0.0
+    dp[0] = d[0] / b[0]
+    for i in range(1, n):
+        den = b[i] - a[i] * cp[i-1]
+        cp[i] = c[i] / den if i < n - 1 else 0.0
+        dp[i] = (d[i] - a[i] * dp[i-1]) / den
+
+    x = np.empty(n)
+    x[-1] = dp[-1]
+    for i in range(n - 2, -1, -1):
+        x[i] = dp[i] - cp[i] * x[i+1]
+    return x
+
+# --- 2. SPLINE CÚBICO ---
+class SplineCubico:
+    """
+    Spline cúbico S(x) con momentos M_i = S''(x_i).
+
+    Ecuación interior (continuidad de S'):
+        h_{i-1} M_{i-1} + 2(h_{i-1} + h_i) M_i + h_i M_{i+1} = 6(d_i - d_{i-1})
+    Fronteras:
+        'natural':  M_0 = M_n = 0
+        'sujeto':   S'(x_0) = df_a, S'(x_n) = df_b   (clamped)
+        'no_nodo':  S''' continua en x_1 y x_{n-1}    (not-a-knot)
+
+    En cada tramo: S_i(x) = a_i + b_i t + c_i t² + e_i t³, t = x - x_i.
+    """
+
+    def __init__(self, x_points, y_points, tipo="natural", df_a=None, df_b=None, tam_bloque=1_000_000):
+        x = np.asarray(x_points, dtype=float)
+        y = np.asarray(y_points, dtype=float)
+        orden = np.argsort(x)
+        x, y = x[orden], y[orden]
+        if len(x) < 2:
+            raise ValueError("Se requieren al menos 2 puntos.")
+        if np.any(np.diff(x) == 0):
+            raise ValueError("¡Error! Puntos x repetidos.")
+        if tipo == "sujeto" and (df_a is None or df_b is None):
+            raise ValueError("El spline sujeto requiere f'(a) y f'(b).")
+        if tipo == "no_nodo" and len(x) < 4:
+            raise ValueError("El spline 'no nodo' requiere al menos 4 puntos.")
+        if tipo not in ("natural", "sujeto", "no_nodo"):
+            raise ValueError(f"Tipo de spline desconocido: {tipo}")
+
+        self.x = x
+        self.y = y
+        self.tipo = tipo
+        self.tam_bloque = tam_bloque
+        self.M = self._momentos(df_a, df_b)
+        self._coeficientes()
+
+    def _momentos(self, df_a, df_b):
+        x, y = self.x, self.y
+        n = len(x) - 1
+        h = np.diff(x)
+        d = np.diff(y) / h
+        M = np.zeros(n + 1)
+        if n == 1 and self.tipo == "natural":
+            return M
+
+        # Filas interiores i = 1..n-1
+        a = np.concatenate([[0.0], h[1:-1]])
+        b = 2 * (h[:-1] + h[1:])
+        c = np.concatenate([h[1:], [0.0]])
+        r = 6 * (d[1:] - d[:-1])
+
+        if self.tipo == "natural":
+            M[1:n] = resolver_tridiagonal(a, b, c, r)
+
+        elif self.tipo == "sujeto":
+            # Sistema completo para M_0..M_n
+            a = np.concatenate([[0.0], h])
+            b = np.concatenate([[2 * h[0]], 2 * (h[:-1] + h[1:]), [2 * h[-1]]])
+            c = np.concatenate([h, [0.0]])
+            r = np.concatenate([[6 * (d[0] - df_a)], r, [6 * (df_b - d[-1])]])
+            M[:] = resolver_tridiagonal(a, b, c, r)
+
+        else:
+            # No nodo: M_0 = ((h0+h1) M_1 - h0 M_2) / h1 (y análogo al final);
+            # se sustituye en la primera/última fila para conservar la forma tridiagonal.
+            h0, h1 = h[0], h[1]
+            b[0] = 2 * (h0 + h1) + h0 * (h0 + h1) / h1
+            c[0] = h1 - h0**2 / h1
+            hn1, hn2 = h[-1], h[-2]
+            b[-1] = 2 * (hn2 + hn1) + hn1 * (hn2 + hn1) / hn2
+            a[-1] = hn2 - hn1**2 / hn2
+            M[1:n] = resolver_tridiagonal(a, b, c, r)
+            M[0] = ((h0 + h1) * M[1] - h0 * M[2]) / h1
+            M[n] = ((hn2 + hn1) * M[n-1] - hn1 * M[n-2]) / hn2
+        return M
+
+    def _coeficientes(self):
+        h = np.diff(self.x)
+        M = self.M
+        self.a = self.y[:-1]
+        self.b = np.diff(self.y) / h - h * (2 * M[:-1] + M[1:]) / 6
+        self.c = M[:-1] / 2
+        self.e = np.diff(M) / (6 * h)
+        self._integral_acumulada()
+
+    def _integral_acumulada(self):
+        """Integral acumulada hasta el inicio de cada tramo."""
+        h = np.diff(self.x)
+        tramo = h * (self.a + h * (self.b / 2 + h * (self.c / 3 + h * self.e / 4)))
+        self.integral_acum = np.concatenate([[0.0], np.cumsum(tramo)])
+
+    def _tramos(self, xq):
+        """Búsqueda binaria vectorizada del tramo de cada punto (extrapola en los extremos)."""
+        idx = np.searchsorted(self.x, xq, side='right') - 1
+        return np.clip(idx, 0, len(self.x) - 2)
+
+    def _por_bloques(self, x_val, funcion):
+        xq = np.asarray(x_val, dtype=float)
+        plano = xq.ravel()
+        salida = np.empty_like(plano)
+        for i in range(0, len(plano), self.tam_bloque):
+            q = plano[i:i + self.tam_bloque]
+            k = self._tramos(q)
+            salida[i:i + self.tam_bloque] = funcion(k, q - self.x[k])
+        return salida.reshape(xq.shape) if xq.ndim else float(salida[0])
+
+    def evaluar(self, x_val, derivada=0):
+        """S(x) o su derivada (0 a 3) en escalares o arreglos."""
+        def f(k, t):
+            a, b, c, e = self.a[k], self.b[k], self.c[k], self.e[k]
+            if derivada == 0:
+                return a + t * (b + t * (c + t * e))
+            if derivada == 1:
+                return b + t * (2 * c + 3 * t * e)
+            if derivada == 2:
+                return 2 * c + 6 * t * e
+            if derivada == 3:
+                return 6 * e
+            return np.zeros_like(t)
+        return self._por_bloques(x_val, f)
+
+    __call__ = evaluar
+
+    def primitiva(self, x_val):
+        """F(x) = ∫_{x_0}^{x} S(t) dt."""
+        def f(k, t):
+            return self.integral_acum[k] + t * (self.a[k] + t * (self.b[k] / 2 + t * (self.c[k] / 3 + t * self.e[k] / 4)))
+        return self._por_bloques(x_val, f)
+
+    def integrar(self, a, b):
+        """∫_a^b S(x) dx (a y b pueden ser arreglos)."""
+        return self.primitiva(b) - self.primitiva(a)
+
+# --- 3. FUNCIÓN PRINCIPAL ---
+def main():
+    print("==========================================")
+    print("        INTERPOLACIÓN CON SPLINE CÚBICO    ")
+    print("==========================================\n")
+
+    print("¿Cómo deseas ingresar los datos?")
+    print("  [1] MANUALMENTE (Ingresar pares x, y)")
+    print("  [2] POR FUNCIÓN (Ingresar f(x) y calcular y)")
+    modo = ""
+    while modo not in ["1", "2"]:
+        modo = input("Selecciona una opción (1 o 2): ")
+
+    funcion_str = None
+    if modo == "2":
+        while True:
+            funcion_str = input("   f(x) = ")
+            try:
+                evaluar_funcion_usuario(funcion_str, 1.0)
+                break
+            except Exception as e:
+                print(f"   ❌ Error en la sintaxis: {e}")
+
+    while True:
+        try:
+            n = int(input("\n¿Cuántos puntos (nodos) vas a usar? "))
+            if n >= 2: break
+            print("Se requieren al menos 2 puntos.")
+        except ValueError: pass
+
+    x_points, y_points = [], []
+    for i in range(n):
+        xi = solicitar_float(f"   x[{i}]: ")
+        x_points.append(xi)
+        if modo == "1":
+            y_points.append(solicitar_float(f"   y[{i}]: "))
+        else:
+            y_points.append(evaluar_funcion_usuario(funcion_str, xi))
+
+    print("\nTipo de spline:")
+    print("  [1] Natural   (S'' = 0 en los extremos)")
+    print("  [2] Sujeto    (f'(a) y f'(b) conocidas)")
+    print("  [3] No nodo   (not-a-knot)")
+    tipo = {"1": "natural", "2": "sujeto", "3": "no_nodo"}.get(input("Opción: "), "natural")
+    df_a = df_b = None
+    if tipo == "sujeto":
+        df_a = solicitar_float("   f'(a) = ")
+        df_b = solicitar_float("   f'(b) = ")
+
+    try:
+        spline = SplineCubico(x_points, y_points, tipo, df_a, df_b)
+    except ValueError as e:
+        print(f"\n❌ Ocurrió un error: {e}")
+        return
+
+    print("\n" + "="*78)
+    print(f" COEFICIENTES: S_i(x) = a + b(x-x_i) + c(x-x_i)² + d(x-x_i)³  ({tipo})")
+    print("="*78)
+    print(f"{'i':<4} | {'[x_i, x_i+1]':<22} | {'a':>11} | {'b':>11} | {'c':>11} | {'d':>11}")
+    for i in range(len(spline.a)):
+        tramo = f"[{spline.x[i]:.4f}, {spline.x[i+1]:.4f}]"
+        print(f"{i:<4} | {tramo:<22} | {spline.a[i]:>11.6f} | {spline.b[i]:>11.6f} | {spline.c[i]:>11.6f} | {spline.e[i]:>11.6f}")
+
+    x_val = solicitar_float("\n¿Qué valor de 'x' deseas interpolar? ")
+    print(f"   S({x_val})   = {spline(x_val):.8f}")
+    print(f"   S'({x_val})  = {spline(x_val, 1):.8f}")
+    print(f"   S''({x_val}) = {spline(x_val, 2):.8f}")
+    if funcion_str:
+        real = evaluar_funcion_usuario(funcion_str, x_val)
+        print(f"   Error Real: {abs(real - spline(x_val)):.8e}")
+
+    print(f"\n∫ S(x) dx en [{spline.x[0]}, {spline.x[-1]}] = {spline.integrar(spline.x[0], spline.x[-1]):.8f}")
+
+if __name__ == "__main__":
+    main()